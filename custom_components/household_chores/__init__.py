@@ -7,28 +7,36 @@ import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME, EVENT_STATE_CHANGED, STATE_OFF
+from homeassistant.const import CONF_NAME, EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED, STATE_OFF
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 
 from .board import HouseholdBoardStore
 from .const import (
+    CONF_AUTO_ASSIGN,
     CONF_CHORES,
     CONF_MEMBERS,
     CONF_REFRESH_HOUR,
     CONF_REFRESH_MINUTE,
     CONF_REFRESH_WEEKDAY,
+    CONF_RETENTION_DAYS,
+    CONF_SAVE_DELAY,
+    DEFAULT_AUTO_ASSIGN,
     DEFAULT_CHORES,
     DEFAULT_MEMBERS,
     DEFAULT_NAME,
     DEFAULT_REFRESH_HOUR,
     DEFAULT_REFRESH_MINUTE,
     DEFAULT_REFRESH_WEEKDAY,
+    DEFAULT_RETENTION_DAYS,
+    DEFAULT_SAVE_DELAY,
     DOMAIN,
     PLATFORMS,
+    SIGNAL_BOARD_UPDATED,
 )
 from .coordinator import HouseholdChoresCoordinator
 from .frontend import async_register_card
+from .scheduler import TimerWheel, next_local_time
 from .services import async_register as async_register_services
 from .websocket_api import async_register as async_register_ws
 
@@ -41,6 +49,8 @@ async def async_setup(hass: HomeAssistant, _config: dict[str, Any]) -> bool:
     domain_data.setdefault("logger", _LOGGER)
     domain_data.setdefault("boards", {})
     domain_data.setdefault("entry_unsubs", {})
+    if "timers" not in domain_data:
+        domain_data["timers"] = TimerWheel(hass)
     domain_data.setdefault("restart_watcher_unsub", None)
     domain_data.setdefault("restart_pending", False)
     if not domain_data.get("ws_registered"):
@@ -146,6 +156,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     domain_data.setdefault("logger", _LOGGER)
     domain_data.setdefault("boards", {})
     domain_data.setdefault("entry_unsubs", {})
+    if "timers" not in domain_data:
+        domain_data["timers"] = TimerWheel(hass)
     domain_data.setdefault("restart_watcher_unsub", None)
     domain_data.setdefault("restart_pending", False)
     if not domain_data.get("ws_registered"):
@@ -173,6 +185,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.options.get(CONF_REFRESH_MINUTE, entry.data.get(CONF_REFRESH_MINUTE, DEFAULT_REFRESH_MINUTE)),
         DEFAULT_REFRESH_MINUTE,
     )
+    save_delay = _as_int(
+        entry.options.get(CONF_SAVE_DELAY, entry.data.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)),
+        DEFAULT_SAVE_DELAY,
+    )
+    retention_days = _as_int(
+        entry.options.get(CONF_RETENTION_DAYS, entry.data.get(CONF_RETENTION_DAYS, DEFAULT_RETENTION_DAYS)),
+        DEFAULT_RETENTION_DAYS,
+    )
+    auto_assign = bool(entry.options.get(CONF_AUTO_ASSIGN, entry.data.get(CONF_AUTO_ASSIGN, DEFAULT_AUTO_ASSIGN)))
 
     board_store = HouseholdBoardStore(
         hass,
@@ -184,6 +205,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         refresh_minute=refresh_minute,
         cleanup_hour=3,
         cleanup_minute=0,
+        save_delay=save_delay,
+        retention_days=retention_days,
+        auto_assign=auto_assign,
     )
     await board_store.async_load()
     domain_data["boards"][entry.entry_id] = board_store
@@ -199,25 +223,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     domain_data[entry.entry_id] = coordinator
 
-    async def _async_weekly_refresh(now) -> None:
-        settings = await board_store.async_settings()
-        weekly = settings.get("weekly_refresh", {})
-        refresh_weekday_live = _as_int(weekly.get("weekday"), refresh_weekday)
-        refresh_hour_live = _as_int(weekly.get("hour"), refresh_hour)
-        refresh_minute_live = _as_int(weekly.get("minute"), refresh_minute)
-        if now.weekday() != refresh_weekday_live:
-            return
-        if now.hour != refresh_hour_live or now.minute != refresh_minute_live:
-            return
-        refreshed = await board_store.async_weekly_refresh()
-        _LOGGER.info("Weekly refresh rebuilt %s tasks for entry %s", refreshed, entry.entry_id)
+    timers: TimerWheel = domain_data["timers"]
+    entry_id = entry.entry_id
+    scheduled_refresh = {"time": board_store.weekly_refresh_time}
 
-    weekly_unsub = async_track_time_change(
-        hass,
-        _async_weekly_refresh,
-        second=0,
+    async def _async_weekly_refresh(_now) -> None:
+        refreshed = await board_store.async_weekly_refresh()
+        _LOGGER.info("Weekly refresh rebuilt %s tasks for entry %s", refreshed, entry_id)
+
+    async def _async_day_rollover(_now) -> None:
+        # Sensors derive "today" and "next up" from the clock; push them a fresh view at midnight.
+        board_store.invalidate_stats()
+        async_dispatcher_send(hass, f"{SIGNAL_BOARD_UPDATED}_{entry_id}")
+
+    async def _async_nightly_cleanup(_now) -> None:
+        report = await board_store.async_nightly_maintenance()
+        _LOGGER.debug("Nightly maintenance for entry %s: %s", entry_id, report)
+
+    def _next_weekly_refresh(now):
+        weekday, hour, minute = board_store.weekly_refresh_time
+        return next_local_time(now, hour, minute, weekday)
+
+    timers.async_schedule((entry_id, "weekly_refresh"), _async_weekly_refresh, _next_weekly_refresh)
+    timers.async_schedule((entry_id, "day_rollover"), _async_day_rollover, lambda now: next_local_time(now, 0, 0))
+    timers.async_schedule(
+        (entry_id, "nightly_cleanup"),
+        _async_nightly_cleanup,
+        lambda now: next_local_time(now, *board_store.cleanup_time),
     )
-    domain_data["entry_unsubs"][entry.entry_id] = [weekly_unsub]
+
+    @callback
+    def _handle_board_updated() -> None:
+        if board_store.weekly_refresh_time != scheduled_refresh["time"]:
+            scheduled_refresh["time"] = board_store.weekly_refresh_time
+            timers.async_reschedule((entry_id, "weekly_refresh"))
+
+    @callback
+    def _cancel_timers() -> None:
+        timers.async_cancel_entry(entry_id)
+
+    settings_unsub = async_dispatcher_connect(hass, f"{SIGNAL_BOARD_UPDATED}_{entry_id}", _handle_board_updated)
+
+    async def _async_flush_on_stop(_event) -> None:
+        await board_store.async_flush()
+
+    stop_unsub = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_on_stop)
+    domain_data["entry_unsubs"][entry.entry_id] = [settings_unsub, _cancel_timers, stop_unsub]
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
@@ -231,7 +282,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         for unsub in hass.data[DOMAIN].get("entry_unsubs", {}).pop(entry.entry_id, []):
             unsub()
-        hass.data[DOMAIN]["boards"].pop(entry.entry_id, None)
+        board_store = hass.data[DOMAIN]["boards"].pop(entry.entry_id, None)
+        if board_store is not None:
+            await board_store.async_flush()
         hass.data[DOMAIN].pop(entry.entry_id, None)
         if not hass.data[DOMAIN].get("boards"):
             restart_unsub = hass.data[DOMAIN].pop("restart_watcher_unsub", None)
@@ -0,0 +1,370 @@
+"""Append-only archive of completed tasks, partitioned by ISO week."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any
+
+from homeassistant.helpers.storage import Store
+
+ARCHIVE_VERSION = 1
+# Seconds the pending-completion index waits before it is written.
+ARCHIVE_SAVE_DELAY = 10
+MAX_ARCHIVE_WEEKS = 520
+
+# Day ordinals are stored as ints; 0 marks an unknown due date.
+_NO_DAY = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Completion:
+    """One completed task as it is archived."""
+
+    task_id: str
+    title: str
+    assignees: tuple[str, ...]
+    due: date | None
+    completed: date
+    fixed: bool
+
+    @property
+    def week(self) -> str:
+        """Monday iso date of the partition the completion belongs to."""
+        day = self.due or self.completed
+        return (day - timedelta(days=day.weekday())).isoformat()
+
+
+class ArchiveWeek:
+    """Completions of one ISO week held as parallel array columns.
+
+    Titles and person ids are dictionary-encoded per week. Assignees are kept
+    in CSR form: the people of row ``i`` are
+    ``assignee[assignee_start[i]:assignee_start[i + 1]]``.
+    """
+
+    __slots__ = (
+        "week",
+        "task_ids",
+        "titles",
+        "people",
+        "title",
+        "assignee_start",
+        "assignee",
+        "due",
+        "completed",
+        "fixed",
+        "_title_codes",
+        "_person_codes",
+    )
+
+    def __init__(self, week: str) -> None:
+        self.week = week
+        self.task_ids: list[str] = []
+        self.titles: list[str] = []
+        self.people: list[str] = []
+        self.title = array("I")
+        self.assignee_start = array("I", [0])
+        self.assignee = array("H")
+        self.due = array("i")
+        self.completed = array("i")
+        self.fixed = array("b")
+        self._title_codes: dict[str, int] = {}
+        self._person_codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+    @classmethod
+    def from_dict(cls, week: str, raw: Any) -> ArchiveWeek:
+        """Rebuild a week from its stored form; malformed files load as empty."""
+        archived = cls(week)
+        if not isinstance(raw, dict):
+            return archived
+        try:
+            archived.task_ids = [str(task_id) for task_id in raw["task_ids"]]
+            archived.titles = [str(title) for title in raw["titles"]]
+            archived.people = [str(person_id) for person_id in raw["people"]]
+            archived.title = array("I", raw["title"])
+            archived.assignee_start = array("I", raw["assignee_start"])
+            archived.assignee = array("H", raw["assignee"])
+            archived.due = array("i", raw["due"])
+            archived.completed = array("i", raw["completed"])
+            archived.fixed = array("b", raw["fixed"])
+        except (KeyError, TypeError, ValueError, OverflowError):
+            return cls(week)
+        rows = len(archived.task_ids)
+        if not (
+            len(archived.title) == len(archived.due) == len(archived.completed) == len(archived.fixed) == rows
+            and len(archived.assignee_start) == rows + 1
+        ):
+            return cls(week)
+        archived._title_codes = {title: code for code, title in enumerate(archived.titles)}
+        archived._person_codes = {person_id: code for code, person_id in enumerate(archived.people)}
+        return archived
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "week_start": self.week,
+            "task_ids": self.task_ids,
+            "titles": self.titles,
+            "people": self.people,
+            "title": self.title.tolist(),
+            "assignee_start": self.assignee_start.tolist(),
+            "assignee": self.assignee.tolist(),
+            "due": self.due.tolist(),
+            "completed": self.completed.tolist(),
+            "fixed": self.fixed.tolist(),
+        }
+
+    def append(self, completion: Completion) -> None:
+        self.task_ids.append(completion.task_id)
+        self.title.append(_code(self._title_codes, self.titles, completion.title))
+        self.assignee.extend(_code(self._person_codes, self.people, person_id) for person_id in completion.assignees)
+        self.assignee_start.append(len(self.assignee))
+        self.due.append(completion.due.toordinal() if completion.due else _NO_DAY)
+        self.completed.append(completion.completed.toordinal())
+        self.fixed.append(1 if completion.fixed else 0)
+
+
+class CompletionArchive:
+    """Completed tasks kept outside the hot board, one Store per ISO week.
+
+    A small index file lists the weeks on disk and the pending completions:
+    tasks currently in the done column with the day they were due and the day
+    they were ticked off. When a done task leaves the board its pending record
+    is appended to its week; weeks are never rewritten otherwise.
+    """
+
+    def __init__(self, hass, key: str) -> None:
+        self._hass = hass
+        self._key = key
+        self._index: Store[dict[str, Any]] = Store(hass, ARCHIVE_VERSION, f"{key}_archive")
+        self._stores: dict[str, Store[dict[str, Any]]] = {}
+        self._weeks: dict[str, ArchiveWeek] = {}
+        self._queue: list[Completion] = []
+        self.known: set[str] = set()
+        self.pending: dict[str, tuple[date | None, date]] = {}
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Read the index once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        raw = await self._index.async_load()
+        if not isinstance(raw, dict):
+            return
+        self.known.update(str(week) for week in raw.get("weeks", []) if _parse_date(week) is not None)
+        for task_id, value in (raw.get("pending") or {}).items():
+            if not isinstance(value, list) or len(value) != 2:
+                continue
+            completed = _parse_date(value[1])
+            if completed is not None:
+                self.pending[str(task_id)] = (_parse_date(value[0]), completed)
+
+    def mark_done(self, task_id: str, due: date | None, completed: date) -> None:
+        """Remember that a task entered the done column."""
+        self.pending[task_id] = (due, completed)
+        self._schedule_index_save()
+
+    def mark_open(self, task_id: str) -> None:
+        """Forget the completion of a task that went back to a weekday."""
+        if self.pending.pop(task_id, None) is not None:
+            self._schedule_index_save()
+
+    def rename(self, old_id: str, new_id: str) -> None:
+        """Move the pending completion of a task whose id was rewritten."""
+        if old_id in self.pending:
+            self.pending[new_id] = self.pending.pop(old_id)
+            self._schedule_index_save()
+
+    def retire(
+        self,
+        task_id: str,
+        title: str,
+        assignees: Iterable[str],
+        fixed: bool,
+        fallback_completed: date,
+    ) -> None:
+        """Queue a done task that is leaving the board for the next ``async_flush``."""
+        due, completed = self.pending.pop(task_id, (None, fallback_completed))
+        self._queue.append(Completion(task_id, title, tuple(assignees), due, completed, fixed))
+
+    async def async_flush(self) -> int:
+        """Append queued completions to their weeks and return how many were written."""
+        if not self._queue:
+            return 0
+        queue, self._queue = self._queue, []
+        by_week: dict[str, list[Completion]] = {}
+        for completion in queue:
+            by_week.setdefault(completion.week, []).append(completion)
+        for week, completions in sorted(by_week.items()):
+            archived = await self._async_week(week)
+            for completion in completions:
+                archived.append(completion)
+            await self._store(week).async_save(archived.as_dict())
+            self.known.add(week)
+        await self._index.async_save(self._index_data())
+        return len(queue)
+
+    async def async_weeks(self, first: str, last: str) -> list[ArchiveWeek]:
+        """Return the archived weeks from ``first`` to ``last`` (Monday iso dates) in order."""
+        return [await self._async_week(week) for week in sorted(self.known) if first <= week <= last]
+
+    async def _async_week(self, week: str) -> ArchiveWeek:
+        archived = self._weeks.get(week)
+        if archived is None:
+            raw = await self._store(week).async_load() if week in self.known else None
+            archived = ArchiveWeek.from_dict(week, raw)
+            self._weeks[week] = archived
+        return archived
+
+    def _index_data(self) -> dict[str, Any]:
+        return {
+            "weeks": sorted(self.known),
+            "pending": {
+                task_id: [due.isoformat() if due else None, completed.isoformat()]
+                for task_id, (due, completed) in self.pending.items()
+            },
+        }
+
+    def _schedule_index_save(self) -> None:
+        self._index.async_delay_save(self._index_data, ARCHIVE_SAVE_DELAY)
+
+    def _store(self, week: str) -> Store[dict[str, Any]]:
+        store = self._stores.get(week)
+        if store is None:
+            iso_year, iso_week, _weekday = date.fromisoformat(week).isocalendar()
+            store = Store(self._hass, ARCHIVE_VERSION, f"{self._key}_archive_{iso_year}-W{iso_week:02d}")
+            self._stores[week] = store
+        return store
+
+
+def completion_stats(
+    weeks: list[ArchiveWeek],
+    *,
+    today: date,
+    person_id: str | None = None,
+    person_names: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Aggregate archived weeks into counts, on-time rates, streaks and per-person load.
+
+    Several ``ArchiveWeek`` objects may cover the same week (e.g. the archive
+    plus the done tasks still on the board); their rows are merged.
+
+    A completion is on time when it was ticked off no later than its due day;
+    completions without a known due day only count towards totals. Streaks are
+    runs of consecutive days with at least one completion; the current streak
+    may end today or yesterday. ``load_share`` is a person's share of all
+    per-person completions, so shared tasks count for each assignee.
+    """
+    names = person_names or {}
+    household = _Tally()
+    per_person: dict[str, _Tally] = {}
+    week_rows: dict[str, dict[str, Any]] = {}
+    for archived in weeks:
+        week_row = week_rows.setdefault(
+            archived.week, {"week_start": archived.week, "completed": 0, "on_time": 0, "people": {}}
+        )
+        week_people: dict[str, int] = week_row["people"]
+        people = archived.people
+        starts = archived.assignee_start
+        assignee = archived.assignee
+        due_column = archived.due
+        completed_column = archived.completed
+        for row in range(len(archived)):
+            row_people = [people[code] for code in assignee[starts[row] : starts[row + 1]]]
+            if person_id is not None and person_id not in row_people:
+                continue
+            due = due_column[row]
+            completed = completed_column[row]
+            on_time = due != _NO_DAY and completed <= due
+            household.add(completed, due, on_time)
+            week_row["completed"] += 1
+            week_row["on_time"] += on_time
+            for row_person in row_people:
+                if person_id is not None and row_person != person_id:
+                    continue
+                tally = per_person.get(row_person)
+                if tally is None:
+                    tally = per_person[row_person] = _Tally()
+                tally.add(completed, due, on_time)
+                week_people[row_person] = week_people.get(row_person, 0) + 1
+
+    assigned_total = sum(tally.completed for tally in per_person.values())
+    return {
+        **household.as_dict(today),
+        "weeks": [week_rows[week] for week in sorted(week_rows)],
+        "people": [
+            {
+                "person_id": pid,
+                "person_name": names.get(pid, ""),
+                **tally.as_dict(today),
+                "load_share": round(tally.completed / assigned_total, 4) if assigned_total else 0.0,
+            }
+            for pid, tally in sorted(per_person.items(), key=lambda item: (-item[1].completed, item[0]))
+        ],
+    }
+
+
+class _Tally:
+    __slots__ = ("completed", "with_due", "on_time", "days")
+
+    def __init__(self) -> None:
+        self.completed = 0
+        self.with_due = 0
+        self.on_time = 0
+        self.days: set[int] = set()
+
+    def add(self, completed: int, due: int, on_time: bool) -> None:
+        self.completed += 1
+        self.with_due += due != _NO_DAY
+        self.on_time += on_time
+        self.days.add(completed)
+
+    def as_dict(self, today: date) -> dict[str, Any]:
+        current, longest = _streaks(self.days, today.toordinal())
+        return {
+            "completed": self.completed,
+            "with_due_date": self.with_due,
+            "on_time": self.on_time,
+            "on_time_rate": round(self.on_time / self.with_due, 4) if self.with_due else None,
+            "current_streak_days": current,
+            "longest_streak_days": longest,
+        }
+
+
+def _streaks(days: set[int], today: int) -> tuple[int, int]:
+    longest = 0
+    for day in days:
+        if day - 1 in days:
+            continue
+        length = 1
+        while day + length in days:
+            length += 1
+        longest = max(longest, length)
+    end = today if today in days else today - 1
+    current = 0
+    while end - current in days:
+        current += 1
+    return current, longest
+
+
+def _code(codes: dict[str, int], values: list[str], value: str) -> int:
+    code = codes.get(value)
+    if code is None:
+        code = codes[value] = len(values)
+        values.append(value)
+    return code
+
+
+def _parse_date(value: Any) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
@@ -0,0 +1,174 @@
+"""Load-balancing assignee suggestions for one board week."""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass, field
+import heapq
+from typing import TYPE_CHECKING, Any
+
+from .stats import WEEKDAY_COLUMNS, WEEKDAY_INDEX
+
+if TYPE_CHECKING:
+    from .board import Task
+    from .indexes import BoardIndexes
+
+ROLES = ("adult", "child")
+# Share of a full load each role is expected to carry; loads are compared after dividing by it.
+ROLE_CAPACITY = {"adult": 1.0, "child": 0.5}
+
+
+@dataclass(slots=True)
+class Assignment:
+    """One open task (all fragments of a span in the week) and the person picked for it."""
+
+    task_ids: list[str]
+    title: str
+    day: str
+    person_id: str = ""
+
+    def as_dict(self, person_names: dict[str, str]) -> dict[str, Any]:
+        return {
+            "task_id": self.task_ids[0],
+            "task_ids": list(self.task_ids),
+            "title": self.title,
+            "day": self.day,
+            "person_id": self.person_id,
+            "person_name": person_names.get(self.person_id, ""),
+        }
+
+
+@dataclass(slots=True)
+class AssignmentPlan:
+    """Result of ``plan_week``: picks plus per-person loads before and after."""
+
+    week_start: str
+    assignments: list[Assignment] = field(default_factory=list)
+    unassigned: list[Assignment] = field(default_factory=list)
+    load_before: dict[str, int] = field(default_factory=dict)
+    load_after: dict[str, int] = field(default_factory=dict)
+    capacity: dict[str, float] = field(default_factory=dict)
+
+    def imbalance(self, loads: dict[str, int]) -> float:
+        """Spread between the most and least loaded eligible person, relative to capacity."""
+        if not self.capacity:
+            return 0.0
+        relative = [loads.get(person_id, 0) / capacity for person_id, capacity in self.capacity.items()]
+        return round(max(relative) - min(relative), 4)
+
+    def as_dict(self, people: list[dict[str, Any]]) -> dict[str, Any]:
+        names = {str(person.get("id", "")): str(person.get("name", "")).strip() for person in people}
+        roles = {str(person.get("id", "")): str(person.get("role") or "adult") for person in people}
+        return {
+            "week_start": self.week_start,
+            "assignments": [assignment.as_dict(names) for assignment in self.assignments],
+            "unassigned": [assignment.as_dict(names) for assignment in self.unassigned],
+            "people": [
+                {
+                    "person_id": person_id,
+                    "person_name": names.get(person_id, ""),
+                    "role": roles.get(person_id, "adult"),
+                    "eligible": person_id in self.capacity,
+                    "load_before": self.load_before.get(person_id, 0),
+                    "load_after": self.load_after.get(person_id, 0),
+                }
+                for person_id in self.load_before
+            ],
+            "imbalance_before": self.imbalance(self.load_before),
+            "imbalance_after": self.imbalance(self.load_after),
+        }
+
+
+def plan_week(
+    board: dict[str, Any],
+    week: dict[str, Any],
+    *,
+    indexes: BoardIndexes,
+    roles: Collection[str] = ROLES,
+    task_ids: Collection[str] | None = None,
+) -> AssignmentPlan:
+    """Pick an assignee for every open, unassigned task of one week.
+
+    ``week`` is the ``stats.week_stats`` result for that week; its per-person
+    ``total`` is the starting load, so tasks that already have assignees
+    stay as they are and count. Only people whose role is in ``roles`` are
+    picked. Every task (a span counts once, as in the week stats) adds one to
+    its assignee's load, so handing each task to the person whose load after
+    taking it is lowest relative to their role's capacity keeps the highest
+    relative load as low as possible. People sit in a heap keyed by that
+    value, which makes each pick O(log people).
+    """
+    plan = _week_loads(board, week, roles)
+    units = open_units(indexes.week_tasks(plan.week_start, WEEKDAY_COLUMNS, include_unscheduled=False), task_ids)
+    plan.load_after = dict(plan.load_before)
+    if not plan.capacity:
+        plan.unassigned = units
+        return plan
+
+    order = {person_id: position for position, person_id in enumerate(plan.capacity)}
+    heap = [
+        ((plan.load_after[person_id] + 1) / capacity, order[person_id], person_id)
+        for person_id, capacity in plan.capacity.items()
+    ]
+    heapq.heapify(heap)
+    for unit in units:
+        _next_load, position, person_id = heapq.heappop(heap)
+        unit.person_id = person_id
+        plan.assignments.append(unit)
+        plan.load_after[person_id] += 1
+        heapq.heappush(heap, ((plan.load_after[person_id] + 1) / plan.capacity[person_id], position, person_id))
+    return plan
+
+
+def pick_assignee(
+    board: dict[str, Any],
+    week: dict[str, Any],
+    *,
+    roles: Collection[str] = ROLES,
+    units: int = 1,
+) -> str | None:
+    """Return the eligible person whose relative load after taking ``units`` more tasks is lowest.
+
+    Used for a new template, whose occurrences all go to one person: ``units``
+    is how many times it occurs in the week ``week`` describes.
+    """
+    plan = _week_loads(board, week, roles)
+    if not plan.capacity:
+        return None
+    order = {person_id: position for position, person_id in enumerate(plan.capacity)}
+    return min(
+        plan.capacity,
+        key=lambda person_id: ((plan.load_before[person_id] + units) / plan.capacity[person_id], order[person_id]),
+    )
+
+
+def _week_loads(board: dict[str, Any], week: dict[str, Any], roles: Collection[str]) -> AssignmentPlan:
+    """Start a plan with each person's current load and, for eligible roles, their capacity."""
+    plan = AssignmentPlan(week_start=week["week_start"])
+    people = board.get("people", []) if isinstance(board, dict) else []
+    role_by_id = {str(person.get("id", "")): str(person.get("role") or "adult") for person in people}
+    for row in week["people"]:
+        person_id = row["person_id"]
+        plan.load_before[person_id] = int(row["total"])
+        if role_by_id.get(person_id, "adult") in roles:
+            plan.capacity[person_id] = ROLE_CAPACITY.get(role_by_id.get(person_id, "adult"), 1.0)
+    return plan
+
+
+def open_units(tasks: Iterable[Task], task_ids: Collection[str] | None = None) -> list[Assignment]:
+    """Group the open, unassigned tasks of a week into assignable units, earliest day first."""
+    units: dict[str, Assignment] = {}
+    for task in tasks:
+        if task.assignees or task.column not in WEEKDAY_INDEX:
+            continue
+        if task_ids is not None and task.id not in task_ids:
+            continue
+        key = f"span:{task.span_id}:{task.week_start}" if task.span_id else task.id
+        unit = units.get(key)
+        if unit is None:
+            units[key] = Assignment([task.id], task.title, task.column)
+        else:
+            unit.task_ids.append(task.id)
+            if WEEKDAY_INDEX[task.column] < WEEKDAY_INDEX[unit.day]:
+                unit.day = task.column
+    return sorted(units.values(), key=lambda unit: WEEKDAY_INDEX[unit.day])
@@ -2,18 +2,38 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field, fields, replace
 from datetime import UTC, date, datetime, timedelta
-from typing import Any
+from operator import attrgetter
+import sys
+from typing import Any, TypeVar
 from uuid import uuid4
 
+from homeassistant.core import CALLBACK_TYPE
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util import dt as dt_util
 
+from .archive import ArchiveWeek, Completion, CompletionArchive, completion_stats
+from .assignment import pick_assignee, plan_week
 from .const import DOMAIN, SIGNAL_BOARD_UPDATED
-
-BOARD_SCHEMA_VERSION = 1
+from .indexes import BoardIndexes, WeekColumnKey, week_key
+from .journal import BoardJournal, apply_entry, build_entry, diff_entry
+from .migrations import BOARD_SCHEMA_VERSION, migrate_board, needs_migration
+from .query import task_day
+from .recurrence import FREQUENCIES, Recurrence, occurrence_id, split_occurrence_id
+from .shards import BoardShards
+from .stats import (
+    StatsCache,
+    next_three_tasks_summary,
+    person_week_stats,
+    today_tasks,
+    upcoming_tasks,
+    week_stats,
+)
 
 WEEKDAY_COLUMNS = [
     "monday",
@@ -27,6 +47,12 @@ WEEKDAY_COLUMNS = [
 WEEKDAY_INDEX = {column: index for index, column in enumerate(WEEKDAY_COLUMNS)}
 
 ALL_COLUMNS = [*WEEKDAY_COLUMNS, "done"]
+COLUMN_INDEX = {column: index for index, column in enumerate(ALL_COLUMNS)}
+# Seconds queued mutations wait for others before the batch is committed as one change.
+MUTATION_BATCH_WINDOW = 0.05
+
+_T = TypeVar("_T")
+
 DEFAULT_COLORS = [
     "#E11D48",
     "#2563EB",
@@ -53,7 +79,11 @@ class Person:
 
 @dataclass(slots=True)
 class Task:
-    """One task on the weekly board."""
+    """One task on the weekly board.
+
+    The store keeps tasks as instances with interned ids and week strings;
+    ``as_dict`` is used where they leave it (websocket, services, disk).
+    """
 
     id: str
     title: str
@@ -71,6 +101,110 @@ class Task:
     week_start: str | None = None
     week_number: int | None = None
 
+    def as_dict(self) -> dict[str, Any]:
+        """Return the plain dict form stored on disk and sent to clients."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "assignees": list(self.assignees),
+            "column": self.column,
+            "order": self.order,
+            "created_at": self.created_at,
+            "slot": self.slot,
+            "end_date": self.end_date,
+            "template_id": self.template_id,
+            "fixed": self.fixed,
+            "span_id": self.span_id,
+            "span_index": self.span_index,
+            "span_total": self.span_total,
+            "week_start": self.week_start,
+            "week_number": self.week_number,
+        }
+
+    def assign(self, other: Task) -> None:
+        """Copy every field of ``other`` onto this task in place."""
+        for name in TASK_FIELDS:
+            setattr(self, name, getattr(other, name))
+
+
+TASK_FIELDS = tuple(field.name for field in fields(Task))
+_task_values = attrgetter(*TASK_FIELDS)
+# Canonical column strings; stored legacy names are mapped by the schema migrations.
+COLUMN_NAMES = {column: column for column in ALL_COLUMNS}
+
+
+def serialize_board(board: dict[str, Any]) -> dict[str, Any]:
+    """Return a plain-dict copy of an in-memory board."""
+    return {
+        **board,
+        "people": [dict(person) for person in board.get("people", [])],
+        "tasks": [task.as_dict() for task in board.get("tasks", [])],
+        "templates": [dict(template) for template in board.get("templates", [])],
+    }
+
+
+@dataclass(slots=True)
+class _Changes:
+    """Records touched by in-place board edits, waiting to be committed."""
+
+    tasks: list[Task] = field(default_factory=list)
+    templates: list[dict[str, Any]] = field(default_factory=list)
+    deleted_task_ids: list[str] = field(default_factory=list)
+    expand: bool = False
+    # New tasks without assignees, handed out on commit when auto-assignment is on.
+    unassigned: list[Task] = field(default_factory=list)
+
+    def extend(self, other: _Changes) -> None:
+        self.tasks.extend(other.tasks)
+        self.templates.extend(other.templates)
+        self.deleted_task_ids.extend(other.deleted_task_ids)
+        self.expand = self.expand or other.expand
+        self.unassigned.extend(other.unassigned)
+
+
+class BoardTransaction:
+    """View of the live board handed to mutations queued with ``async_mutate``.
+
+    Edits made through it are applied immediately and committed together with
+    the rest of the batch. Each edit validates before it changes anything, so a
+    mutation that raises leaves only its earlier, complete edits behind.
+    """
+
+    __slots__ = ("_store", "_changes")
+
+    def __init__(self, store: HouseholdBoardStore, changes: _Changes) -> None:
+        self._store = store
+        self._changes = changes
+
+    @property
+    def board(self) -> dict[str, Any]:
+        """The live in-memory board."""
+        assert self._store._data is not None
+        return self._store._data
+
+    @property
+    def indexes(self) -> BoardIndexes:
+        """Secondary task indexes of the live board."""
+        return self._store.indexes
+
+    def add_task(self, task: dict[str, Any]) -> Task:
+        """Insert one task and return the stored record."""
+        changes, created = self._store._apply_add_task(task)
+        self._changes.extend(changes)
+        return created
+
+    def patch_task(self, task_id: str, changes: dict[str, Any]) -> Task:
+        """Apply a partial update to one task and return the stored record."""
+        applied, task = self._store._apply_patch_task(task_id, changes)
+        self._changes.extend(applied)
+        return task
+
+    def delete_task(self, task_id: str, *, exclude_occurrence: bool = False) -> None:
+        """Remove one task; see ``HouseholdBoardStore.async_delete_task``."""
+        changes = self._store._apply_delete_task(task_id, exclude_occurrence=exclude_occurrence)
+        if changes is not None:
+            self._changes.extend(changes)
+
 
 class HouseholdBoardStore:
     """Persistent board state for one config entry."""
@@ -86,6 +220,9 @@ class HouseholdBoardStore:
         refresh_minute: int = 30,
         cleanup_hour: int = 3,
         cleanup_minute: int = 0,
+        save_delay: float = 0,
+        retention_days: int = 7,
+        auto_assign: bool = False,
     ) -> None:
         self._hass = hass
         self._entry_id = entry_id
@@ -96,56 +233,557 @@ class HouseholdBoardStore:
         self._refresh_minute = refresh_minute
         self._cleanup_hour = cleanup_hour
         self._cleanup_minute = cleanup_minute
+        self._save_delay = max(0.0, float(save_delay))
+        self._retention_days = max(0, int(retention_days))
+        self._auto_assign = bool(auto_assign)
+        self._last_maintenance: dict[str, Any] = {}
+        self._writes_requested = 0
+        self._writes_performed = 0
+        self._snapshots_written = 0
         self._store: Store[dict[str, Any]] = Store(hass, 2, f"{DOMAIN}_board_{entry_id}")
+        self._journal = BoardJournal(hass, f"{DOMAIN}_board_{entry_id}")
+        self._shards = BoardShards(hass, f"{DOMAIN}_board_{entry_id}")
+        self._archive = CompletionArchive(hass, f"{DOMAIN}_board_{entry_id}")
+        self._week_lock = asyncio.Lock()
+        self._journal_buffer: list[str] = []
+        self._flush_unsub: CALLBACK_TYPE | None = None
+        self._compacting = False
         self._data: dict[str, Any] | None = None
+        self._indexes = BoardIndexes()
+        self._stats_cache = StatsCache()
+        self._occurrences: dict[str, Task] = {}
+        self._recurrences: dict[str, tuple[dict[str, Any], Recurrence | None]] = {}
+        self._mutations: list[tuple[Callable[[BoardTransaction], Any], tuple[str | None, ...], asyncio.Future]] = []
+        self._mutation_task: asyncio.Task | None = None
+
+    @property
+    def indexes(self) -> BoardIndexes:
+        """Secondary task indexes for the loaded board."""
+        return self._indexes
+
+    @property
+    def loaded_weeks(self) -> list[str]:
+        """Monday iso dates of the week shards currently merged into the board."""
+        return sorted(self._shards.loaded)
+
+    @property
+    def stored_weeks(self) -> list[str]:
+        """Monday iso dates of the week shards on disk, loaded or not."""
+        return sorted(self._shards.known)
+
+    @property
+    def revision(self) -> int:
+        """Monotonic counter bumped on every persisted board change."""
+        return int((self._data or {}).get("revision", 0))
+
+    @property
+    def weekly_refresh_time(self) -> tuple[int, int, int]:
+        """(weekday, hour, minute) of the weekly refresh from the loaded board settings."""
+        weekly = (self._data or {}).get("settings", {}).get("weekly_refresh", {})
+        return (
+            _safe_int(weekly.get("weekday"), self._refresh_weekday),
+            _safe_int(weekly.get("hour"), self._refresh_hour),
+            _safe_int(weekly.get("minute"), self._refresh_minute),
+        )
+
+    @property
+    def cleanup_time(self) -> tuple[int, int]:
+        """(hour, minute) of the nightly cleanup slot."""
+        return (self._cleanup_hour, self._cleanup_minute)
+
+    @property
+    def last_maintenance(self) -> dict[str, Any]:
+        """Report of the most recent nightly maintenance run (empty before the first)."""
+        return dict(self._last_maintenance)
+
+    @property
+    def write_stats(self) -> dict[str, int]:
+        """Return how many journal writes were requested versus actually performed."""
+        return {
+            "writes_requested": self._writes_requested,
+            "writes_performed": self._writes_performed,
+            "writes_saved": self._writes_requested - self._writes_performed,
+            "snapshots_written": self._snapshots_written,
+            "shards_written": self._shards.writes,
+            "journal_entries": self._journal.entry_count + len(self._journal_buffer),
+            "journal_bytes": self._journal.size_bytes,
+        }
+
+    @property
+    def stats_cache_info(self) -> dict[str, int]:
+        """Return hit/miss counters of the derived stats cache."""
+        return {"hits": self._stats_cache.hits, "misses": self._stats_cache.misses, "size": len(self._stats_cache)}
+
+    def person_week_stats(self, person_id: str, week_offset: int = 0) -> dict[str, Any]:
+        """Cached ``stats.person_week_stats`` for the loaded board."""
+        return self._cached_stats(
+            ("person_week", int(week_offset), str(person_id)),
+            lambda: person_week_stats(self._data or {}, person_id, week_offset, indexes=self._indexes),
+        )
+
+    def week_stats(self, week_offset: int = 0) -> dict[str, Any]:
+        """Cached ``stats.week_stats`` for every person of the loaded board."""
+        return self._cached_stats(
+            ("week", int(week_offset)),
+            lambda: week_stats(self._data or {}, week_offset, indexes=self._indexes),
+        )
+
+    def upcoming_tasks(self, limit: int = 3, horizon_days: int | None = None) -> dict[str, Any]:
+        """Cached ``stats.upcoming_tasks`` for the household and every person of the loaded board."""
+        return self._cached_stats(
+            ("upcoming", limit, horizon_days),
+            lambda: upcoming_tasks(self._data or {}, limit, horizon_days=horizon_days, indexes=self._indexes),
+        )
+
+    def next_tasks_summary(self, limit: int = 3, person_id: str | None = None) -> dict[str, Any]:
+        """Next ``limit`` open tasks of the household, or of one person, from the shared upcoming pass."""
+        upcoming = self.upcoming_tasks(limit)
+        if person_id is None:
+            return upcoming["household"]
+        summary = upcoming["people"].get(str(person_id))
+        if summary is None:
+            # Not (yet) a board person: fall back to a dedicated walk.
+            return next_three_tasks_summary(self._data or {}, limit, person_id=person_id, indexes=self._indexes)
+        return summary
+
+    def today_tasks(self) -> dict[str, Any]:
+        """Cached ``stats.today_tasks`` for the loaded board."""
+        return self._cached_stats(("today",), lambda: today_tasks(self._data or {}, indexes=self._indexes))
+
+    def invalidate_stats(self) -> None:
+        """Drop every cached view; keys already change with the revision and date."""
+        self._stats_cache.clear()
+
+    async def async_completion_stats(self, weeks: int = 4, person_id: str | None = None) -> dict[str, Any]:
+        """Completion analytics over the last ``weeks`` ISO weeks, this one included.
+
+        Reads the archive plus the done tasks still on the board.
+        """
+        board = await self.async_load()
+        await self._archive.async_flush()
+        today = dt_util.as_local(dt_util.utcnow()).date()
+        last = _week_start_for_day(today)
+        first = last - timedelta(weeks=max(1, weeks) - 1)
+        archived = await self._archive.async_weeks(first.isoformat(), last.isoformat())
+        live: dict[str, ArchiveWeek] = {}
+        for task in board["tasks"]:
+            if task.column != "done":
+                continue
+            due, completed = self._archive.pending.get(task.id, (None, today))
+            completion = Completion(
+                task.id, task.title, tuple(task.assignees), due, completed, bool(task.fixed or task.template_id)
+            )
+            if first.isoformat() <= completion.week <= last.isoformat():
+                live.setdefault(completion.week, ArchiveWeek(completion.week)).append(completion)
+        names = {person["id"]: person["name"] for person in board.get("people", [])}
+        return {
+            "week_start": first.isoformat(),
+            "week_end": (last + timedelta(days=6)).isoformat(),
+            "weeks_covered": max(1, weeks),
+            **completion_stats([*archived, *live.values()], today=today, person_id=person_id, person_names=names),
+        }
 
     async def async_load(self) -> dict[str, Any]:
         """Load board state from storage, creating defaults when empty."""
         if self._data is not None:
             return self._data
+        await self._archive.async_load()
 
-        loaded = await self._store.async_load()
-        if loaded:
-            self._data = self._normalize_board(loaded)
+        core = await self._store.async_load()
+        if core:
+            snapshot_revision = _safe_int(core.get("revision"), 0)
+            entries = [
+                entry for entry in await self._journal.async_load() if _safe_int(entry.get("rev"), 0) > snapshot_revision
+            ]
+            legacy = not isinstance(core.get("weeks"), list)
+            migrating = needs_migration(core)
+            board = dict(core)
+            board_tasks = [task for task in core.get("tasks", []) if isinstance(task, dict)]
+            if not legacy:
+                self._shards.known.update(str(week) for week in core["weeks"])
+                # Replaying needs every week a journaled move or delete may touch, and
+                # a migration rewrites every week once.
+                if entries or migrating:
+                    weeks = sorted(self._shards.known.union(self._window_weeks()))
+                else:
+                    weeks = self._window_weeks()
+                for week in weeks:
+                    board_tasks.extend(await self._shards.async_load_week(week))
+            board["tasks"] = board_tasks
+            for entry in entries:
+                apply_entry(board, entry)
+            if migrating:
+                board = await self._hass.async_add_executor_job(migrate_board, board)
+                for task in board["tasks"]:
+                    if legacy_id := task.pop("legacy_id", None):
+                        self._archive.rename(str(legacy_id), task["id"])
+            if legacy:
+                # Single-file board from before sharding: everything is in memory already.
+                self._shards.loaded.update(week for week in map(_task_week, board["tasks"]) if week is not None)
+                self._shards.loaded.update(self._window_weeks())
+            self._data, _changed = self._normalize_board(board)
+            self._expand_occurrences()
+            self._indexes = BoardIndexes(self._data["tasks"])
+            if legacy or entries or migrating:
+                self._shards.forget_digests()
+                await self.async_compact()
+            else:
+                self._mark_weeks_clean()
             return self._data
 
         self._data = self._default_board()
-        await self._store.async_save(self._data)
+        self._indexes = BoardIndexes(self._data["tasks"])
+        self._shards.loaded.update(self._window_weeks())
+        await self._async_write_snapshot()
+        await self._journal.async_clear()
+        return self._data
+
+    async def async_ensure_weeks(self, weeks: Iterable[str | None]) -> None:
+        """Merge the shards of the given weeks into the board if not loaded yet."""
+        if self._data is None:
+            await self.async_load()
+        wanted = {week for week in map(week_key, weeks) if week is not None}
+        if wanted <= self._shards.loaded:
+            return
+        async with self._week_lock:
+            missing = sorted(wanted - self._shards.loaded)
+            for week in missing:
+                self._merge_week(week, await self._shards.async_load_week(week))
+            if missing and self._data is not None and self._data["templates"]:
+                # One expansion for the whole batch, not one per merged week.
+                added, removed = self._expand_occurrences()
+                self._reindex(set(removed).union(task.id for task in added), {task.id: task for task in added})
+
+    async def async_load_week(self, week_offset: int) -> dict[str, Any]:
+        """Return the board with the week ``week_offset`` weeks from now loaded."""
+        today = dt_util.as_local(dt_util.utcnow()).date()
+        await self.async_ensure_weeks([(_week_start_for_day(today) + timedelta(weeks=week_offset)).isoformat()])
+        assert self._data is not None
         return self._data
 
     async def async_save(
         self,
         board: dict[str, Any],
         *,
+        weeks: Iterable[str] | None = None,
+        expected_revision: int | None = None,
         expected_updated_at: str | None = None,
     ) -> dict[str, Any]:
-        """Persist normalized board state."""
-        if self._data is None:
-            await self.async_load()
-
-        if expected_updated_at is not None:
-            current_updated_at = str((self._data or {}).get("updated_at") or "")
-            if current_updated_at and expected_updated_at != current_updated_at:
-                raise BoardConflictError(
-                    f"Board changed by another client (expected {expected_updated_at}, current {current_updated_at})"
-                )
+        """Persist normalized board state.
 
-        self._data = self._normalize_board(board)
-        await self._store.async_save(self._data)
+        ``weeks`` limits which loaded weeks the payload replaces; tasks of other
+        loaded weeks are kept. Without it the payload covers every loaded week.
+        """
+        raw_tasks = board.get("tasks") if isinstance(board, dict) else None
+        raw_tasks = [task for task in raw_tasks if isinstance(task, dict)] if isinstance(raw_tasks, list) else []
+        await self.async_ensure_weeks(_task_week(task) for task in raw_tasks)
+        assert self._data is not None
+
+        self._check_expected(expected_revision, expected_updated_at)
+        if weeks is not None and isinstance(board, dict):
+            covered = {week for week in map(week_key, weeks) if week is not None}
+            payload_ids = {str(task.get("id")) for task in raw_tasks}
+            carried = [
+                task
+                for task in self._data["tasks"]
+                if (week := week_key(task.week_start)) is not None and week not in covered and task.id not in payload_ids
+            ]
+            if carried:
+                board = {**board, "tasks": [*raw_tasks, *carried]}
+        previous = self._data
+        normalized, touched = self._normalize_board(board, previous)
+        core_changed = any(normalized[key] != previous[key] for key in ("people", "templates", "settings"))
+        if not touched and not core_changed:
+            # Normalizes to what we already have (e.g. a client echoing the board back):
+            # keep the revision so other clients stay current.
+            return previous
+
+        # The indexes still describe the previous board until _reindex below.
+        before = self._indexes.by_id
+        after = {task.id: task for task in normalized["tasks"] if task.id in touched}
+        self._data = normalized
+        self._bump_revision()
+        if normalized["templates"] != previous["templates"] or any(
+            task.template_id for task in (*after.values(), *(before[task_id] for task_id in touched if task_id in before))
+        ):
+            added, removed = self._expand_occurrences()
+            touched.update(removed)
+            touched.update(task.id for task in added)
+            after = {task.id: task for task in self._data["tasks"] if task.id in touched}
+        self._track_saved_completions(before, after, touched)
+        self._reindex(touched, after)
+
+        core = ("people", "templates", "settings", "revision", "updated_at")
+        entry = diff_entry({key: previous[key] for key in core}, {key: self._data[key] for key in core})
+        # Tasks come from the changed ids; diffing the task lists would walk the whole board.
+        entry.update(
+            build_entry(
+                self.revision,
+                self._data["updated_at"],
+                tasks=[task for task in after.values() if not self._is_occurrence(task)],
+                deleted_task_ids=[task_id for task_id in touched if task_id not in after],
+            )
+        )
+        await self._async_persist(entry)
+        await self._archive.async_flush()
         async_dispatcher_send(self._hass, f"{SIGNAL_BOARD_UPDATED}_{self._entry_id}")
         return self._data
 
+    async def async_add_task(
+        self,
+        task: dict[str, Any],
+        *,
+        expected_revision: int | None = None,
+    ) -> dict[str, Any]:
+        """Insert one task and return only the records that changed."""
+        await self._async_begin_operation(expected_revision, weeks=[task.get("week_start")])
+        changes, _created = self._apply_add_task(task)
+        return await self._async_commit_changes(changes)
+
+    async def async_patch_task(
+        self,
+        task_id: str,
+        changes: dict[str, Any],
+        *,
+        expected_revision: int | None = None,
+    ) -> dict[str, Any]:
+        """Apply a partial update to one task."""
+        await self._async_begin_operation(expected_revision, weeks=[changes.get("week_start")])
+        applied, _task = self._apply_patch_task(task_id, changes)
+        return await self._async_commit_changes(applied)
+
+    async def async_move_task(
+        self,
+        task_id: str,
+        column: str,
+        *,
+        week_start: str | None = None,
+        order: int | None = None,
+        expected_revision: int | None = None,
+    ) -> dict[str, Any]:
+        """Move one task to a column/week and position, re-densifying affected columns."""
+        await self._async_begin_operation(expected_revision, weeks=[week_start])
+        current = self._require_task(task_id)
+        target_column = str(column or "").lower()
+        if target_column not in ALL_COLUMNS:
+            raise BoardOperationError("invalid_column", f"Unknown column {column}")
+
+        previous_key = BoardIndexes.bucket_key(current)
+        moved = {**current.as_dict(), "column": target_column}
+        if week_start is not None:
+            moved["week_start"] = week_start
+            moved["week_number"] = None
+        normalized = self._normalize_task(moved, current.order, self._known_person_ids())
+        if normalized is None:
+            raise BoardOperationError("invalid_task", "Task payload needs a non-empty title")
+        expand = self._materialize(current)
+        was_done, due = current.column == "done", task_day(current)
+        self._indexes.remove(current)
+        current.assign(normalized)
+        self._indexes.add(current)
+        self._track_completion(current, was_done, due)
+
+        changed = self._place_task(current, order)
+        if previous_key != BoardIndexes.bucket_key(current):
+            changed.extend(self._densify_bucket(previous_key))
+        return await self._async_commit(tasks=changed, expand=expand)
+
+    async def async_delete_task(
+        self,
+        task_id: str,
+        *,
+        exclude_occurrence: bool = False,
+        expected_revision: int | None = None,
+    ) -> dict[str, Any]:
+        """Remove one task and re-densify its column.
+
+        A template occurrence is regenerated unless ``exclude_occurrence`` adds
+        its date to the template's excluded dates.
+        """
+        await self._async_begin_operation(expected_revision)
+        changes = self._apply_delete_task(task_id, exclude_occurrence=exclude_occurrence)
+        if changes is None:
+            return self._operation_result(deleted_task_ids=[str(task_id)])
+        return await self._async_commit_changes(changes)
+
+    async def async_mutate(
+        self,
+        mutation: Callable[[BoardTransaction], _T],
+        *,
+        weeks: Iterable[str | None] = (),
+    ) -> tuple[_T, dict[str, Any]]:
+        """Queue ``mutation`` to run against the live board and return its value and the commit result.
+
+        Mutations run one at a time in arrival order. Those queued within
+        ``MUTATION_BATCH_WINDOW`` of each other are committed as one revision,
+        one journal entry and one update signal; every caller still gets its
+        own return value, or its own exception.
+        """
+        future: asyncio.Future = self._hass.loop.create_future()
+        self._mutations.append((mutation, tuple(weeks), future))
+        if self._mutation_task is None:
+            self._mutation_task = self._hass.async_create_task(self._async_run_mutations())
+        return await future
+
+    async def _async_run_mutations(self) -> None:
+        try:
+            while self._mutations:
+                await asyncio.sleep(MUTATION_BATCH_WINDOW)
+                batch, self._mutations = self._mutations, []
+                await self._async_apply_batch(batch)
+        finally:
+            self._mutation_task = None
+
+    async def _async_apply_batch(
+        self,
+        batch: list[tuple[Callable[[BoardTransaction], Any], tuple[str | None, ...], asyncio.Future]],
+    ) -> None:
+        try:
+            await self._async_begin_operation(None, weeks=[week for _mutation, weeks, _future in batch for week in weeks])
+        except Exception as err:  # noqa: BLE001
+            for _mutation, _weeks, future in batch:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        # No awaits from here to the commit, so the batch applies atomically.
+        changes = _Changes()
+        outcomes: list[tuple[asyncio.Future, Any, BaseException | None]] = []
+        for mutation, _weeks, future in batch:
+            try:
+                outcomes.append((future, mutation(BoardTransaction(self, changes)), None))
+            except Exception as err:  # noqa: BLE001
+                outcomes.append((future, None, err))
+
+        if changes.tasks or changes.templates or changes.deleted_task_ids:
+            result = await self._async_commit_changes(changes)
+        else:
+            result = self._operation_result()
+        for future, value, error in outcomes:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result((value, result))
+
+    def _apply_add_task(self, task: dict[str, Any]) -> tuple[_Changes, Task]:
+        assert self._data is not None
+        board = self._data
+        normalized = self._normalize_task(task, len(board["tasks"]), self._known_person_ids())
+        if normalized is None:
+            raise BoardOperationError("invalid_task", "Task payload needs a non-empty title")
+        if self._find_task(normalized.id) is not None:
+            raise BoardOperationError("task_exists", f"Task {normalized.id} already exists")
+
+        board["tasks"].append(normalized)
+        self._indexes.add(normalized)
+        self._track_completion(normalized, False, task_day(normalized))
+        order = task.get("order") if isinstance(task.get("order"), int) else None
+        changed = self._place_task(normalized, order)
+        changes = _Changes(tasks=changed, expand=normalized.template_id is not None)
+        if self._auto_assign and not normalized.assignees and normalized.template_id is None:
+            changes.unassigned.append(normalized)
+        return changes, normalized
+
+    def _apply_patch_task(self, task_id: str, changes: dict[str, Any]) -> tuple[_Changes, Task]:
+        current = self._require_task(task_id)
+        merged = {**current.as_dict(), **{key: value for key, value in changes.items() if key != "id"}}
+        normalized = self._normalize_task(merged, current.order, self._known_person_ids())
+        if normalized is None:
+            raise BoardOperationError("invalid_task", "Task payload needs a non-empty title")
+
+        expand = self._materialize(current) or normalized.template_id is not None
+        previous_key = BoardIndexes.bucket_key(current)
+        position_changed = BoardIndexes.bucket_key(normalized) != previous_key or "order" in changes
+        was_done, due = current.column == "done", task_day(current)
+        self._indexes.remove(current)
+        current.assign(normalized)
+        self._indexes.add(current)
+        self._track_completion(current, was_done, due)
+        changed = [current]
+        if position_changed:
+            changed = self._place_task(current, normalized.order)
+            if previous_key != BoardIndexes.bucket_key(current):
+                changed.extend(self._densify_bucket(previous_key))
+        return _Changes(tasks=changed, expand=expand), current
+
+    def _apply_delete_task(self, task_id: str, *, exclude_occurrence: bool) -> _Changes | None:
+        """Remove one task in memory, or return None when an excluded occurrence is already gone."""
+        assert self._data is not None
+        board = self._data
+        current = self._find_task(task_id)
+        if current is None and split_occurrence_id(task_id) is not None:
+            # Excluding the date through upsert_template already removed this occurrence.
+            return None
+        current = self._require_task(task_id)
+        expand = self._materialize(current)
+        board["tasks"] = [task for task in board["tasks"] if task is not current]
+        self._indexes.remove(current)
+        self._retire_done([current])
+        changed = self._densify_bucket(BoardIndexes.bucket_key(current))
+        templates: list[dict[str, Any]] = []
+        day = self._occurrence_day(current) if exclude_occurrence and current.template_id else None
+        template = next((item for item in board["templates"] if item["id"] == current.template_id), None)
+        if day is not None and template is not None:
+            template = {**template, "excluded_dates": sorted({*template["excluded_dates"], day.isoformat()})}
+            board["templates"] = [template if item["id"] == template["id"] else item for item in board["templates"]]
+            templates.append(template)
+        return _Changes(tasks=changed, templates=templates, deleted_task_ids=[current.id], expand=expand)
+
+    async def async_upsert_person(
+        self,
+        person: dict[str, Any],
+        *,
+        expected_revision: int | None = None,
+    ) -> dict[str, Any]:
+        """Create or replace one person."""
+        board = await self._async_begin_operation(expected_revision)
+        people = board["people"]
+        person_id = str(person.get("id") or "")
+        index = next((idx for idx, item in enumerate(people) if item["id"] == person_id), None)
+        normalized = self._normalize_person(person, len(people) if index is None else index)
+        if index is None:
+            people.append(normalized)
+        else:
+            people[index] = normalized
+        return await self._async_commit(people=[normalized])
+
+    async def async_upsert_template(
+        self,
+        template: dict[str, Any],
+        *,
+        expected_revision: int | None = None,
+    ) -> dict[str, Any]:
+        """Create or replace one fixed-task template."""
+        board = await self._async_begin_operation(expected_revision)
+        normalized = self._normalize_template(template, self._known_person_ids())
+        if normalized is None:
+            raise BoardOperationError(
+                "invalid_template", "Template needs a title, an end_date or count, and weekdays for weekly rules"
+            )
+        templates = board["templates"]
+        index = next((idx for idx, item in enumerate(templates) if item["id"] == normalized["id"]), None)
+        if index is None and self._auto_assign and not normalized["assignees"]:
+            normalized["assignees"] = self._template_assignee(normalized)
+        if index is None:
+            templates.append(normalized)
+        else:
+            templates[index] = normalized
+        return await self._async_commit(templates=[normalized], expand=True)
+
     async def async_remove_done_tasks(self) -> int:
         """Remove all tasks in the done column and persist if changed."""
         board = await self.async_load()
         tasks = board.get("tasks", [])
-        remaining_tasks = [task for task in tasks if task.get("column") != "done"]
+        remaining_tasks = [task for task in tasks if task.column != "done"]
         removed_count = len(tasks) - len(remaining_tasks)
         if removed_count == 0:
             return 0
 
-        board["tasks"] = remaining_tasks
-        await self.async_save(board)
+        next_board = dict(board)
+        next_board["tasks"] = remaining_tasks
+        await self.async_save(next_board)
         return removed_count
 
     async def async_settings(self) -> dict[str, Any]:
@@ -156,123 +794,631 @@ class HouseholdBoardStore:
     async def async_weekly_refresh(self) -> int:
         """Sunday 00:30 refresh.
 
-        Keeps only tasks with an end date, drops done/expired items,
-        and rebuilds fixed weekly tasks from templates for the new week.
+        Rolls the board forward instead of rebuilding it: tasks of past weeks,
+        done tasks of this week or older, expired tasks and expired templates
+        are retired, and only the new trailing week is loaded and expanded.
+        Tasks and occurrences of the weeks still ahead keep their ids. Weeks
+        that fell out of the window without ever being loaded are read once so
+        their done tasks reach the completion archive before the files go.
         """
-        board = await self.async_load()
+        window = self._window_weeks()
+        board = await self._async_begin_operation(None, weeks=window)
         today = dt_util.as_local(dt_util.utcnow()).date()
         current_monday = _week_start_for_day(today)
+        current_week = current_monday.isoformat()
+        current_week_number = _week_number_for_day(today)
 
-        templates = board.get("templates", [])
-        active_templates: list[dict[str, Any]] = []
-        for template in templates:
-            end_date = _parse_date(template.get("end_date"))
-            if end_date is None or end_date < today:
-                continue
-            weekdays = [day for day in template.get("weekdays", []) if day in WEEKDAY_INDEX]
-            if not weekdays:
+        retired: dict[str, Task] = {}
+        for (week, column), task_ids in self._indexes.by_week_column.items():
+            if week is None:
+                if column != "done":
+                    continue
+                # Unscheduled done tasks fall back to their locked week number.
+                task_ids = [
+                    task_id
+                    for task_id in task_ids
+                    if (week_number := self._indexes.by_id[task_id].week_number) is None
+                    or week_number <= current_week_number
+                ]
+            elif week >= current_week and (column != "done" or week > current_week):
+                # Only the weeks behind us and this week's done tasks are cleared;
+                # future-week done tasks (rare) are preserved.
                 continue
-            active_templates.append(
-                {
-                    "id": str(template.get("id") or f"tpl_{uuid4().hex[:10]}"),
-                    "title": str(template.get("title") or "Untitled task"),
-                    "assignees": [str(item) for item in template.get("assignees", [])],
-                    "end_date": end_date.isoformat(),
-                    "weekdays": weekdays,
-                    "excluded_dates": [
-                        excluded.isoformat()
-                        for excluded in (_parse_date(item) for item in template.get("excluded_dates", []))
-                        if excluded is not None
-                    ],
-                    "created_at": str(template.get("created_at") or datetime.now(UTC).isoformat()),
-                }
+            retired.update((task_id, self._indexes.by_id[task_id]) for task_id in task_ids)
+        for task in board["tasks"]:
+            if task.id not in retired and task.end_date is not None and task.end_date < today.isoformat():
+                retired[task.id] = task
+
+        expired_template_ids = [
+            template["id"]
+            for template in board["templates"]
+            if (recurrence := self._recurrence(template)) is None
+            or (recurrence.until is not None and recurrence.until < today)
+        ]
+        stale_done = await self._async_read_stale_done(window[0])
+        if not retired and not expired_template_ids and not self._shards.stale_weeks(window[0]):
+            return len(board["tasks"])
+
+        self._retire_done([*retired.values(), *stale_done])
+        touched: set[WeekColumnKey] = set()
+        for task in retired.values():
+            self._materialize(task)
+            self._indexes.remove(task)
+            touched.add(BoardIndexes.bucket_key(task))
+        board["tasks"] = [task for task in board["tasks"] if task.id not in retired]
+        expired = set(expired_template_ids)
+        board["templates"] = [template for template in board["templates"] if template["id"] not in expired]
+        changed = [task for key in sorted(touched, key=str) for task in self._densify_bucket(key)]
+        if retired or expired_template_ids:
+            await self._async_commit(
+                tasks=changed,
+                deleted_task_ids=list(retired),
+                deleted_template_ids=expired_template_ids,
+                expand=bool(expired_template_ids),
             )
-
-        kept_tasks: list[dict[str, Any]] = []
-        for task in board.get("tasks", []):
-            column = str(task.get("column") or "monday").lower()
-            if column == "backlog":
-                column = "monday"
-            task_week_number_raw = task.get("week_number")
-            task_week_number = int(task_week_number_raw) if isinstance(task_week_number_raw, int) else None
-            if column == "done":
-                # Weekly reset clears done tasks that belong to this week (or older).
-                # Future-week done tasks (rare) are preserved.
-                current_week_number = _week_number_for_day(today)
-                if task_week_number is None or task_week_number <= current_week_number:
+        # The archive must hold the stale weeks' completions before their files go.
+        await self._archive.async_flush()
+        # Weeks before the window are empty now; drop their shards without rewriting them.
+        self._shards.loaded.difference_update([week for week in self._shards.loaded if week < window[0]])
+        await self._shards.async_remove_before(window[0])
+        return len(board["tasks"])
+
+    async def _async_read_stale_done(self, before_week: str) -> list[Task]:
+        """Return the done tasks of unloaded weeks older than ``before_week``, without merging them."""
+        known_person_ids = self._known_person_ids()
+        done: list[Task] = []
+        for week in self._shards.stale_weeks(before_week):
+            for index, raw in enumerate(await self._shards.async_read_week(week)):
+                task = self._normalize_task(raw, index, known_person_ids)
+                if task is not None and task.column == "done":
+                    done.append(task)
+        return done
+
+    async def async_nightly_maintenance(self) -> dict[str, Any]:
+        """Nightly pass that keeps the hot board small between weekly refreshes.
+
+        Retires done tasks whose week ended more than ``retention_days`` ago
+        and tasks (span fragments included) whose end date is that old, drops
+        expired templates and excluded dates before the current week, and
+        closes gaps in ``order``. Ends with a flush so the journal is folded
+        into a fresh snapshot. A retention of 0 leaves tasks to the weekly refresh.
+        """
+        board = await self._async_begin_operation(None)
+        today = dt_util.as_local(dt_util.utcnow()).date()
+        current_week = _week_start_for_day(today).isoformat()
+        bytes_before = _stored_size(self._stored_board(board))
+
+        retired: dict[str, Task] = {}
+        if self._retention_days:
+            cutoff = (today - timedelta(days=self._retention_days)).isoformat()
+            for task in board["tasks"]:
+                if self._is_occurrence(task):
                     continue
-                kept_tasks.append(task)
-                continue
-
-            end_date = _parse_date(task.get("end_date"))
-            if end_date is not None and end_date < today:
-                continue
-
-            week_start = _parse_date(task.get("week_start"))
-            if column in WEEKDAY_INDEX:
-                if week_start is None:
-                    week_start = current_monday
-                # Weekly reset clears only the weeks behind us.
-                if week_start < current_monday:
+                if task.end_date is not None and task.end_date < cutoff:
+                    retired[task.id] = task
                     continue
-
-            # Fixed tasks are regenerated from template on refresh.
-            if task.get("template_id"):
+                if task.column != "done" or task.week_start is None:
+                    continue
+                week_start = _parse_date(task.week_start)
+                if week_start is not None and (week_start + timedelta(days=6)).isoformat() < cutoff:
+                    retired[task.id] = task
+
+        expired_template_ids = [
+            template["id"]
+            for template in board["templates"]
+            if (recurrence := self._recurrence(template)) is None
+            or (recurrence.until is not None and recurrence.until < today)
+        ]
+        expired = set(expired_template_ids)
+        compacted_templates: list[dict[str, Any]] = []
+        excluded_dates_removed = 0
+        for index, template in enumerate(board["templates"]):
+            if template["id"] in expired:
                 continue
+            # Occurrences are only generated from the current week on, so older exclusions are dead weight.
+            kept = [day for day in template.get("excluded_dates", []) if day >= current_week]
+            if len(kept) != len(template.get("excluded_dates", [])):
+                excluded_dates_removed += len(template["excluded_dates"]) - len(kept)
+                board["templates"][index] = {**template, "excluded_dates": kept}
+                compacted_templates.append(board["templates"][index])
+
+        self._retire_done(retired.values())
+        for task in retired.values():
+            self._indexes.remove(task)
+        if retired:
+            board["tasks"] = [task for task in board["tasks"] if task.id not in retired]
+        if expired:
+            board["templates"] = [template for template in board["templates"] if template["id"] not in expired]
+        # Every bucket is checked: gaps also come from deletes the weekly refresh never saw.
+        reordered = [task for key in list(self._indexes.by_week_column) for task in self._densify_bucket(key)]
+        if retired or expired or compacted_templates or reordered:
+            await self._async_commit(
+                tasks=[task for task in reordered if task.id not in retired],
+                templates=compacted_templates,
+                deleted_task_ids=list(retired),
+                deleted_template_ids=expired_template_ids,
+                expand=bool(expired_template_ids),
+            )
+        await self.async_flush()
+
+        bytes_after = _stored_size(self._stored_board(self._data or board))
+        self._last_maintenance = {
+            "ran_at": dt_util.utcnow().isoformat(),
+            "tasks_removed": len(retired),
+            "templates_removed": len(expired_template_ids),
+            "excluded_dates_removed": excluded_dates_removed,
+            "tasks_reordered": len(reordered),
+            "bytes_before": bytes_before,
+            "bytes_after": bytes_after,
+            "bytes_reclaimed": max(0, bytes_before - bytes_after),
+        }
+        return dict(self._last_maintenance)
 
-            normalized_task = dict(task)
-            normalized_task["week_start"] = week_start.isoformat() if week_start else None
-            if task_week_number is None and week_start is not None:
-                task_week_number = _week_number_for_day(week_start)
-            normalized_task["week_number"] = task_week_number
-            kept_tasks.append(normalized_task)
+    async def async_flush(self) -> None:
+        """Write buffered journal entries and fold the journal into a snapshot."""
+        if self._data is None:
+            return
+        await self._async_write_journal()
+        if self._journal.entry_count:
+            await self.async_compact()
+
+    async def async_compact(self) -> None:
+        """Write a full snapshot and drop the journal entries it covers."""
+        if self._data is None or self._compacting:
+            return
+        self._compacting = True
+        try:
+            revision = await self._async_write_snapshot()
+            await self._journal.async_truncate(revision)
+        finally:
+            self._compacting = False
+
+    async def _async_persist(self, entry: dict[str, Any]) -> None:
+        """Journal one change, batching appends inside the save window."""
+        self._writes_requested += 1
+        # Encode now: the entry references live records that later operations mutate.
+        self._journal_buffer.append(BoardJournal.encode(entry))
+        if self._save_delay <= 0:
+            await self._async_write_journal()
+        elif self._flush_unsub is None:
+            self._flush_unsub = async_call_later(self._hass, self._save_delay, self._async_delayed_write)
+
+    async def _async_delayed_write(self, _now: datetime) -> None:
+        self._flush_unsub = None
+        await self._async_write_journal()
+
+    async def _async_write_journal(self) -> None:
+        if self._flush_unsub is not None:
+            self._flush_unsub()
+            self._flush_unsub = None
+        if not self._journal_buffer:
+            return
+        lines, self._journal_buffer = self._journal_buffer, []
+        await self._journal.async_append(lines)
+        self._writes_performed += 1
+        if self._journal.needs_compaction:
+            await self.async_compact()
+
+    async def _async_write_snapshot(self) -> int:
+        """Write changed week shards, then the core file, and return the snapshot revision."""
+        assert self._data is not None
+        # Serialize first so operations landing during the write cannot leak into the snapshot.
+        snapshot = serialize_board(self._stored_board(self._data))
+        by_week = _group_by_week(snapshot["tasks"])
+        unscheduled = by_week.pop(None, [])
+        await self._shards.async_write(by_week)
+        # The core file goes last: its revision marks the shards above as complete.
+        snapshot["tasks"] = unscheduled
+        snapshot["weeks"] = sorted(self._shards.known)
+        await self._store.async_save(snapshot)
+        self._snapshots_written += 1
+        return _safe_int(snapshot.get("revision"), 0)
+
+    def _mark_weeks_clean(self) -> None:
+        assert self._data is not None
+        by_week = _group_by_week([task.as_dict() for task in self._stored_board(self._data)["tasks"]])
+        for week in self._shards.loaded:
+            self._shards.mark_clean(week, by_week.get(week, []))
+
+    def _merge_week(self, week: str, raw_tasks: list[dict[str, Any]]) -> None:
+        """Normalize one freshly read shard into the live board and indexes."""
+        assert self._data is not None
+        # Loading a week changes the board without a new revision.
+        self._stats_cache.clear()
+        known_person_ids = self._known_person_ids()
+        tasks: list[Task] = []
+        for index, raw in enumerate(raw_tasks):
+            task = self._normalize_task(raw, index, known_person_ids)
+            if task is not None and task.id not in self._indexes.by_id:
+                tasks.append(task)
+        tasks.sort(key=lambda task: (COLUMN_INDEX[task.column], task.order))
+        self._data["tasks"].extend(tasks)
+        self._shards.mark_clean(week, [task.as_dict() for task in tasks if week_key(task.week_start) == week])
+        for task in tasks:
+            self._indexes.add(task)
+
+    def _window_weeks(self) -> list[str]:
+        """Return the previous, current and next week loaded at startup."""
+        monday = _week_start_for_day(dt_util.as_local(dt_util.utcnow()).date())
+        return [(monday + timedelta(weeks=offset)).isoformat() for offset in (-1, 0, 1)]
+
+    def _check_expected(
+        self,
+        expected_revision: int | None,
+        expected_updated_at: str | None = None,
+    ) -> None:
+        if expected_revision is not None:
+            current_revision = self.revision
+            if expected_revision != current_revision:
+                raise BoardConflictError(
+                    f"Board changed by another client (expected revision {expected_revision}, current {current_revision})"
+                )
+            return
+        if expected_updated_at is None:
+            return
+        # Legacy clients still send the timestamp they last saw.
+        current_updated_at = str((self._data or {}).get("updated_at") or "")
+        if current_updated_at and expected_updated_at != current_updated_at:
+            raise BoardConflictError(
+                f"Board changed by another client (expected {expected_updated_at}, current {current_updated_at})"
+            )
 
-        refreshed_tasks = kept_tasks + self._build_week_tasks_from_templates(active_templates, current_monday)
-        board["templates"] = active_templates
-        board["tasks"] = refreshed_tasks
-        await self.async_save(board)
-        return len(refreshed_tasks)
+    async def _async_begin_operation(
+        self,
+        expected_revision: int | None,
+        *,
+        weeks: Iterable[str | None] = (),
+    ) -> dict[str, Any]:
+        board = await self.async_load()
+        await self.async_ensure_weeks(weeks)
+        self._check_expected(expected_revision)
+        return self._data or board
 
-    def _build_week_tasks_from_templates(
+    def _cached_stats(self, view: tuple[Any, ...], compute: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Return a derived view from the stats cache; ``view`` names it (kind, week_offset, person_id, ...)."""
+        if self._data is None:
+            return compute()
+        today = dt_util.as_local(dt_util.utcnow()).date().isoformat()
+        return self._stats_cache.get((self.revision, today, *view), compute)
+
+    def _bump_revision(self) -> None:
+        """Advance the revision counter and timestamp after a real change."""
+        assert self._data is not None
+        self._stats_cache.clear()
+        self._data["revision"] = self.revision + 1
+        self._data["updated_at"] = datetime.now(UTC).isoformat()
+
+    async def _async_commit(
         self,
-        templates: list[dict[str, Any]],
-        start_monday: date,
-    ) -> list[dict[str, Any]]:
-        generated: list[dict[str, Any]] = []
-        # Keep current week plus 3 weeks ahead pre-generated.
-        week_starts = [start_monday + timedelta(days=offset * 7) for offset in range(0, 4)]
-        for template in templates:
-            end_date = _parse_date(template["end_date"])
-            if end_date is None:
-                continue
+        *,
+        tasks: list[Task] | None = None,
+        people: list[dict[str, Any]] | None = None,
+        templates: list[dict[str, Any]] | None = None,
+        deleted_task_ids: list[str] | None = None,
+        deleted_template_ids: list[str] | None = None,
+        expand: bool = False,
+    ) -> dict[str, Any]:
+        """Journal in-place changes made by a granular operation and return them.
 
-            for week_start in week_starts:
-                for weekday in template["weekdays"]:
-                    day_date = week_start + timedelta(days=WEEKDAY_INDEX[weekday])
-                    if day_date > end_date:
-                        continue
-                    if day_date.isoformat() in set(template.get("excluded_dates", [])):
-                        continue
+        ``expand`` regenerates template occurrences first; the result then also
+        carries occurrences that appeared or changed and ids that went away.
+        """
+        assert self._data is not None
+        self._bump_revision()
+        journal_deleted = list(deleted_task_ids or [])
+        if expand:
+            added, removed = self._expand_occurrences()
+            gone = set(removed)
+            self._reindex(gone.union(task.id for task in added), {task.id: task for task in added})
+            tasks = [*(task for task in tasks or [] if task.id not in gone), *added]
+            journal_deleted.extend(removed)
+            # A deleted override may come straight back as its generated occurrence.
+            deleted_task_ids = [task_id for task_id in journal_deleted if task_id not in self._occurrences]
+        result = self._operation_result(
+            tasks=tasks,
+            people=people,
+            templates=templates,
+            deleted_task_ids=deleted_task_ids,
+            deleted_template_ids=deleted_template_ids,
+        )
+        await self._async_persist(
+            build_entry(
+                result["revision"],
+                result["updated_at"],
+                # Generated occurrences are recomputed on load; only overrides are journaled.
+                tasks=[task for task in result["tasks"] if task["id"] not in self._occurrences],
+                people=result["people"],
+                templates=result["templates"],
+                deleted_task_ids=journal_deleted,
+                deleted_template_ids=result["deleted_template_ids"],
+            )
+        )
+        await self._archive.async_flush()
+        async_dispatcher_send(self._hass, f"{SIGNAL_BOARD_UPDATED}_{self._entry_id}")
+        return result
+
+    async def _async_commit_changes(self, changes: _Changes) -> dict[str, Any]:
+        if changes.unassigned:
+            changes.extend(self._apply_auto_assign(changes.unassigned))
+        # Within a batch a task may be edited and then deleted; report only what is still on the board.
+        deleted = set(changes.deleted_task_ids)
+        tasks = [task for task in changes.tasks if task.id not in deleted or self._find_task(task.id) is task]
+        templates = list({template["id"]: template for template in changes.templates}.values())
+        return await self._async_commit(
+            tasks=tasks,
+            templates=templates,
+            deleted_task_ids=[task_id for task_id in dict.fromkeys(changes.deleted_task_ids) if self._find_task(task_id) is None],
+            expand=changes.expand,
+        )
+
+    def _operation_result(
+        self,
+        *,
+        tasks: list[Task] | None = None,
+        people: list[dict[str, Any]] | None = None,
+        templates: list[dict[str, Any]] | None = None,
+        deleted_task_ids: list[str] | None = None,
+        deleted_template_ids: list[str] | None = None,
+    ) -> dict[str, Any]:
+        unique_tasks = {task.id: task for task in tasks or []}.values()
+        return {
+            "tasks": [task.as_dict() for task in unique_tasks],
+            "people": people or [],
+            "templates": templates or [],
+            "deleted_task_ids": deleted_task_ids or [],
+            "deleted_template_ids": deleted_template_ids or [],
+            "revision": self.revision,
+            "updated_at": (self._data or {}).get("updated_at", ""),
+        }
 
-                    generated.append(
-                        asdict(
-                            Task(
-                                id=f"task_{uuid4().hex[:12]}",
-                                title=template["title"],
-                                assignees=template["assignees"],
-                                column=weekday,
-                                order=0,
-                                created_at=datetime.now(UTC).isoformat(),
-                            end_date=end_date.isoformat(),
-                            template_id=template["id"],
-                            fixed=True,
-                            week_start=week_start.isoformat(),
-                            week_number=_week_number_for_day(week_start),
-                        )
-                    )
-                    )
-
-        return generated
+    def _apply_auto_assign(self, tasks: list[Task]) -> _Changes:
+        """Give new unassigned tasks the least loaded people of their week, one plan per week."""
+        assert self._data is not None
+        current_monday = _week_start_for_day(dt_util.as_local(dt_util.utcnow()).date())
+        by_week: dict[str, set[str]] = {}
+        for task in tasks:
+            if self._find_task(task.id) is task and not task.assignees and task.week_start:
+                by_week.setdefault(task.week_start, set()).add(task.id)
+        changes = _Changes()
+        for week, task_ids in by_week.items():
+            week_offset = (date.fromisoformat(week) - current_monday).days // 7
+            plan = plan_week(
+                self._data,
+                week_stats(self._data, week_offset, indexes=self._indexes),
+                indexes=self._indexes,
+                task_ids=task_ids,
+            )
+            for assignment in plan.assignments:
+                for task_id in assignment.task_ids:
+                    changes.extend(self._apply_patch_task(task_id, {"assignees": [assignment.person_id]})[0])
+        return changes
+
+    def _template_assignee(self, template: dict[str, Any]) -> list[str]:
+        """Pick one person for all occurrences of a new template from this week's loads."""
+        assert self._data is not None
+        recurrence = Recurrence.from_template(template)
+        monday = _week_start_for_day(dt_util.as_local(dt_util.utcnow()).date())
+        units = len(recurrence.occurrences(monday, monday + timedelta(weeks=1))) if recurrence else 0
+        person_id = pick_assignee(
+            self._data,
+            week_stats(self._data, 0, indexes=self._indexes),
+            units=max(1, units),
+        )
+        return [person_id] if person_id else []
+
+    def _known_person_ids(self) -> set[str]:
+        return {person["id"] for person in (self._data or {}).get("people", [])}
+
+    def _find_task(self, task_id: str) -> Task | None:
+        return self._indexes.by_id.get(str(task_id))
+
+    def _require_task(self, task_id: str) -> Task:
+        task = self._find_task(task_id)
+        if task is None:
+            raise BoardOperationError("task_not_found", f"No task with id={task_id}")
+        return task
+
+    def _place_task(self, task: Task, order: int | None) -> list[Task]:
+        """Insert task at order within its week/column and return tasks whose order changed."""
+        key = BoardIndexes.bucket_key(task)
+        siblings = [item for item in self._indexes.bucket(key) if item is not task]
+        position = len(siblings) if order is None else max(0, min(len(siblings), int(order)))
+        siblings.insert(position, task)
+        changed = [task]
+        for index, item in enumerate(siblings):
+            if item.order != index:
+                item.order = index
+                changed.append(item)
+        self._indexes.set_bucket(key, siblings)
+        return changed
+
+    def _densify_bucket(self, key: WeekColumnKey) -> list[Task]:
+        """Reassign contiguous order values in one week/column and return tasks that moved."""
+        changed: list[Task] = []
+        for index, item in enumerate(self._indexes.bucket(key)):
+            if item.order != index:
+                item.order = index
+                changed.append(item)
+        return changed
+
+    def _materialize(self, task: Task) -> bool:
+        """Turn a generated occurrence into a stored override; return True for template tasks."""
+        if self._occurrences.get(task.id) is task:
+            del self._occurrences[task.id]
+        return task.template_id is not None
+
+    def _is_occurrence(self, task: Task) -> bool:
+        """Return True for generated occurrences, which are never written to disk."""
+        return self._occurrences.get(task.id) is task
+
+    def _track_completion(self, task: Task, was_done: bool, due: date | None) -> None:
+        """Note a task entering or leaving the done column for the completion archive."""
+        if task.column == "done" and not was_done:
+            self._archive.mark_done(task.id, due, dt_util.as_local(dt_util.utcnow()).date())
+        elif was_done and task.column != "done":
+            self._archive.mark_open(task.id)
+
+    def _track_saved_completions(
+        self, before: dict[str, Task], after: dict[str, Task], task_ids: Iterable[str]
+    ) -> None:
+        """Note completions among the tasks a full-board save touched, for the completion archive."""
+        retired: list[Task] = []
+        for task_id in task_ids:
+            old, task = before.get(task_id), after.get(task_id)
+            if task is None:
+                if old is not None:
+                    retired.append(old)
+            elif old is None:
+                self._track_completion(task, False, task_day(task))
+            elif old.column != task.column:
+                self._track_completion(task, old.column == "done", task_day(old))
+        self._retire_done(retired)
+
+    def _reindex(self, task_ids: Iterable[str], live: dict[str, Task]) -> None:
+        """Swap the index entries of ``task_ids`` for their ``live`` records instead of rebuilding."""
+        touched: set[WeekColumnKey] = set()
+        for task_id in task_ids:
+            old, task = self._indexes.by_id.get(task_id), live.get(task_id)
+            if old is task:
+                continue
+            if old is not None:
+                self._indexes.remove(old)
+                touched.add(BoardIndexes.bucket_key(old))
+            if task is not None:
+                self._indexes.add(task)
+                touched.add(BoardIndexes.bucket_key(task))
+        for key in touched:
+            self._indexes.set_bucket(key, sorted(self._indexes.bucket(key), key=lambda task: task.order))
+
+    def _retire_done(self, tasks: Iterable[Task]) -> None:
+        """Queue done tasks that leave the board for the archive; flushed on commit."""
+        today = dt_util.as_local(dt_util.utcnow()).date()
+        for task in tasks:
+            if task.column != "done":
+                continue
+            week_start = _parse_date(task.week_start)
+            # Without a recorded completion, assume the end of its week at the latest.
+            completed = min(today, week_start + timedelta(days=6)) if week_start else today
+            self._archive.retire(task.id, task.title, task.assignees, bool(task.fixed or task.template_id), completed)
+
+    def _stored_board(self, board: dict[str, Any]) -> dict[str, Any]:
+        """Return ``board`` without generated occurrences, as it is persisted."""
+        return {**board, "tasks": [task for task in board["tasks"] if not self._is_occurrence(task)]}
+
+    def _recurrence(self, template: dict[str, Any]) -> Recurrence | None:
+        """Return the compiled rule of a template, recompiling only after it was replaced."""
+        cached = self._recurrences.get(template["id"])
+        if cached is not None and cached[0] is template:
+            return cached[1]
+        recurrence = Recurrence.from_template(template)
+        self._recurrences[template["id"]] = (template, recurrence)
+        return recurrence
+
+    def _occurrence_day(self, task: Task) -> date | None:
+        """Return the template date a task stands for."""
+        split = split_occurrence_id(task.id)
+        if split is not None and split[0] == task.template_id:
+            return split[1]
+        # Boards from before on-demand expansion stored occurrences under random ids.
+        week_start = _parse_date(task.week_start)
+        if week_start is None or task.column not in WEEKDAY_INDEX:
+            return None
+        return week_start + timedelta(days=WEEKDAY_INDEX[task.column])
+
+    def _occurrence_task(self, template: dict[str, Any], recurrence: Recurrence, day: date) -> Task:
+        week_start = _week_start_for_day(day)
+        return Task(
+            id=sys.intern(occurrence_id(template["id"], day)),
+            title=template["title"],
+            assignees=list(template["assignees"]),
+            column=WEEKDAY_COLUMNS[day.weekday()],
+            order=0,
+            created_at=template["created_at"],
+            slot=template.get("slot"),
+            end_date=recurrence.until.isoformat() if recurrence.until else None,
+            template_id=sys.intern(template["id"]),
+            fixed=True,
+            week_start=sys.intern(week_start.isoformat()),
+            week_number=_week_number_for_day(week_start),
+        )
+
+    def _is_plain_occurrence(self, task: Task, template: dict[str, Any], day: date) -> bool:
+        """Return True when a stored task carries nothing its occurrence would not, position aside."""
+        recurrence = self._recurrence(template)
+        if recurrence is None or not recurrence.occurs_on(day):
+            return False
+        generated = self._occurrence_task(template, recurrence, day)
+        return replace(task, id=generated.id, order=generated.order, created_at=generated.created_at) == generated
+
+    def _expand_occurrences(self) -> tuple[list[Task], list[str]]:
+        """Regenerate template occurrences for the loaded weeks from the current one on.
+
+        Stored tasks with a template_id are overrides of one occurrence (moved,
+        reordered, completed, reassigned) and suppress it; stored tasks identical
+        to their occurrence, at the position it would be generated at, are
+        folded back into it. Returns the occurrences that are new or changed and
+        the ids that disappeared.
+        """
+        assert self._data is not None
+        templates = {template["id"]: template for template in self._data["templates"]}
+        current_monday = _week_start_for_day(dt_util.as_local(dt_util.utcnow()).date())
+        previous = self._occurrences
+        stored: list[Task] = []
+        dropped: list[str] = []
+        overridden: set[tuple[str, date]] = set()
+        plain: dict[tuple[str, date], Task] = {}
+        next_order: dict[WeekColumnKey, int] = {}
+        for task in self._data["tasks"]:
+            if previous.get(task.id) is task:
+                continue
+            template = templates.get(task.template_id) if task.template_id else None
+            day = self._occurrence_day(task) if template is not None else None
+            if day is not None:
+                if day >= current_monday and self._is_plain_occurrence(task, template, day):
+                    # Folded back below unless it was reordered away from its generated position.
+                    plain.setdefault((template["id"], day), task)
+                    continue
+                overridden.add((template["id"], day))
+            stored.append(task)
+            key = BoardIndexes.bucket_key(task)
+            next_order[key] = max(next_order.get(key, 0), task.order + 1)
+
+        occurrences: dict[str, Task] = {}
+        changed: list[Task] = []
+        for week in sorted(week for week in self._shards.loaded if week >= current_monday.isoformat()):
+            monday = date.fromisoformat(week)
+            for template in self._data["templates"]:
+                recurrence = self._recurrence(template)
+                if recurrence is None:
+                    continue
+                for day in recurrence.occurrences(monday, monday + timedelta(weeks=1)):
+                    if (template["id"], day) in overridden:
+                        continue
+                    task = self._occurrence_task(template, recurrence, day)
+                    key = BoardIndexes.bucket_key(task)
+                    task.order = next_order.get(key, 0)
+                    kept = plain.pop((template["id"], day), None)
+                    if kept is not None:
+                        if kept.order != task.order:
+                            stored.append(kept)
+                            next_order[key] = max(next_order.get(key, 0), kept.order + 1)
+                            continue
+                        dropped.append(kept.id)
+                    next_order[key] = task.order + 1
+                    if previous.get(task.id) == task:
+                        task = previous[task.id]
+                    else:
+                        changed.append(task)
+                    occurrences[task.id] = task
+
+        # Plain tasks whose date no loaded week generates stay as they are.
+        stored.extend(plain.values())
+        self._data["tasks"] = [*stored, *occurrences.values()]
+        self._occurrences = occurrences
+        for template_id in self._recurrences.keys() - templates.keys():
+            del self._recurrences[template_id]
+        removed = [task_id for task_id in [*previous, *dropped] if task_id not in occurrences]
+        return changed, removed
 
     def _default_board(self) -> dict[str, Any]:
         people = [
@@ -294,7 +1440,7 @@ class HouseholdBoardStore:
                     column=WEEKDAY_COLUMNS[index % len(WEEKDAY_COLUMNS)],
                     order=index,
                     created_at=created,
-                    week_start=current_monday,
+                    week_start=sys.intern(current_monday),
                     week_number=_week_number_for_day(current_monday_date),
                 )
             )
@@ -302,9 +1448,10 @@ class HouseholdBoardStore:
         return {
             "schema_version": BOARD_SCHEMA_VERSION,
             "people": [asdict(person) for person in people],
-            "tasks": [asdict(task) for task in tasks],
+            "tasks": tasks,
             "templates": [],
             "settings": self._default_settings(),
+            "revision": 0,
             "updated_at": created,
         }
 
@@ -340,12 +1487,19 @@ class HouseholdBoardStore:
             "onboarding_dismissed": False,
         }
 
-    def _normalize_board(self, board: dict[str, Any]) -> dict[str, Any]:
-        schema_version_raw = board.get("schema_version") if isinstance(board, dict) else None
-        try:
-            schema_version = int(schema_version_raw) if schema_version_raw is not None else 0
-        except (TypeError, ValueError):
-            schema_version = 0
+    def _normalize_board(
+        self,
+        board: dict[str, Any],
+        previous: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], set[str]]:
+        """Normalize a board payload and return it with the ids of the tasks it changed.
+
+        When ``previous`` is the current in-memory board, records that are
+        unchanged against it are reused as-is and only columns that actually
+        changed get their order values reassigned. The returned ids cover tasks
+        that were added, replaced or dropped relative to ``previous``.
+        """
+        source_meta = previous if previous is not None else (board if isinstance(board, dict) else {})
 
         people = board.get("people", []) if isinstance(board, dict) else []
         tasks = board.get("tasks", []) if isinstance(board, dict) else []
@@ -358,125 +1512,100 @@ class HouseholdBoardStore:
         for person in people:
             if not isinstance(person, dict):
                 continue
-            person_id = str(person.get("id") or f"person_{uuid4().hex[:10]}")
-            if person_id in known_person_ids:
+            normalized_person = self._normalize_person(person, len(normalized_people))
+            if normalized_person["id"] in known_person_ids:
                 continue
-            known_person_ids.add(person_id)
-            name = str(person.get("name") or "Person").strip() or "Person"
-            color = str(person.get("color") or DEFAULT_COLORS[len(normalized_people) % len(DEFAULT_COLORS)])
-            role_raw = str(person.get("role") or "adult").lower()
-            role = role_raw if role_raw in {"adult", "child"} else "adult"
-            avatar_raw = str(person.get("avatar") or "").lower()
-            if avatar_raw not in {"adult_man", "adult_woman", "child_boy", "child_girl"}:
-                avatar_raw = "child_boy" if role == "child" else "adult_man"
-            normalized_people.append(
-                {"id": person_id, "name": name, "color": color, "role": role, "avatar": avatar_raw}
-            )
+            known_person_ids.add(normalized_person["id"])
+            normalized_people.append(normalized_person)
+
+        # Reuse is only safe while every previously known person still exists,
+        # otherwise unchanged records could keep a dangling assignee.
+        previous_people = previous.get("people", []) if isinstance(previous, dict) else None
+        reuse = previous_people is not None and all(person["id"] in known_person_ids for person in previous_people)
+        previous_templates = {item["id"]: item for item in previous.get("templates", [])} if reuse else {}
+        previous_tasks: dict[str, Task] = {item.id: item for item in previous.get("tasks", [])} if reuse else {}
 
         normalized_templates: list[dict[str, Any]] = []
         for template in templates:
             if not isinstance(template, dict):
                 continue
-            title = str(template.get("title") or "Untitled task").strip()
-            if not title:
+            current_template = previous_templates.get(str(template.get("id") or ""))
+            if current_template is not None and _record_unchanged(template, current_template):
+                normalized_templates.append(current_template)
                 continue
-
-            template_id = str(template.get("id") or f"tpl_{uuid4().hex[:10]}")
-            assignees = [str(item) for item in template.get("assignees", []) if str(item) in known_person_ids]
-            end_date = _parse_date(template.get("end_date"))
-            weekdays = [day for day in template.get("weekdays", []) if day in WEEKDAY_INDEX]
-            if end_date is None or not weekdays:
-                continue
-            excluded_dates = [
-                excluded.isoformat()
-                for excluded in (_parse_date(item) for item in template.get("excluded_dates", []))
-                if excluded is not None
-            ]
-
-            normalized_templates.append(
-                {
-                    "id": template_id,
-                    "title": title,
-                    "assignees": assignees,
-                    "end_date": end_date.isoformat(),
-                    "weekdays": weekdays,
-                    "excluded_dates": sorted(set(excluded_dates)),
-                    "created_at": str(template.get("created_at") or datetime.now(UTC).isoformat()),
-                }
-            )
-
-        normalized_tasks: list[dict[str, Any]] = []
+            normalized_template = self._normalize_template(template, known_person_ids)
+            if normalized_template is not None:
+                normalized_templates.append(normalized_template)
+
+        buckets: dict[WeekColumnKey, list[Task]] = {}
+        dirty_buckets: set[WeekColumnKey] = set()
+        seen_task_ids: set[str] = set()
+        changed_ids: set[str] = set()
         for index, task in enumerate(tasks):
-            if not isinstance(task, dict):
+            if isinstance(task, Task):
+                # Internal callers hand back live records; untouched ones are reused below.
+                current_task = previous_tasks.get(task.id)
+                if current_task is not task:
+                    task = task.as_dict()
+            elif isinstance(task, dict):
+                current_task = previous_tasks.get(str(task.get("id") or ""))
+            else:
                 continue
-            title = str(task.get("title") or "Untitled task").strip()
-            if not title:
+            if current_task is not None and _record_unchanged(task, current_task):
+                buckets.setdefault(BoardIndexes.bucket_key(current_task), []).append(current_task)
+                seen_task_ids.add(current_task.id)
                 continue
+            normalized_task = self._normalize_task(task, index, known_person_ids)
+            if normalized_task is None:
+                continue
+            key = BoardIndexes.bucket_key(normalized_task)
+            buckets.setdefault(key, []).append(normalized_task)
+            seen_task_ids.add(normalized_task.id)
+            changed_ids.add(normalized_task.id)
+            dirty_buckets.add(key)
+            if current_task is not None:
+                dirty_buckets.add(BoardIndexes.bucket_key(current_task))
+        for task_id, current_task in previous_tasks.items():
+            if task_id not in seen_task_ids:
+                dirty_buckets.add(BoardIndexes.bucket_key(current_task))
+                changed_ids.add(task_id)
+        if not reuse:
+            dirty_buckets = set(buckets)
+            if isinstance(previous, dict):
+                changed_ids.update(task.id for task in previous.get("tasks", []))
+
+        # Reassign stable order values per week/column, only where this write touched them.
+        # Reused records are shared with the previous board, so copy before renumbering.
+        normalized_tasks: list[Task] = []
+        for key in sorted(buckets, key=lambda item: (COLUMN_INDEX[item[1]], item[0] or "")):
+            bucket_items = buckets[key]
+            if key in dirty_buckets:
+                bucket_items.sort(key=lambda item: item.order)
+                for order, item in enumerate(bucket_items):
+                    if item.order != order:
+                        bucket_items[order] = replace(item, order=order)
+                        changed_ids.add(item.id)
+            normalized_tasks.extend(bucket_items)
+
+        previous_settings = previous.get("settings") if isinstance(previous, dict) else None
+        if previous_settings is not None and raw_settings == previous_settings:
+            settings = previous_settings
+        else:
+            settings = self._normalize_settings(raw_settings)
+
+        normalized = {
+            "schema_version": BOARD_SCHEMA_VERSION,
+            "people": normalized_people,
+            "tasks": normalized_tasks,
+            "templates": normalized_templates,
+            "settings": settings,
+            # The store owns the revision; client payloads cannot move it.
+            "revision": max(0, _safe_int(source_meta.get("revision"), 0)),
+            "updated_at": str(source_meta.get("updated_at") or datetime.now(UTC).isoformat()),
+        }
+        return normalized, changed_ids
 
-            column = str(task.get("column") or "monday").lower()
-            if column == "backlog":
-                column = "monday"
-            if column not in ALL_COLUMNS:
-                column = "monday"
-
-            task_id = str(task.get("id") or f"task_{uuid4().hex[:12]}")
-            assignees_raw = task.get("assignees", [])
-            if isinstance(assignees_raw, list):
-                assignees = [str(item) for item in assignees_raw if str(item) in known_person_ids]
-            else:
-                assignees = []
-
-            order = int(task.get("order", index))
-            created_at = str(task.get("created_at") or datetime.now(UTC).isoformat())
-            slot_raw = str(task.get("slot") or "").strip().lower()
-            slot = slot_raw if slot_raw in {"am", "pm"} else None
-            end_date = _parse_date(task.get("end_date"))
-            template_id = str(task.get("template_id")) if task.get("template_id") else None
-            fixed = bool(task.get("fixed", False))
-            span_id = str(task.get("span_id")) if task.get("span_id") else None
-            span_index_raw = task.get("span_index")
-            span_total_raw = task.get("span_total")
-            span_index = int(span_index_raw) if isinstance(span_index_raw, int) and span_index_raw >= 0 else 0
-            span_total = int(span_total_raw) if isinstance(span_total_raw, int) and span_total_raw >= 0 else 0
-            week_start = _parse_date(task.get("week_start"))
-            if column in WEEKDAY_INDEX and week_start is None:
-                week_start = _week_start_for_day(dt_util.as_local(dt_util.utcnow()).date())
-            # Ensure week_start is always Monday for week-bound tasks (fixes timezone/legacy drift).
-            if column in WEEKDAY_INDEX and week_start is not None:
-                week_start = _week_start_for_day(week_start)
-            week_number_raw = task.get("week_number")
-            week_number = int(week_number_raw) if isinstance(week_number_raw, int) else None
-            if week_number is None and week_start is not None:
-                week_number = _week_number_for_day(week_start)
-
-            normalized_tasks.append(
-                {
-                    "id": task_id,
-                    "title": title,
-                    "assignees": assignees,
-                    "column": column,
-                    "order": order,
-                    "created_at": created_at,
-                    "slot": slot,
-                    "end_date": end_date.isoformat() if end_date else None,
-                    "template_id": template_id,
-                    "fixed": fixed,
-                    "span_id": span_id,
-                    "span_index": span_index,
-                    "span_total": span_total,
-                    "week_start": week_start.isoformat() if week_start else None,
-                    "week_number": week_number,
-                }
-            )
-
-        normalized_tasks.sort(key=lambda item: (ALL_COLUMNS.index(item["column"]), item["order"]))
-
-        # Reassign stable order values by column after drag-and-drop writes.
-        for column in ALL_COLUMNS:
-            column_items = [item for item in normalized_tasks if item["column"] == column]
-            for order, item in enumerate(column_items):
-                item["order"] = order
-
+    def _normalize_settings(self, raw_settings: Any) -> dict[str, Any]:
         default_settings = self._default_settings()
         raw_labels = raw_settings.get("labels", {}) if isinstance(raw_settings, dict) else {}
         labels = default_settings["labels"] | {
@@ -516,16 +1645,165 @@ class HouseholdBoardStore:
         }
         if settings["theme"] not in {"light", "dark", "colorful"}:
             settings["theme"] = default_settings["theme"]
+        return settings
+
+    def _normalize_person(self, person: dict[str, Any], index: int) -> dict[str, Any]:
+        person_id = str(person.get("id") or f"person_{uuid4().hex[:10]}")
+        name = str(person.get("name") or "Person").strip() or "Person"
+        color = str(person.get("color") or DEFAULT_COLORS[index % len(DEFAULT_COLORS)])
+        role_raw = str(person.get("role") or "adult").lower()
+        role = role_raw if role_raw in {"adult", "child"} else "adult"
+        avatar_raw = str(person.get("avatar") or "").lower()
+        if avatar_raw not in {"adult_man", "adult_woman", "child_boy", "child_girl"}:
+            avatar_raw = "child_boy" if role == "child" else "adult_man"
+        return {"id": person_id, "name": name, "color": color, "role": role, "avatar": avatar_raw}
+
+    def _normalize_template(self, template: dict[str, Any], known_person_ids: set[str]) -> dict[str, Any] | None:
+        title = str(template.get("title") or "Untitled task").strip()
+        if not title:
+            return None
+
+        template_id = str(template.get("id") or f"tpl_{uuid4().hex[:10]}")
+        assignees = [str(item) for item in template.get("assignees", []) if str(item) in known_person_ids]
+        frequency = str(template.get("frequency") or "weekly").lower()
+        end_date = _parse_date(template.get("end_date"))
+        count = _safe_int(template.get("count"), 0)
+        weekdays = [day for day in template.get("weekdays", []) if day in WEEKDAY_INDEX]
+        month_days_raw = template.get("month_days") if isinstance(template.get("month_days"), list) else []
+        month_days = sorted({day for day in (_safe_int(item, 0) for item in month_days_raw) if 0 < abs(day) <= 31})
+        nth_raw = template.get("nth_weekdays") if isinstance(template.get("nth_weekdays"), list) else []
+        nth_weekdays = [
+            {"weekday": str(item.get("weekday")), "nth": _safe_int(item.get("nth"), 0)}
+            for item in nth_raw
+            if isinstance(item, dict) and item.get("weekday") in WEEKDAY_INDEX and 0 < abs(_safe_int(item.get("nth"), 0)) <= 5
+        ]
+        if frequency not in FREQUENCIES or (end_date is None and count <= 0):
+            return None
+        if frequency == "weekly" and not weekdays:
+            return None
+        start_date = _parse_date(template.get("start_date"))
+        excluded_dates = [
+            excluded.isoformat()
+            for excluded in (_parse_date(item) for item in template.get("excluded_dates", []))
+            if excluded is not None
+        ]
+        slot_raw = str(template.get("slot") or "").strip().lower()
 
         return {
-            "schema_version": BOARD_SCHEMA_VERSION,
-            "people": normalized_people,
-            "tasks": normalized_tasks,
-            "templates": normalized_templates,
-            "settings": settings,
-            "updated_at": datetime.now(UTC).isoformat(),
+            "id": template_id,
+            "title": title,
+            "assignees": assignees,
+            "end_date": end_date.isoformat() if end_date else None,
+            "weekdays": weekdays,
+            "excluded_dates": sorted(set(excluded_dates)),
+            "created_at": str(template.get("created_at") or datetime.now(UTC).isoformat()),
+            "slot": slot_raw if slot_raw in {"am", "pm"} else None,
+            "frequency": frequency,
+            "interval": max(1, min(99, _safe_int(template.get("interval"), 1))),
+            "start_date": start_date.isoformat() if start_date else None,
+            "count": count if count > 0 else None,
+            "month_days": month_days if frequency == "monthly" else [],
+            "nth_weekdays": nth_weekdays if frequency == "monthly" else [],
         }
 
+    def _normalize_task(self, task: dict[str, Any], index: int, known_person_ids: set[str]) -> Task | None:
+        title = str(task.get("title") or "Untitled task").strip()
+        if not title:
+            return None
+
+        column = COLUMN_NAMES.get(str(task.get("column") or "monday").lower(), "monday")
+
+        task_id = sys.intern(str(task.get("id") or f"task_{uuid4().hex[:12]}"))
+        assignees_raw = task.get("assignees", [])
+        if isinstance(assignees_raw, list):
+            assignees = [sys.intern(str(item)) for item in assignees_raw if str(item) in known_person_ids]
+        else:
+            assignees = []
+
+        order = int(task.get("order", index))
+        created_at = str(task.get("created_at") or datetime.now(UTC).isoformat())
+        slot_raw = str(task.get("slot") or "").strip().lower()
+        slot = slot_raw if slot_raw in {"am", "pm"} else None
+        end_date = _parse_date(task.get("end_date"))
+        template_id = sys.intern(str(task.get("template_id"))) if task.get("template_id") else None
+        fixed = bool(task.get("fixed", False))
+        span_id = sys.intern(str(task.get("span_id"))) if task.get("span_id") else None
+        span_index_raw = task.get("span_index")
+        span_total_raw = task.get("span_total")
+        span_index = int(span_index_raw) if isinstance(span_index_raw, int) and span_index_raw >= 0 else 0
+        span_total = int(span_total_raw) if isinstance(span_total_raw, int) and span_total_raw >= 0 else 0
+        week_start = _parse_date(task.get("week_start"))
+        if column in WEEKDAY_INDEX and week_start is None:
+            week_start = _week_start_for_day(dt_util.as_local(dt_util.utcnow()).date())
+        # Week-bound tasks are keyed by their Monday; stored data is aligned by the migrations.
+        if column in WEEKDAY_INDEX and week_start is not None and week_start.weekday():
+            week_start = _week_start_for_day(week_start)
+        week_number_raw = task.get("week_number")
+        week_number = int(week_number_raw) if isinstance(week_number_raw, int) else None
+        if week_number is None and week_start is not None:
+            week_number = _week_number_for_day(week_start)
+
+        return Task(
+            id=task_id,
+            title=title,
+            assignees=assignees,
+            column=column,
+            order=order,
+            created_at=created_at,
+            slot=slot,
+            end_date=end_date.isoformat() if end_date else None,
+            template_id=template_id,
+            fixed=fixed,
+            span_id=span_id,
+            span_index=span_index,
+            span_total=span_total,
+            week_start=sys.intern(week_start.isoformat()) if week_start else None,
+            week_number=week_number,
+        )
+
+
+def _record_unchanged(raw: dict[str, Any] | Task, current: dict[str, Any] | Task) -> bool:
+    """Return True when a raw record normalizes to the current one.
+
+    Clients send empty strings where the store keeps None, so treat those as equal.
+    """
+    if raw is current:
+        return True
+    if isinstance(raw, Task):
+        return False
+    if isinstance(current, Task):
+        values = _task_values(current)
+        # Echoed records usually match field for field; compare them in one go first.
+        if tuple(map(raw.get, TASK_FIELDS)) == values:
+            return True
+        items = zip(TASK_FIELDS, values)
+    else:
+        items = current.items()
+    for key, value in items:
+        incoming = raw.get(key)
+        if incoming == value:
+            continue
+        if value is None and incoming == "":
+            continue
+        return False
+    return True
+
+
+def _stored_size(board: dict[str, Any]) -> int:
+    """Return the encoded size in bytes of a board as it is written to disk."""
+    return len(BoardJournal.encode(board).encode())
+
+
+def _task_week(task: dict[str, Any] | Task) -> str | None:
+    return week_key(task.week_start if isinstance(task, Task) else task.get("week_start"))
+
+
+def _group_by_week(tasks: list[dict[str, Any]]) -> dict[str | None, list[dict[str, Any]]]:
+    grouped: dict[str | None, list[dict[str, Any]]] = {}
+    for task in tasks:
+        grouped.setdefault(_task_week(task), []).append(task)
+    return grouped
+
 
 def _parse_date(value: Any) -> date | None:
     """Parse date input from UI/state into a date."""
@@ -559,3 +1837,11 @@ def _safe_int(value: Any, default: int) -> int:
 
 class BoardConflictError(RuntimeError):
     """Raised when board save revision is stale."""
+
+
+class BoardOperationError(RuntimeError):
+    """Raised when a granular board operation cannot be applied."""
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
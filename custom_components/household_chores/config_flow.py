@@ -11,17 +11,23 @@ from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
 
 from .const import (
+    CONF_AUTO_ASSIGN,
     CONF_CHORES,
     CONF_MEMBERS,
     CONF_REFRESH_HOUR,
     CONF_REFRESH_MINUTE,
     CONF_REFRESH_WEEKDAY,
+    CONF_RETENTION_DAYS,
+    CONF_SAVE_DELAY,
+    DEFAULT_AUTO_ASSIGN,
     DEFAULT_CHORES,
     DEFAULT_MEMBERS,
     DEFAULT_NAME,
     DEFAULT_REFRESH_HOUR,
     DEFAULT_REFRESH_MINUTE,
     DEFAULT_REFRESH_WEEKDAY,
+    DEFAULT_RETENTION_DAYS,
+    DEFAULT_SAVE_DELAY,
     DOMAIN,
 )
 
@@ -130,6 +136,9 @@ class HouseholdChoresOptionsFlow(config_entries.OptionsFlow):
                         CONF_REFRESH_WEEKDAY: int(user_input[CONF_REFRESH_WEEKDAY]),
                         CONF_REFRESH_HOUR: int(user_input[CONF_REFRESH_HOUR]),
                         CONF_REFRESH_MINUTE: int(user_input[CONF_REFRESH_MINUTE]),
+                        CONF_SAVE_DELAY: int(user_input[CONF_SAVE_DELAY]),
+                        CONF_RETENTION_DAYS: int(user_input[CONF_RETENTION_DAYS]),
+                        CONF_AUTO_ASSIGN: bool(user_input[CONF_AUTO_ASSIGN]),
                     },
                 )
 
@@ -164,6 +173,25 @@ class HouseholdChoresOptionsFlow(config_entries.OptionsFlow):
             )
         )
 
+        current_save_delay = int(
+            self.config_entry.options.get(
+                CONF_SAVE_DELAY,
+                self.config_entry.data.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
+            )
+        )
+        current_retention_days = int(
+            self.config_entry.options.get(
+                CONF_RETENTION_DAYS,
+                self.config_entry.data.get(CONF_RETENTION_DAYS, DEFAULT_RETENTION_DAYS),
+            )
+        )
+        current_auto_assign = bool(
+            self.config_entry.options.get(
+                CONF_AUTO_ASSIGN,
+                self.config_entry.data.get(CONF_AUTO_ASSIGN, DEFAULT_AUTO_ASSIGN),
+            )
+        )
+
         schema = vol.Schema(
             {
                 vol.Required(CONF_NAME, default=current_name): str,
@@ -178,6 +206,15 @@ class HouseholdChoresOptionsFlow(config_entries.OptionsFlow):
                     vol.Coerce(int),
                     vol.Range(min=0, max=59),
                 ),
+                vol.Required(CONF_SAVE_DELAY, default=current_save_delay): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0, max=300),
+                ),
+                vol.Required(CONF_RETENTION_DAYS, default=current_retention_days): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=0, max=365),
+                ),
+                vol.Required(CONF_AUTO_ASSIGN, default=current_auto_assign): bool,
             }
         )
 
@@ -12,6 +12,9 @@ CONF_CHORES = "chores"
 CONF_REFRESH_WEEKDAY = "refresh_weekday"
 CONF_REFRESH_HOUR = "refresh_hour"
 CONF_REFRESH_MINUTE = "refresh_minute"
+CONF_SAVE_DELAY = "save_delay"
+CONF_RETENTION_DAYS = "retention_days"
+CONF_AUTO_ASSIGN = "auto_assign"
 
 DEFAULT_NAME = "Household Chores"
 DEFAULT_MEMBERS = ["Alex", "Sam"]
@@ -26,5 +29,8 @@ DEFAULT_CHORE_TIME = time(hour=18, minute=0)
 DEFAULT_REFRESH_WEEKDAY = 6
 DEFAULT_REFRESH_HOUR = 0
 DEFAULT_REFRESH_MINUTE = 30
+DEFAULT_SAVE_DELAY = 10
+DEFAULT_RETENTION_DAYS = 7
+DEFAULT_AUTO_ASSIGN = False
 
 SIGNAL_BOARD_UPDATED = f"{DOMAIN}_board_updated"
@@ -39,7 +39,8 @@ class HouseholdChoresCard extends HTMLElement {
     this._dataImportText = "";
     this._dataImportError = "";
     this._lastSyncedBoard = null;
-    this._lastSeenBoardUpdatedAt = "";
+    this._loadedWeeks = null;
+    this._lastSeenBoardRevision = "";
     this._reloadInFlight = false;
     this._newQuickTemplateName = "";
     this._personColorSaveTimer = null;
@@ -425,6 +426,27 @@ class HouseholdChoresCard extends HTMLElement {
   _shiftWeek(delta) {
     this._weekOffset = Math.min(this._maxWeekOffset, Math.max(0, this._weekOffset + delta));
     this._render();
+    this._ensureWeekLoaded();
+  }
+
+  async _ensureWeekLoaded(offset = this._weekOffset) {
+    // The backend only keeps nearby weeks in memory; ask for others on demand.
+    if (!Array.isArray(this._loadedWeeks) || this._loadedWeeks.includes(this._weekStartIso(offset))) return;
+    if (this._reloadInFlight || this._saving) return;
+    this._reloadInFlight = true;
+    try {
+      await this._loadBoard();
+    } finally {
+      this._reloadInFlight = false;
+    }
+  }
+
+  _setLoadedWeeks(result) {
+    this._loadedWeeks = Array.isArray(result?.loaded_weeks) ? result.loaded_weeks.map(String) : this._loadedWeeks;
+  }
+
+  _loadedWeeksPayload() {
+    return Array.isArray(this._loadedWeeks) ? { weeks: this._loadedWeeks } : {};
   }
 
   _onWeekTouchStart(ev) {
@@ -515,6 +537,7 @@ class HouseholdChoresCard extends HTMLElement {
           weekdays: Array.isArray(tpl.weekdays) ? tpl.weekdays : [],
           excluded_dates: Array.isArray(tpl.excluded_dates) ? tpl.excluded_dates : [],
           created_at: tpl.created_at || new Date().toISOString(),
+          ...this._templateRuleFields(tpl),
         }))
         .filter((tpl) => tpl.title),
       settings: {
@@ -541,6 +564,7 @@ class HouseholdChoresCard extends HTMLElement {
         show_quick_templates: Boolean(settings.show_quick_templates),
         show_swipe_hint: Boolean(settings.show_swipe_hint),
       },
+      revision: Math.max(0, Number.parseInt(board?.revision, 10) || 0),
       updated_at: String(board?.updated_at || ""),
     };
   }
@@ -608,8 +632,10 @@ class HouseholdChoresCard extends HTMLElement {
       tasks: this._mergeCollectionById(remote.tasks, local.tasks, base.tasks),
       templates: this._mergeCollectionById(remote.templates, local.templates, base.templates),
       settings: this._deepEqual(local.settings, base.settings) ? remote.settings : local.settings,
+      revision: remote.revision,
       updated_at: remote.updated_at,
     });
+    merged.revision = remote.revision;
     merged.updated_at = remote.updated_at;
     return merged;
   }
@@ -721,10 +747,15 @@ class HouseholdChoresCard extends HTMLElement {
     this._render();
 
     try {
-      const result = await this._callBoardWs({ type: "household_chores/get_board", entry_id: this._config.entry_id });
+      const result = await this._callBoardWs({
+        type: "household_chores/get_board",
+        entry_id: this._config.entry_id,
+        ...(this._weekOffset ? { week_offset: this._weekOffset } : {}),
+      });
+      this._setLoadedWeeks(result);
       this._board = this._normalizeBoard(result.board || { people: [], tasks: [], templates: [] });
       this._lastSyncedBoard = this._snapshotBoard();
-      this._lastSeenBoardUpdatedAt = String(this._board?.updated_at || this._lastSeenBoardUpdatedAt || "");
+      this._markBoardRevisionSeen();
       this._setPersonFilter(this._personFilter);
       this._error = "";
     } catch (err) {
@@ -734,7 +765,7 @@ class HouseholdChoresCard extends HTMLElement {
         if (fallbackBoard) {
           this._board = this._normalizeBoard(fallbackBoard);
           this._lastSyncedBoard = this._snapshotBoard();
-          this._lastSeenBoardUpdatedAt = String(this._board?.updated_at || this._lastSeenBoardUpdatedAt || "");
+          this._markBoardRevisionSeen();
           this._setPersonFilter(this._personFilter);
           this._error = "";
         } else {
@@ -765,17 +796,21 @@ class HouseholdChoresCard extends HTMLElement {
     return null;
   }
 
+  _markBoardRevisionSeen() {
+    if (this._board) this._lastSeenBoardRevision = String(this._board.revision ?? this._lastSeenBoardRevision ?? "");
+  }
+
   async _maybeRefreshFromExternalBoardUpdate() {
     if (this._reloadInFlight || this._saving || this._showTaskModal || this._showPeopleModal || this._showSettingsModal) return;
     const state = this._findBoardStateEntity();
-    const updatedAt = String(state?.state || state?.attributes?.board?.updated_at || "");
-    if (!updatedAt) return;
-    if (!this._lastSeenBoardUpdatedAt) {
-      this._lastSeenBoardUpdatedAt = updatedAt;
+    const revision = String(state?.state ?? state?.attributes?.board?.revision ?? "");
+    if (!revision || revision === "unknown" || revision === "unavailable") return;
+    if (!this._lastSeenBoardRevision) {
+      this._lastSeenBoardRevision = revision;
       return;
     }
-    if (updatedAt === this._lastSeenBoardUpdatedAt) return;
-    this._lastSeenBoardUpdatedAt = updatedAt;
+    if (revision === this._lastSeenBoardRevision) return;
+    this._lastSeenBoardRevision = revision;
     this._reloadInFlight = true;
     try {
       await this._loadBoard();
@@ -796,20 +831,144 @@ class HouseholdChoresCard extends HTMLElement {
     return board;
   }
 
+  _boardOps(base, next) {
+    // Express the local edit as granular ops; null means "send the whole board".
+    if (!base || !next) return null;
+    if (!this._deepEqual(base.settings, next.settings)) return null;
+    const ops = [];
+    const collect = (baseItems, nextItems, buildUpsert) => {
+      const baseMap = this._mapById(baseItems);
+      const nextMap = this._mapById(nextItems);
+      for (const id of baseMap.keys()) {
+        if (!nextMap.has(id)) return false;
+      }
+      for (const [id, item] of nextMap) {
+        if (!this._deepEqual(baseMap.get(id), item)) ops.push(buildUpsert(item));
+      }
+      return true;
+    };
+    if (!collect(base.people, next.people, (person) => ({ type: "household_chores/upsert_person", person }))) return null;
+    if (!collect(base.templates, next.templates, (template) => ({ type: "household_chores/upsert_template", template }))) return null;
+
+    const positionKeys = new Set(["column", "week_start", "week_number", "order"]);
+    const baseTasks = this._mapById(base.tasks);
+    const nextTasks = this._mapById(next.tasks);
+    // A reorder inside a column has no granular op here; let the whole board carry it.
+    if (this._reorderedWithinColumn(baseTasks, nextTasks)) return null;
+    for (const id of baseTasks.keys()) {
+      if (!nextTasks.has(id)) ops.push({ type: "household_chores/delete_task", task_id: id });
+    }
+    for (const [id, task] of nextTasks) {
+      const previous = baseTasks.get(id);
+      if (!previous) {
+        ops.push({ type: "household_chores/add_task", task });
+        continue;
+      }
+      if (previous.column !== task.column || previous.week_start !== task.week_start) {
+        ops.push({ type: "household_chores/move_task", task_id: id, column: task.column, week_start: task.week_start, order: task.order });
+      }
+      const changes = {};
+      for (const [key, value] of Object.entries(task)) {
+        if (positionKeys.has(key)) continue;
+        if (!this._deepEqual(previous[key], value)) changes[key] = value;
+      }
+      // Remaining order-only differences come from local reindexing; the backend re-densifies itself.
+      if (Object.keys(changes).length) ops.push({ type: "household_chores/patch_task", task_id: id, changes });
+    }
+    return ops.length <= 25 ? ops : null;
+  }
+
+  _reorderedWithinColumn(baseTasks, nextTasks) {
+    // Compare the order of tasks that stayed in the same week/column; reindexing after a move keeps it.
+    const stays = (task, other) => other && other.column === task.column && other.week_start === task.week_start;
+    const sequences = (tasks, others) => {
+      const buckets = new Map();
+      const sorted = [...tasks.values()].sort((a, b) => (Number(a.order) || 0) - (Number(b.order) || 0));
+      for (const task of sorted) {
+        if (!stays(task, others.get(String(task.id)))) continue;
+        const key = `${task.week_start || ""}|${task.column}`;
+        if (!buckets.has(key)) buckets.set(key, []);
+        buckets.get(key).push(String(task.id));
+      }
+      return buckets;
+    };
+    const before = sequences(baseTasks, nextTasks);
+    const after = sequences(nextTasks, baseTasks);
+    for (const [key, ids] of before) {
+      if (!this._deepEqual(ids, after.get(key))) return true;
+    }
+    return false;
+  }
+
+  _applyBoardOpResult(result) {
+    const replaceById = (items, updates) => {
+      if (!Array.isArray(updates) || !updates.length) return items;
+      const byId = this._mapById(updates);
+      return items.map((item) => byId.get(String(item.id)) || item);
+    };
+    const deleted = new Set(Array.isArray(result?.deleted_task_ids) ? result.deleted_task_ids : []);
+    // Template edits can bring new generated occurrences along.
+    const knownTaskIds = new Set(this._board.tasks.map((task) => String(task.id)));
+    const addedTasks = (Array.isArray(result?.tasks) ? result.tasks : []).filter((task) => !knownTaskIds.has(String(task.id)));
+    this._board = this._normalizeBoard({
+      ...this._board,
+      people: replaceById(this._board.people, result?.people),
+      templates: replaceById(this._board.templates, result?.templates),
+      tasks: [...replaceById(this._board.tasks, result?.tasks), ...addedTasks].filter((task) => !deleted.has(String(task.id))),
+    });
+  }
+
+  async _saveBoardOps() {
+    if (this._boardOpsUnsupported || !this._lastSyncedBoard) return false;
+    const ops = this._boardOps(this._lastSyncedBoard, this._board);
+    if (!ops) return false;
+    let revision = this._lastSyncedBoard.revision;
+    let updatedAt = String(this._lastSyncedBoard.updated_at || "");
+    for (const op of ops) {
+      let result;
+      try {
+        result = await this._callBoardWs({ ...op, entry_id: this._config.entry_id, expected_revision: revision });
+      } catch (err) {
+        const message = String(err?.message || err || "");
+        if (message.toLowerCase().includes("unknown command") && op === ops[0]) {
+          this._boardOpsUnsupported = true;
+          return false;
+        }
+        throw err;
+      }
+      this._applyBoardOpResult(result);
+      revision = Number.isInteger(result?.revision) ? result.revision : revision;
+      updatedAt = String(result?.updated_at || updatedAt);
+    }
+    this._board.revision = revision;
+    this._board.updated_at = updatedAt;
+    this._lastSyncedBoard = this._snapshotBoard();
+    this._markBoardRevisionSeen();
+    this._setPersonFilter(this._personFilter);
+    return true;
+  }
+
   async _saveBoard() {
     if (!this._hass || !this._config?.entry_id) return;
     this._saving = true;
     this._render();
     try {
-      const expectedUpdatedAt = String(this._lastSyncedBoard?.updated_at || this._board?.updated_at || "");
+      if (await this._saveBoardOps()) {
+        this._error = "";
+        return;
+      }
+      const expectedRevision = (this._lastSyncedBoard || this._board)?.revision ?? 0;
       const result = await this._callBoardWs({
         type: "household_chores/save_board",
         entry_id: this._config.entry_id,
         board: this._board,
-        expected_updated_at: expectedUpdatedAt,
+        ...this._loadedWeeksPayload(),
+        expected_revision: expectedRevision,
       });
+      this._setLoadedWeeks(result);
       this._board = this._normalizeBoard(result.board || this._board);
       this._lastSyncedBoard = this._snapshotBoard();
+      this._markBoardRevisionSeen();
       this._setPersonFilter(this._personFilter);
       this._error = "";
     } catch (err) {
@@ -817,16 +976,20 @@ class HouseholdChoresCard extends HTMLElement {
       if (message.toLowerCase().includes("conflict")) {
         try {
           const latest = await this._callBoardWs({ type: "household_chores/get_board", entry_id: this._config.entry_id });
+          this._setLoadedWeeks(latest);
           const latestBoard = this._normalizeBoard(latest.board || {});
           const mergedBoard = this._mergeBoardsForConflict(latestBoard, this._board, this._lastSyncedBoard || latestBoard);
           const retry = await this._callBoardWs({
             type: "household_chores/save_board",
             entry_id: this._config.entry_id,
             board: mergedBoard,
-            expected_updated_at: String(latestBoard.updated_at || ""),
+            ...this._loadedWeeksPayload(),
+            expected_revision: latestBoard.revision,
           });
+          this._setLoadedWeeks(retry);
           this._board = this._normalizeBoard(retry.board || mergedBoard);
           this._lastSyncedBoard = this._snapshotBoard();
+          this._markBoardRevisionSeen();
           this._setPersonFilter(this._personFilter);
           this._error = "";
         } catch (mergeErr) {
@@ -877,6 +1040,9 @@ class HouseholdChoresCard extends HTMLElement {
 
     return this._board.templates
       .filter((tpl) => Array.isArray(tpl.weekdays) && tpl.weekdays.includes(weekdayKey) && tpl.end_date && dayIso <= tpl.end_date)
+      // Rules beyond plain weekly ones are expanded by the backend once the week is loaded.
+      .filter((tpl) => (tpl.frequency || "weekly") === "weekly" && (tpl.interval || 1) === 1 && !tpl.count)
+      .filter((tpl) => !(tpl.start_date && dayIso < tpl.start_date))
       .filter((tpl) => !(Array.isArray(tpl.excluded_dates) && tpl.excluded_dates.includes(dayIso)))
       .map((tpl, idx) => ({
         id: `virtual_${tpl.id}_${weekdayKey}_${weekOffset}_${idx}`,
@@ -896,6 +1062,15 @@ class HouseholdChoresCard extends HTMLElement {
       .sort((a, b) => a.title.localeCompare(b.title));
   }
 
+  _templateRuleFields(tpl) {
+    // Recurrence options the card cannot edit yet; carried along so saves do not reset them.
+    const fields = {};
+    for (const key of ["frequency", "interval", "start_date", "count", "month_days", "nth_weekdays"]) {
+      if (tpl && tpl[key] !== undefined && tpl[key] !== null) fields[key] = tpl[key];
+    }
+    return fields;
+  }
+
   _reindexAllColumns() {
     for (const col of this._columns().map((c) => c.key)) {
       const items = this._tasksForColumn(col);
@@ -1805,6 +1980,7 @@ class HouseholdChoresCard extends HTMLElement {
       }
 
       const template = {
+        ...this._templateRuleFields(templateRef),
         id: templateId,
         title: form.title.trim(),
         assignees: [...form.assignees],
@@ -1814,7 +1990,10 @@ class HouseholdChoresCard extends HTMLElement {
         created_at: new Date().toISOString(),
         slot: form.slot || "",
       };
-      const instances = this._buildFixedInstancesForCurrentWeek(template, template.title, template.assignees, form.slot || "");
+      const isPlainWeekly = (template.frequency || "weekly") === "weekly" && (template.interval || 1) === 1 && !template.count;
+      const instances = isPlainWeekly
+        ? this._buildFixedInstancesForCurrentWeek(template, template.title, template.assignees, form.slot || "")
+        : [];
       this._board.templates = [...this._board.templates, template];
       this._board.tasks = [...this._board.tasks, ...instances];
     } else {
@@ -0,0 +1,141 @@
+"""In-memory secondary indexes over the live board tasks."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from .search import TitleIndex
+from .stats import WEEKDAY_COLUMNS
+
+if TYPE_CHECKING:
+    from .board import Task
+
+ALL_COLUMNS = [*WEEKDAY_COLUMNS, "done"]
+
+WeekColumnKey = tuple[str | None, str]
+
+
+def week_key(value: Any) -> str | None:
+    """Return the Monday iso date a task's week_start belongs to (None when unscheduled)."""
+    if not value:
+        return None
+    return _week_key(str(value))
+
+
+@lru_cache(maxsize=1024)
+def _week_key(value: str) -> str | None:
+    try:
+        day_value = date.fromisoformat(value)
+    except ValueError:
+        return None
+    return (day_value - timedelta(days=day_value.weekday())).isoformat()
+
+
+class BoardIndexes:
+    """Lookups kept in sync with the store's task list.
+
+    Buckets hold task ids; ``by_week_column`` buckets are kept sorted by order.
+    ``titles`` answers fuzzy title lookups.
+    """
+
+    __slots__ = ("by_id", "by_week_column", "by_assignee", "by_span", "by_template", "titles")
+
+    def __init__(self, tasks: Iterable[Task] = ()) -> None:
+        self.by_id: dict[str, Task] = {}
+        self.by_week_column: dict[WeekColumnKey, list[str]] = {}
+        self.by_assignee: dict[str, set[str]] = {}
+        self.by_span: dict[str, set[str]] = {}
+        self.by_template: dict[str, set[str]] = {}
+        self.titles = TitleIndex()
+        for task in tasks:
+            self.add(task)
+        for bucket in self.by_week_column.values():
+            bucket.sort(key=lambda task_id: self.by_id[task_id].order)
+
+    @staticmethod
+    def bucket_key(task: Task) -> WeekColumnKey:
+        """Return the (week_start, column) bucket a task is ordered in."""
+        return week_key(task.week_start), task.column
+
+    def add(self, task: Task) -> None:
+        """Index a task; its bucket position follows current order values."""
+        task_id = task.id
+        self.by_id[task_id] = task
+        bucket = self.by_week_column.setdefault(self.bucket_key(task), [])
+        if task_id not in bucket:
+            bucket.append(task_id)
+        for person_id in task.assignees:
+            self.by_assignee.setdefault(person_id, set()).add(task_id)
+        if task.span_id:
+            self.by_span.setdefault(task.span_id, set()).add(task_id)
+        if task.template_id:
+            self.by_template.setdefault(task.template_id, set()).add(task_id)
+        self.titles.add(task_id, task.title)
+
+    def remove(self, task: Task) -> None:
+        """Drop a task from every index using its current field values."""
+        task_id = task.id
+        self.by_id.pop(task_id, None)
+        key = self.bucket_key(task)
+        bucket = self.by_week_column.get(key)
+        if bucket is not None and task_id in bucket:
+            bucket.remove(task_id)
+            if not bucket:
+                del self.by_week_column[key]
+        for person_id in task.assignees:
+            _discard(self.by_assignee, person_id, task_id)
+        if task.span_id:
+            _discard(self.by_span, task.span_id, task_id)
+        if task.template_id:
+            _discard(self.by_template, task.template_id, task_id)
+        self.titles.remove(task_id)
+
+    def bucket(self, key: WeekColumnKey) -> list[Task]:
+        """Return the tasks of one (week_start, column) bucket in order."""
+        return [self.by_id[task_id] for task_id in self.by_week_column.get(key, [])]
+
+    def set_bucket(self, key: WeekColumnKey, tasks: list[Task]) -> None:
+        """Replace the ordered id list of one bucket."""
+        if tasks:
+            self.by_week_column[key] = [task.id for task in tasks]
+        else:
+            self.by_week_column.pop(key, None)
+
+    def week_tasks(
+        self,
+        week_start: str,
+        columns: Iterable[str] = ALL_COLUMNS,
+        *,
+        person_id: str | None = None,
+        include_unscheduled: bool = True,
+    ) -> list[Task]:
+        """Return tasks of one week (plus unscheduled ones) in column/order order."""
+        wanted = self.by_assignee.get(person_id, set()) if person_id is not None else None
+        week_keys: tuple[str | None, ...] = (None, week_start) if include_unscheduled else (week_start,)
+        rows: list[Task] = []
+        for column in columns:
+            for week in week_keys:
+                for task_id in self.by_week_column.get((week, column), []):
+                    if wanted is None or task_id in wanted:
+                        rows.append(self.by_id[task_id])
+        return rows
+
+    def weeks(self) -> list[str]:
+        """Return the sorted week_start keys that currently hold tasks."""
+        return sorted({week for week, _column in self.by_week_column if week is not None})
+
+    def tasks_for(self, task_ids: Iterable[str]) -> list[Task]:
+        """Resolve ids to task dicts, skipping unknown ids."""
+        return [self.by_id[task_id] for task_id in task_ids if task_id in self.by_id]
+
+
+def _discard(index: dict[str, set[str]], key: str, task_id: str) -> None:
+    members = index.get(key)
+    if members is None:
+        return
+    members.discard(task_id)
+    if not members:
+        del index[key]
@@ -0,0 +1,241 @@
+"""Append-only operation journal persisted next to the board snapshot."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.helpers.storage import STORAGE_DIR
+
+_LOGGER = logging.getLogger(__name__)
+
+JOURNAL_COMPACT_ENTRIES = 200
+JOURNAL_COMPACT_BYTES = 256 * 1024
+
+_COLLECTIONS = (
+    ("tasks", "deleted_task_ids"),
+    ("people", "deleted_person_ids"),
+    ("templates", "deleted_template_ids"),
+)
+
+
+class BoardJournal:
+    """JSON-lines file of board changes newer than the Store snapshot.
+
+    Every line is one entry tagged with the board revision it produced, so
+    replay can skip entries an already-written snapshot covers.
+    """
+
+    def __init__(self, hass, key: str) -> None:
+        self._hass = hass
+        self._path = hass.config.path(STORAGE_DIR, f"{key}.journal")
+        self._lock = asyncio.Lock()
+        self._entries = 0
+        self._bytes = 0
+
+    @property
+    def entry_count(self) -> int:
+        """Number of entries currently in the file."""
+        return self._entries
+
+    @property
+    def size_bytes(self) -> int:
+        """Current file size in bytes."""
+        return self._bytes
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Return True once the journal should be folded into a snapshot."""
+        return self._entries >= JOURNAL_COMPACT_ENTRIES or self._bytes >= JOURNAL_COMPACT_BYTES
+
+    @staticmethod
+    def encode(entry: dict[str, Any]) -> str:
+        """Serialize one entry to a journal line."""
+        return json.dumps(entry, separators=(",", ":"), ensure_ascii=False, default=_encode_record) + "\n"
+
+    async def async_load(self) -> list[dict[str, Any]]:
+        """Read all complete entries from disk."""
+        async with self._lock:
+            entries, size, torn = await self._hass.async_add_executor_job(self._read)
+            if torn:
+                # Cut the torn tail so later appends do not land behind it.
+                size = await self._hass.async_add_executor_job(self._write_entries, entries)
+        self._entries = len(entries)
+        self._bytes = size
+        return entries
+
+    async def async_append(self, lines: list[str]) -> None:
+        """Append already encoded entries and fsync them."""
+        if not lines:
+            return
+        payload = "".join(lines).encode("utf-8")
+        async with self._lock:
+            await self._hass.async_add_executor_job(self._append, payload)
+        self._entries += len(lines)
+        self._bytes += len(payload)
+
+    async def async_truncate(self, through_revision: int) -> None:
+        """Drop entries a snapshot at ``through_revision`` already contains."""
+        async with self._lock:
+            self._entries, self._bytes = await self._hass.async_add_executor_job(self._rewrite, through_revision)
+
+    async def async_clear(self) -> None:
+        """Remove the journal file."""
+        async with self._lock:
+            await self._hass.async_add_executor_job(self._remove)
+        self._entries = 0
+        self._bytes = 0
+
+    def _read(self) -> tuple[list[dict[str, Any]], int, bool]:
+        if not os.path.exists(self._path):
+            return [], 0, False
+        entries: list[dict[str, Any]] = []
+        with open(self._path, "rb") as handle:
+            raw = handle.read()
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A torn final write from a crash; everything before it is intact.
+                _LOGGER.warning("Ignoring unreadable tail of board journal %s", self._path)
+                return entries, len(raw), True
+            if isinstance(entry, dict):
+                entries.append(entry)
+        return entries, len(raw), False
+
+    def _append(self, payload: bytes) -> None:
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        with open(self._path, "ab") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def _remove(self) -> None:
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+    def _rewrite(self, through_revision: int) -> tuple[int, int]:
+        entries, _size, _torn = self._read()
+        keep = [entry for entry in entries if _entry_revision(entry) > through_revision]
+        return len(keep), self._write_entries(keep)
+
+    def _write_entries(self, entries: list[dict[str, Any]]) -> int:
+        """Atomically replace the file with ``entries`` and return its size."""
+        if not entries:
+            self._remove()
+            return 0
+        payload = "".join(self.encode(entry) for entry in entries).encode("utf-8")
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, self._path)
+        return len(payload)
+
+
+def build_entry(
+    revision: int,
+    updated_at: str,
+    *,
+    tasks: list[dict[str, Any]] | None = None,
+    people: list[dict[str, Any]] | None = None,
+    templates: list[dict[str, Any]] | None = None,
+    deleted_task_ids: list[str] | None = None,
+    deleted_person_ids: list[str] | None = None,
+    deleted_template_ids: list[str] | None = None,
+    settings: dict[str, Any] | None = None,
+    order: dict[str, list[str]] | None = None,
+) -> dict[str, Any]:
+    """Return a journal entry holding only the non-empty parts of a change."""
+    entry: dict[str, Any] = {"rev": revision, "updated_at": updated_at}
+    for key, value in (
+        ("tasks", tasks),
+        ("people", people),
+        ("templates", templates),
+        ("deleted_task_ids", deleted_task_ids),
+        ("deleted_person_ids", deleted_person_ids),
+        ("deleted_template_ids", deleted_template_ids),
+        ("settings", settings),
+        ("order", order),
+    ):
+        if value:
+            entry[key] = value
+    return entry
+
+
+def diff_entry(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Describe the change from ``previous`` to ``current`` as one journal entry."""
+    changes: dict[str, Any] = {}
+    order: dict[str, list[str]] = {}
+    for collection, deleted_key in _COLLECTIONS:
+        before = {_record_id(item): item for item in previous.get(collection, [])}
+        after = current.get(collection, [])
+        after_ids = [_record_id(item) for item in after]
+        remaining = set(after_ids)
+        upserts = [item for item in after if before.get(_record_id(item)) != item]
+        deleted = [item_id for item_id in before if item_id not in remaining]
+        changes[collection] = upserts
+        changes[deleted_key] = deleted
+        if after_ids != _replayed_ids(list(before), upserts, deleted):
+            order[collection] = after_ids
+    settings = current.get("settings")
+    return build_entry(
+        int(current.get("revision", 0)),
+        str(current.get("updated_at") or ""),
+        settings=settings if settings != previous.get("settings") else None,
+        order=order,
+        **changes,
+    )
+
+
+def apply_entry(board: dict[str, Any], entry: dict[str, Any]) -> None:
+    """Replay one journal entry onto a raw board dict in place."""
+    for collection, deleted_key in _COLLECTIONS:
+        items = [item for item in board.get(collection, []) if isinstance(item, dict)]
+        deleted = set(entry.get(deleted_key, []))
+        upserts = {item["id"]: item for item in entry.get(collection, [])}
+        merged = [upserts.pop(item.get("id"), item) for item in items if item.get("id") not in deleted]
+        merged.extend(upserts.values())
+        if collection in entry.get("order", {}):
+            # Records the entry did not list (e.g. from weeks loaded later) keep their place at the end.
+            position = {item_id: index for index, item_id in enumerate(entry["order"][collection])}
+            merged.sort(key=lambda item: position.get(item.get("id"), len(position)))
+        board[collection] = merged
+    if isinstance(entry.get("settings"), dict):
+        board["settings"] = entry["settings"]
+    board["revision"] = _entry_revision(entry)
+    board["updated_at"] = entry.get("updated_at") or board.get("updated_at")
+
+
+def _entry_revision(entry: dict[str, Any]) -> int:
+    try:
+        return int(entry.get("rev", 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _record_id(item: Any) -> str:
+    return item["id"] if isinstance(item, dict) else item.id
+
+
+def _encode_record(value: Any) -> dict[str, Any]:
+    """Serialize typed board records (tasks) that json cannot encode natively."""
+    as_dict = getattr(value, "as_dict", None)
+    if as_dict is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return as_dict()
+
+
+def _replayed_ids(before_ids: list[str], upserts: list[Any], deleted: list[str]) -> list[str]:
+    """Return the id order ``apply_entry`` would produce without an explicit order."""
+    removed = set(deleted)
+    existing = set(before_ids)
+    return [item_id for item_id in before_ids if item_id not in removed] + [
+        _record_id(item) for item in upserts if _record_id(item) not in existing
+    ]
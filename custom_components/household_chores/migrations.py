@@ -0,0 +1,162 @@
+"""Versioned upgrades of stored board data.
+
+Every stored board carries ``schema_version``. ``migrate_board`` runs the
+steps between that version and ``BOARD_SCHEMA_VERSION`` once, at load, on the
+raw stored dicts; the store then writes a fresh snapshot stamped with the
+current version, so later loads and saves never see legacy shapes again.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .recurrence import occurrence_id, split_occurrence_id
+
+BOARD_SCHEMA_VERSION = 3
+
+_WEEKDAY_COLUMNS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+def schema_version(board: dict[str, Any]) -> int:
+    """Return the schema version a stored board was written with (0 when unversioned)."""
+    try:
+        return int(board.get("schema_version") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def needs_migration(board: dict[str, Any]) -> bool:
+    """Return True when a stored board is older than the current schema."""
+    return schema_version(board) < BOARD_SCHEMA_VERSION
+
+
+def migrate_board(board: dict[str, Any]) -> dict[str, Any]:
+    """Upgrade a raw stored board in place to ``BOARD_SCHEMA_VERSION`` and return it.
+
+    Runs without touching the event loop, so large boards can be migrated in
+    an executor.
+    """
+    version = schema_version(board)
+    while version < BOARD_SCHEMA_VERSION:
+        MIGRATIONS[version](board)
+        version += 1
+    board["schema_version"] = BOARD_SCHEMA_VERSION
+    return board
+
+
+def _migrate_weekly_layout(board: dict[str, Any]) -> None:
+    """0 -> 1: map the pre-weekly ``backlog`` column and pin tasks to ISO weeks."""
+    current_monday = _monday(dt_util.as_local(dt_util.utcnow()).date())
+    for task in board.get("tasks", []):
+        if not isinstance(task, dict):
+            continue
+        column = str(task.get("column") or "monday").lower()
+        if column == "backlog":
+            column = "monday"
+        task["column"] = column
+        week_start = _parse_date(task.get("week_start"))
+        if week_start is None and column in _WEEKDAY_COLUMNS:
+            week_start = current_monday
+        if week_start is not None:
+            # Older clients stored the local day they were on, which drifts across timezones.
+            week_start = _monday(week_start)
+            task["week_start"] = week_start.isoformat()
+            if not isinstance(task.get("week_number"), int):
+                task["week_number"] = week_start.isocalendar().week
+
+
+def _migrate_template_rules(board: dict[str, Any]) -> None:
+    """1 -> 2: give templates the recurrence rule fields with their weekly defaults."""
+    for template in board.get("templates", []):
+        if not isinstance(template, dict):
+            continue
+        template.setdefault("slot", None)
+        template.setdefault("excluded_dates", [])
+        template.setdefault("frequency", "weekly")
+        template.setdefault("interval", 1)
+        template.setdefault("start_date", None)
+        template.setdefault("count", None)
+        template.setdefault("month_days", [])
+        template.setdefault("nth_weekdays", [])
+
+
+def _migrate_template_task_ids(board: dict[str, Any]) -> None:
+    """2 -> 3: give template tasks stored under random ids their ``<template_id>_<date>`` id.
+
+    Boards from before on-demand expansion stored every occurrence as a task
+    with a random id. Open ones still carry their day in the column, but done
+    ones lost it, so they could no longer suppress their occurrence. Done
+    tasks take the template's days of their week that no other task of the
+    template holds, earliest first. The old id is left under ``legacy_id`` for
+    state kept outside the board.
+    """
+    templates = {
+        str(template.get("id")): template
+        for template in board.get("templates", [])
+        if isinstance(template, dict) and template.get("id")
+    }
+    tasks = [task for task in board.get("tasks", []) if isinstance(task, dict)]
+    taken = {str(task.get("id")) for task in tasks}
+    legacy_done: dict[tuple[str, date], list[dict[str, Any]]] = {}
+
+    def claim(task: dict[str, Any], template_id: str, day: date) -> None:
+        new_id = occurrence_id(template_id, day)
+        if new_id in taken:
+            return
+        taken.add(new_id)
+        task["legacy_id"] = task.get("id")
+        task["id"] = new_id
+
+    for task in tasks:
+        template_id = str(task.get("template_id") or "")
+        week_start = _parse_date(task.get("week_start"))
+        if template_id not in templates or week_start is None:
+            continue
+        split = split_occurrence_id(str(task.get("id")))
+        if split is not None and split[0] == template_id:
+            continue
+        column = str(task.get("column") or "")
+        if column in _WEEKDAY_COLUMNS:
+            claim(task, template_id, week_start + timedelta(days=_WEEKDAY_COLUMNS.index(column)))
+        elif column == "done":
+            legacy_done.setdefault((template_id, week_start), []).append(task)
+
+    for (template_id, week_start), done_tasks in legacy_done.items():
+        template = templates[template_id]
+        # Random ids were only ever generated from plain weekly rules.
+        excluded = {str(item) for item in template.get("excluded_dates", [])}
+        days = sorted(
+            week_start + timedelta(days=_WEEKDAY_COLUMNS.index(weekday))
+            for weekday in template.get("weekdays", [])
+            if weekday in _WEEKDAY_COLUMNS
+        )
+        free = [
+            day for day in days if day.isoformat() not in excluded and occurrence_id(template_id, day) not in taken
+        ]
+        # A refresh generated a template's tasks day by day, so creation time follows the weekday.
+        for task, day in zip(sorted(done_tasks, key=lambda item: str(item.get("created_at") or "")), free):
+            claim(task, template_id, day)
+
+
+MIGRATIONS: dict[int, Callable[[dict[str, Any]], None]] = {
+    0: _migrate_weekly_layout,
+    1: _migrate_template_rules,
+    2: _migrate_template_task_ids,
+}
+
+
+def _monday(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _parse_date(value: Any) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
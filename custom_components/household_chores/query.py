@@ -0,0 +1,256 @@
+"""Filtered, sorted and cursor-paged task queries over the board indexes."""
+
+from __future__ import annotations
+
+import base64
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import date, timedelta
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from .indexes import ALL_COLUMNS
+from .stats import WEEKDAY_INDEX
+
+if TYPE_CHECKING:
+    from .board import Task
+    from .indexes import BoardIndexes
+
+SORT_KEYS = ("date", "title", "created_at", "relevance")
+STATES = ("open", "done", "all")
+COLUMN_POSITION = {column: index for index, column in enumerate(ALL_COLUMNS)}
+
+SortKey = tuple[Any, ...]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or belongs to a different query."""
+
+
+@dataclass(frozen=True, slots=True)
+class TaskQuery:
+    """Filters and ordering for ``run_query``.
+
+    ``assignees`` keeps tasks that include every listed person. ``title`` is
+    matched fuzzily through the title index; ``relevance`` sorts by that
+    score. With ``dedupe_spans`` only the first matching fragment of an
+    all-day span is returned.
+    """
+
+    title: str | None = None
+    date_from: date | None = None
+    date_to: date | None = None
+    columns: frozenset[str] | None = None
+    state: str = "open"
+    fixed: bool | None = None
+    template_id: str | None = None
+    assignees: frozenset[str] = frozenset()
+    dedupe_spans: bool = False
+    sort: str = "date"
+    descending: bool = False
+
+    @property
+    def fingerprint(self) -> str:
+        """Short digest tying cursors to the query they were issued for."""
+        raw = json.dumps(
+            [
+                self.title,
+                self.date_from and self.date_from.isoformat(),
+                self.date_to and self.date_to.isoformat(),
+                sorted(self.columns) if self.columns is not None else None,
+                self.state,
+                self.fixed,
+                self.template_id,
+                sorted(self.assignees),
+                self.dedupe_spans,
+                self.sort,
+                self.descending,
+            ]
+        )
+        return hashlib.sha1(raw.encode()).hexdigest()[:12]
+
+    def weeks(self) -> tuple[str | None, str | None]:
+        """Return the first and last Monday the date range touches (None when open-ended)."""
+        first = _monday(self.date_from).isoformat() if self.date_from else None
+        last = _monday(self.date_to).isoformat() if self.date_to else None
+        return first, last
+
+
+def task_day(task: Task) -> date | None:
+    """Return the calendar day a task sits on: its weekday in its week, else its end date."""
+    if task.week_start and task.column in WEEKDAY_INDEX:
+        try:
+            return date.fromisoformat(task.week_start) + timedelta(days=WEEKDAY_INDEX[task.column])
+        except ValueError:
+            return None
+    if task.end_date:
+        try:
+            return date.fromisoformat(task.end_date)
+        except ValueError:
+            return None
+    return None
+
+
+def sort_key(task: Task, sort: str, scores: dict[str, float] | None = None) -> SortKey:
+    """Return the total ordering key of a task for one sort mode; ids break ties."""
+    position = (task.week_start or "", COLUMN_POSITION.get(task.column, 0), task.order)
+    if sort == "relevance":
+        return (-round((scores or {}).get(task.id, 0.0), 6), *position, task.id)
+    if sort == "title":
+        return (task.title.lower(), *position, task.id)
+    if sort == "created_at":
+        return (task.created_at, task.id)
+    return (*position, task.id)
+
+
+def run_query(
+    indexes: BoardIndexes,
+    query: TaskQuery,
+    *,
+    limit: int,
+    cursor: str | None = None,
+) -> tuple[list[Task], str | None]:
+    """Return one page of matching tasks and the cursor of the next page (None on the last page).
+
+    Candidates come from the narrowest index the filters allow. Ascending date
+    order is the order buckets are kept in, so that page is streamed week by
+    week and stops after ``limit`` hits; other orders sort the filtered set.
+    """
+    after = decode_cursor(cursor, query) if cursor else None
+    scores = indexes.titles.search(query.title) if query.title else None
+    matches = _matcher(indexes, query, scores)
+
+    def key(task: Task) -> SortKey:
+        return sort_key(task, query.sort, scores)
+
+    if query.sort == "date" and not query.descending and scores is None and query.template_id is None and not query.assignees:
+        page: list[Task] = []
+        for task in _stream_by_date(indexes, query, after):
+            if matches(task):
+                page.append(task)
+                if len(page) > limit:
+                    break
+    else:
+        candidates = [task for task in _candidates(indexes, query, scores) if matches(task)]
+        if after is not None:
+            candidates = [
+                task for task in candidates if (key(task) < after if query.descending else key(task) > after)
+            ]
+        candidates.sort(key=key, reverse=query.descending)
+        page = candidates[: limit + 1]
+
+    if len(page) <= limit:
+        return page, None
+    page = page[:limit]
+    return page, encode_cursor(key(page[-1]), query)
+
+
+def encode_cursor(key: SortKey, query: TaskQuery) -> str:
+    """Return an opaque cursor pointing just after ``key``."""
+    payload = json.dumps({"q": query.fingerprint, "k": list(key)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, query: TaskQuery) -> SortKey:
+    """Return the sort key a cursor points after, checking it was issued for ``query``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        key = tuple(payload["k"])
+        fingerprint = payload["q"]
+    except (ValueError, KeyError, TypeError) as err:
+        raise InvalidCursorError("Cursor is not valid") from err
+    if fingerprint != query.fingerprint:
+        raise InvalidCursorError("Cursor belongs to a different query")
+    return key
+
+
+def _matcher(indexes: BoardIndexes, query: TaskQuery, scores: dict[str, float] | None) -> Callable[[Task], bool]:
+    wanted_people = query.assignees
+
+    def _base(task: Task) -> bool:
+        if query.state == "open" and task.column == "done":
+            return False
+        if query.state == "done" and task.column != "done":
+            return False
+        if query.columns is not None and task.column not in query.columns:
+            return False
+        if query.fixed is not None and bool(task.fixed or task.template_id) != query.fixed:
+            return False
+        if query.template_id is not None and task.template_id != query.template_id:
+            return False
+        if scores is not None and task.id not in scores:
+            return False
+        if wanted_people and not wanted_people.issubset(task.assignees):
+            return False
+        if query.date_from is not None or query.date_to is not None:
+            day = task_day(task)
+            if day is None:
+                return False
+            if query.date_from is not None and day < query.date_from:
+                return False
+            if query.date_to is not None and day > query.date_to:
+                return False
+        return True
+
+    if not query.dedupe_spans:
+        return _base
+
+    def _first_of_span(task: Task) -> bool:
+        if not _base(task):
+            return False
+        if not task.span_id:
+            return True
+        # Stateless so it holds across pages: a fragment wins when no matching sibling sorts before it.
+        own = sort_key(task, query.sort, scores)
+        for sibling in indexes.tasks_for(indexes.by_span.get(task.span_id, ())):
+            if sibling is task or not _base(sibling):
+                continue
+            other = sort_key(sibling, query.sort, scores)
+            if (other > own) if query.descending else (other < own):
+                return False
+        return True
+
+    return _first_of_span
+
+
+def _week_keys(indexes: BoardIndexes, query: TaskQuery) -> list[str | None]:
+    first, last = query.weeks()
+    weeks = [week for week in indexes.weeks() if (first is None or week >= first) and (last is None or week <= last)]
+    # Unscheduled tasks only qualify through their end date, which the range check handles.
+    return [None, *weeks]
+
+
+def _stream_by_date(indexes: BoardIndexes, query: TaskQuery, after: SortKey | None) -> Iterator[Task]:
+    columns = [column for column in ALL_COLUMNS if query.columns is None or column in query.columns]
+    for week in _week_keys(indexes, query):
+        if after is not None and (week or "") < after[0]:
+            continue
+        for column in columns:
+            for task_id in indexes.by_week_column.get((week, column), ()):
+                task = indexes.by_id[task_id]
+                if after is not None and sort_key(task, "date") <= after:
+                    continue
+                yield task
+
+
+def _candidates(indexes: BoardIndexes, query: TaskQuery, scores: dict[str, float] | None) -> list[Task]:
+    if scores is not None:
+        return indexes.tasks_for(scores)
+    if query.template_id is not None:
+        return indexes.tasks_for(indexes.by_template.get(query.template_id, ()))
+    if query.assignees:
+        sets = [indexes.by_assignee.get(person_id, set()) for person_id in query.assignees]
+        return indexes.tasks_for(set.intersection(*sets))
+    columns = [column for column in ALL_COLUMNS if query.columns is None or column in query.columns]
+    return [
+        indexes.by_id[task_id]
+        for week in _week_keys(indexes, query)
+        for column in columns
+        for task_id in indexes.by_week_column.get((week, column), ())
+    ]
+
+
+def _monday(day: date) -> date:
+    return day - timedelta(days=day.weekday())
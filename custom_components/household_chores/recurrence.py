@@ -0,0 +1,193 @@
+"""Recurrence rules compiled from fixed-task templates."""
+
+from __future__ import annotations
+
+import calendar
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from itertools import islice
+from typing import Any
+
+from .stats import WEEKDAY_INDEX
+
+FREQUENCIES = ("weekly", "monthly")
+_NTH_VALUES = {-5, -4, -3, -2, -1, 1, 2, 3, 4, 5}
+
+# Expanded windows kept per compiled rule; the card, sensors and stats mostly ask for the same few weeks.
+EXPANSION_CACHE_SIZE = 32
+
+# Upper bound on periods scanned for one expansion, so rules that never match (day 31 every February) end.
+_MAX_PERIODS = 5000
+
+
+@dataclass(frozen=True, slots=True)
+class Recurrence:
+    """RRULE-style rule of one template, parsed once and expanded on demand.
+
+    ``weekly`` rules occur on ``weekdays`` every ``interval`` weeks; ``monthly``
+    rules occur on ``month_days`` (negative counts from the month end) and on
+    ``nth_weekdays`` such as (1, 2) for the second Tuesday or (4, -1) for the
+    last Friday, every ``interval`` months. Periods are counted from
+    ``start_date``; ``count`` limits the number of generated dates, excluded
+    dates included, as in RFC 5545.
+    """
+
+    template_id: str
+    frequency: str
+    interval: int
+    start_date: date
+    end_date: date | None
+    count: int | None
+    weekdays: tuple[int, ...]
+    month_days: tuple[int, ...]
+    nth_weekdays: tuple[tuple[int, int], ...]
+    excluded_dates: frozenset[date]
+    until: date | None = field(init=False, default=None)
+    _cache: dict[tuple[date, date], tuple[date, ...]] = field(
+        init=False, default_factory=dict, compare=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        until = self.end_date
+        if self.count is not None:
+            dates = list(islice(self._rule_dates(self.start_date, until), self.count))
+            if dates and len(dates) == self.count:
+                until = dates[-1] if until is None else min(until, dates[-1])
+        object.__setattr__(self, "until", until)
+
+    @classmethod
+    def from_template(cls, template: dict[str, Any]) -> Recurrence | None:
+        """Compile a normalized template, or return None when it can never occur."""
+        frequency = template.get("frequency") if template.get("frequency") in FREQUENCIES else "weekly"
+        anchor = _parse_date(template.get("start_date")) or _parse_date(str(template.get("created_at") or "")[:10])
+        start_date = anchor
+        if anchor is not None and not template.get("start_date") and frequency == "weekly":
+            # Without an explicit start, a weekly rule covers the whole week it was created in.
+            start_date = anchor - timedelta(days=anchor.weekday())
+        end_date = _parse_date(template.get("end_date"))
+        count = template.get("count") if isinstance(template.get("count"), int) else None
+        if start_date is None or (end_date is None and count is None):
+            return None
+        weekdays = tuple(sorted({WEEKDAY_INDEX[day] for day in template.get("weekdays", []) if day in WEEKDAY_INDEX}))
+        month_days = tuple(sorted({day for day in template.get("month_days", []) if isinstance(day, int) and 0 < abs(day) <= 31}))
+        nth_weekdays = tuple(
+            sorted(
+                {
+                    (WEEKDAY_INDEX[item["weekday"]], int(item["nth"]))
+                    for item in template.get("nth_weekdays", [])
+                    if isinstance(item, dict) and item.get("weekday") in WEEKDAY_INDEX and item.get("nth") in _NTH_VALUES
+                }
+            )
+        )
+        if frequency == "weekly" and not weekdays:
+            weekdays = (anchor.weekday(),)
+        if frequency == "monthly" and not month_days and not nth_weekdays:
+            month_days = (start_date.day,)
+        return cls(
+            template_id=str(template["id"]),
+            frequency=frequency,
+            interval=max(1, int(template.get("interval") or 1)),
+            start_date=start_date,
+            end_date=end_date,
+            count=count,
+            weekdays=weekdays,
+            month_days=month_days,
+            nth_weekdays=nth_weekdays,
+            excluded_dates=frozenset(
+                excluded for excluded in map(_parse_date, template.get("excluded_dates", [])) if excluded is not None
+            ),
+        )
+
+    def occurs_on(self, day: date) -> bool:
+        """Return True when the template produces an occurrence on ``day``."""
+        return bool(self.occurrences(day, day + timedelta(days=1)))
+
+    def occurrences(self, start: date, end: date) -> tuple[date, ...]:
+        """Return occurrence dates in ``[start, end)`` in ascending order, cached per window."""
+        key = (start, end)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = tuple(self._expand(start, end))
+            if len(self._cache) >= EXPANSION_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = cached
+        return cached
+
+    def _expand(self, start: date, end: date) -> Iterator[date]:
+        first = max(start, self.start_date)
+        stop = end if self.until is None else min(end, self.until + timedelta(days=1))
+        if first >= stop:
+            return
+        for day in self._rule_dates(first, stop - timedelta(days=1)):
+            if day not in self.excluded_dates:
+                yield day
+
+    def _rule_dates(self, first: date, last: date | None) -> Iterator[date]:
+        """Yield every date the rule generates from ``first`` through ``last``, ignoring exclusions."""
+        if self.frequency == "monthly":
+            start_index = self.start_date.year * 12 + self.start_date.month - 1
+            index = first.year * 12 + first.month - 1
+            index += -(index - start_index) % self.interval
+            for _period in range(_MAX_PERIODS):
+                year, month = divmod(index, 12)
+                if last is not None and date(year, month + 1, 1) > last:
+                    return
+                for day in self._month_dates(year, month + 1):
+                    if last is not None and day > last:
+                        return
+                    if day >= first:
+                        yield day
+                index += self.interval
+            return
+
+        start_monday = self.start_date - timedelta(days=self.start_date.weekday())
+        monday = first - timedelta(days=first.weekday())
+        monday += timedelta(weeks=-((monday - start_monday).days // 7) % self.interval)
+        for _period in range(_MAX_PERIODS):
+            if last is not None and monday > last:
+                return
+            for weekday in self.weekdays:
+                day = monday + timedelta(days=weekday)
+                if last is not None and day > last:
+                    return
+                if day >= first:
+                    yield day
+            monday += timedelta(weeks=self.interval)
+
+    def _month_dates(self, year: int, month: int) -> list[date]:
+        days_in_month = calendar.monthrange(year, month)[1]
+        days = {
+            date(year, month, day if day > 0 else days_in_month + day + 1)
+            for day in self.month_days
+            if abs(day) <= days_in_month
+        }
+        first_weekday = date(year, month, 1).weekday()
+        for weekday, nth in self.nth_weekdays:
+            matching = list(range(1 + (weekday - first_weekday) % 7, days_in_month + 1, 7))
+            if abs(nth) <= len(matching):
+                days.add(date(year, month, matching[nth - 1 if nth > 0 else nth]))
+        return sorted(days)
+
+
+def occurrence_id(template_id: str, day: date) -> str:
+    """Return the stable task id of a template occurrence."""
+    return f"{template_id}_{day.isoformat()}"
+
+
+def split_occurrence_id(task_id: str) -> tuple[str, date] | None:
+    """Return (template_id, day) encoded in an occurrence id, or None for other ids."""
+    template_id, _sep, day_raw = str(task_id).rpartition("_")
+    day = _parse_date(day_raw)
+    if not template_id or day is None:
+        return None
+    return template_id, day
+
+
+def _parse_date(value: Any) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
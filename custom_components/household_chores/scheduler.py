@@ -0,0 +1,161 @@
+"""Domain-wide timer wheel shared by every Household Chores entry."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+import heapq
+from itertools import count
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+JobKey = tuple[str, str]
+JobAction = Callable[[datetime], Coroutine[Any, Any, None]]
+NextFire = Callable[[datetime], datetime | None]
+
+
+def next_local_time(now: datetime, hour: int, minute: int, weekday: int | None = None) -> datetime:
+    """Return the first local hour:minute (on ``weekday`` if given) strictly after ``now``.
+
+    The wall-clock time is rebuilt in the local zone for the target date
+    instead of adding fixed 24h steps, so deadlines stay on the configured
+    time across DST changes.
+    """
+    local_now = dt_util.as_local(now)
+    day = local_now.date()
+    step = 1
+    if weekday is not None:
+        day += timedelta(days=(weekday - local_now.weekday()) % 7)
+        step = 7
+    candidate = datetime.combine(day, time(hour, minute), tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    if candidate <= local_now:
+        candidate = datetime.combine(day + timedelta(days=step), time(hour, minute), tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return candidate
+
+
+@dataclass(slots=True)
+class _Job:
+    action: JobAction
+    next_fire: NextFire | None
+    when: datetime | None = None
+    seq: int = -1
+
+
+class TimerWheel:
+    """Heap of deadlines across config entries served by one Home Assistant timer.
+
+    Jobs are keyed by ``(entry_id, name)``. Recurring jobs pass ``next_fire``,
+    which returns the deadline following a given time, and are queued again
+    right after they fire; one-shot jobs pass a fixed ``when``. Replaced and
+    cancelled jobs leave their old heap entry behind, which is skipped once
+    its sequence number no longer matches the job.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._heap: list[tuple[datetime, int, JobKey]] = []
+        self._jobs: dict[JobKey, _Job] = {}
+        self._seq = count()
+        self._unsub: CALLBACK_TYPE | None = None
+        self._armed_at: datetime | None = None
+
+    @property
+    def jobs(self) -> dict[JobKey, datetime | None]:
+        """Next deadline (UTC) of every scheduled job."""
+        return {key: job.when for key, job in self._jobs.items()}
+
+    @callback
+    def async_schedule(self, key: JobKey, action: JobAction, next_fire: NextFire) -> None:
+        """Run ``action`` at every deadline produced by ``next_fire``, replacing any job under ``key``."""
+        job = _Job(action, next_fire)
+        self._jobs[key] = job
+        self._queue(key, job, next_fire(dt_util.utcnow()))
+        self._arm()
+
+    @callback
+    def async_schedule_at(self, key: JobKey, action: JobAction, when: datetime) -> None:
+        """Run ``action`` once at ``when``, replacing any job under ``key``."""
+        job = _Job(action, None)
+        self._jobs[key] = job
+        self._queue(key, job, when)
+        self._arm()
+
+    @callback
+    def async_reschedule(self, key: JobKey) -> None:
+        """Recompute the next deadline of a recurring job after its inputs changed."""
+        job = self._jobs.get(key)
+        if job is None or job.next_fire is None:
+            return
+        self._queue(key, job, job.next_fire(dt_util.utcnow()))
+        self._arm()
+
+    @callback
+    def async_cancel(self, key: JobKey) -> None:
+        """Drop one job."""
+        if self._jobs.pop(key, None) is not None:
+            self._arm()
+
+    @callback
+    def async_cancel_entry(self, entry_id: str) -> None:
+        """Drop every job of one config entry."""
+        for key in [key for key in self._jobs if key[0] == entry_id]:
+            del self._jobs[key]
+        self._arm()
+
+    def _queue(self, key: JobKey, job: _Job, when: datetime | None) -> None:
+        job.seq = next(self._seq)
+        job.when = None if when is None else dt_util.as_utc(when)
+        if job.when is None:
+            self._jobs.pop(key, None)
+            return
+        heapq.heappush(self._heap, (job.when, job.seq, key))
+
+    def _is_current(self, seq: int, key: JobKey) -> bool:
+        job = self._jobs.get(key)
+        return job is not None and job.seq == seq
+
+    def _arm(self) -> None:
+        """Point the single timer at the nearest live deadline."""
+        while self._heap and not self._is_current(self._heap[0][1], self._heap[0][2]):
+            heapq.heappop(self._heap)
+        # Stale entries of rescheduled jobs can sit deep in the heap; rebuild once they dominate it.
+        if len(self._heap) > 2 * len(self._jobs) + 16:
+            self._heap = [(job.when, job.seq, key) for key, job in self._jobs.items() if job.when is not None]
+            heapq.heapify(self._heap)
+        when = self._heap[0][0] if self._heap else None
+        if when == self._armed_at:
+            return
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._armed_at = when
+        if when is not None:
+            self._unsub = async_track_point_in_utc_time(self._hass, self._async_fire, when)
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        self._unsub = None
+        self._armed_at = None
+        now = dt_util.as_utc(now)
+        due: list[tuple[JobKey, JobAction, datetime]] = []
+        while self._heap and self._heap[0][0] <= now:
+            when, seq, key = heapq.heappop(self._heap)
+            if not self._is_current(seq, key):
+                continue
+            job = self._jobs[key]
+            due.append((key, job.action, when))
+            if job.next_fire is None:
+                del self._jobs[key]
+            else:
+                self._queue(key, job, job.next_fire(max(now, when)))
+        self._arm()
+        for key, action, when in due:
+            _LOGGER.debug("Running %s for entry %s", key[1], key[0])
+            self._hass.async_create_task(action(when))
@@ -0,0 +1,114 @@
+"""Fuzzy task title lookup over word trigrams."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+import re
+
+# Scores run from 0 to 1; 1 is reserved for titles equal to the query after normalization.
+MIN_SCORE = 0.45
+# A query whose words all appear in a title scores at least this much.
+WORD_MATCH_SCORE = 0.85
+
+# Posting lists longer than this are too common to narrow a lookup and are skipped when rarer trigrams exist.
+MAX_POSTINGS = 200
+
+_WORD_RE = re.compile(r"[^\w]+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_title(title: str) -> str:
+    """Lowercase a title and reduce punctuation and whitespace runs to single spaces."""
+    return " ".join(_WORD_RE.sub(" ", title.lower()).split())
+
+
+@lru_cache(maxsize=4096)
+def title_trigrams(title: str) -> frozenset[str]:
+    """Return the padded trigrams of every word of a normalized title."""
+    grams: set[str] = set()
+    for word in title.split():
+        padded = f"  {word} "
+        grams.update(padded[index : index + 3] for index in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class TitleIndex:
+    """Trigram postings for the titles of indexed tasks.
+
+    Kept in step with ``BoardIndexes.add``/``remove``. A lookup only touches
+    the posting lists of the query's rarer trigrams, so it does not scan the
+    board even when most titles share a word.
+    """
+
+    __slots__ = ("_grams", "_postings", "_titles")
+
+    def __init__(self) -> None:
+        self._postings: dict[str, set[str]] = {}
+        self._titles: dict[str, str] = {}
+        self._grams: dict[str, frozenset[str]] = {}
+
+    def add(self, task_id: str, title: str) -> None:
+        normalized = normalize_title(title)
+        grams = title_trigrams(normalized)
+        self._titles[task_id] = normalized
+        self._grams[task_id] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(task_id)
+
+    def remove(self, task_id: str) -> None:
+        self._titles.pop(task_id, None)
+        grams = self._grams.pop(task_id, None)
+        if grams is None:
+            return
+        for gram in grams:
+            members = self._postings.get(gram)
+            if members is None:
+                continue
+            members.discard(task_id)
+            if not members:
+                del self._postings[gram]
+
+    def search(self, query: str, *, min_score: float = MIN_SCORE) -> dict[str, float]:
+        """Return ``{task_id: score}`` for titles similar to ``query``, best first."""
+        normalized = normalize_title(query)
+        query_grams = title_trigrams(normalized)
+        if not query_grams:
+            return {}
+        # Union the rare posting lists, but only intersect the common ones: a title
+        # must hold every common trigram of the query to be considered through them.
+        # Exact and whole-word matches hold every query trigram, so they are never lost.
+        rare: list[set[str]] = []
+        common: list[set[str]] = []
+        for gram in query_grams:
+            members = self._postings.get(gram)
+            if members:
+                (rare if len(members) <= MAX_POSTINGS else common).append(members)
+        candidates: set[str] = set().union(*rare)
+        if common:
+            common.sort(key=len)
+            candidates |= common[0].intersection(*common[1:])
+
+        query_words = set(normalized.split())
+        scores: dict[str, float] = {}
+        for task_id in candidates:
+            title = self._titles[task_id]
+            if title == normalized:
+                scores[task_id] = 1.0
+                continue
+            # Dice coefficient of the two trigram sets, capped below an exact match.
+            grams = self._grams[task_id]
+            score = min(0.99, 2 * len(query_grams & grams) / (len(query_grams) + len(grams)))
+            if query_words.issubset(title.split()):
+                score = max(score, WORD_MATCH_SCORE)
+            if score >= min_score:
+                scores[task_id] = score
+        return dict(sorted(scores.items(), key=lambda item: -item[1]))
+
+
+def rank_titles(query: str, titles: Iterable[tuple[str, str]], *, min_score: float = MIN_SCORE) -> dict[str, float]:
+    """Rank ``(task_id, title)`` pairs without a prebuilt index."""
+    index = TitleIndex()
+    for task_id, title in titles:
+        index.add(task_id, title)
+    return index.search(query, min_score=min_score)
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
+from abc import abstractmethod
 from datetime import datetime
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -18,7 +19,7 @@ from homeassistant.util import slugify
 
 from .const import DEFAULT_NAME, DOMAIN, SIGNAL_BOARD_UPDATED
 from .coordinator import HouseholdChoresCoordinator
-from .stats import next_three_tasks_summary, person_week_stats
+from .views import VIEW_NEXT_TASKS, VIEW_PERSON_WEEK, VIEW_TODAY, BoardViewModel, ViewKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -115,21 +116,23 @@ async def async_setup_entry(
     """Set up Household Chores sensors from a config entry."""
     coordinator: HouseholdChoresCoordinator = hass.data[DOMAIN][entry.entry_id]
     board_store = hass.data[DOMAIN]["boards"][entry.entry_id]
+    board = await board_store.async_load()
+    view_model = BoardViewModel(hass, entry.entry_id, board_store)
+    entry.async_on_unload(view_model.async_start())
     entities: list[SensorEntity] = [
         NextChoreSensor(entry, coordinator),
         BoardStateSensor(entry, board_store),
-        NextThreeTasksSensor(entry, board_store),
-        TodayTasksSensor(entry, board_store),
+        NextThreeTasksSensor(entry, board_store, view_model),
+        TodayTasksSensor(entry, board_store, view_model),
     ]
 
-    board = await board_store.async_load()
     await _async_migrate_entity_ids(hass, entry, board)
     for person in board.get("people", []):
         person_id = str(person.get("id") or "").strip()
         if not person_id:
             continue
-        entities.append(PersonWeekTasksSensor(entry, board_store, person_id))
-        entities.append(NextThreeTasksPersonSensor(entry, board_store, person_id))
+        entities.append(PersonWeekTasksSensor(entry, board_store, view_model, person_id))
+        entities.append(NextThreeTasksPersonSensor(entry, board_store, view_model, person_id))
 
     async_add_entities(entities)
 
@@ -152,8 +155,8 @@ async def async_setup_entry(
         if missing_ids:
             async_add_entities(
                 [
-                    *[PersonWeekTasksSensor(entry, board_store, person_id) for person_id in missing_ids],
-                    *[NextThreeTasksPersonSensor(entry, board_store, person_id) for person_id in missing_ids],
+                    *[PersonWeekTasksSensor(entry, board_store, view_model, person_id) for person_id in missing_ids],
+                    *[NextThreeTasksPersonSensor(entry, board_store, view_model, person_id) for person_id in missing_ids],
                 ]
             )
 
@@ -236,11 +239,11 @@ class BoardStateSensor(SensorEntity):
         self.async_write_ha_state()
 
     @property
-    def native_value(self) -> str | None:
-        """Return last update timestamp."""
+    def native_value(self) -> int | None:
+        """Return the board revision."""
         board = getattr(self._board_store, "_data", None)
         if isinstance(board, dict):
-            return str(board.get("updated_at") or "")
+            return self._board_store.revision
         return None
 
     @property
@@ -249,49 +252,72 @@ class BoardStateSensor(SensorEntity):
         board = getattr(self._board_store, "_data", None) or {}
         return {
             "entry_id": self._entry.entry_id,
+            "persistence": self._board_store.write_stats,
+            "maintenance": self._board_store.last_maintenance,
+            "stats_cache": self._board_store.stats_cache_info,
             "board": {
                 "people": board.get("people", []),
-                "tasks": board.get("tasks", []),
+                "tasks": [task.as_dict() for task in board.get("tasks", [])],
                 "templates": board.get("templates", []),
+                "revision": board.get("revision", 0),
                 "updated_at": board.get("updated_at", ""),
             },
         }
 
 
-class PersonWeekTasksSensor(SensorEntity):
-    """Sensor exposing one person's selected-week task summary."""
+class _BoardViewSensor(SensorEntity):
+    """Base for sensors fed by the entry's ``BoardViewModel``.
+
+    The view model computes every view once per board change and only calls
+    sensors whose view actually changed, so unchanged sensors skip the write.
+    """
 
-    _attr_icon = "mdi:account-check"
-    _attr_has_entity_name = False
     _attr_should_poll = False
 
-    def __init__(self, entry: ConfigEntry, board_store: Any, person_id: str) -> None:
+    def __init__(self, entry: ConfigEntry, board_store: Any, view_model: BoardViewModel, view_key: ViewKey) -> None:
         self._entry = entry
         self._board_store = board_store
+        self._view_model = view_model
+        self._view_key = view_key
+        self._unsub_view = None
+        self._apply_view(view_model.current(view_key))
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to view updates."""
+        self._unsub_view = self._view_model.async_subscribe(self._view_key, self._handle_view_updated)
+        self._apply_view(self._view_model.current(self._view_key))
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unsubscribe from view updates."""
+        if self._unsub_view:
+            self._unsub_view()
+            self._unsub_view = None
+
+    @callback
+    def _handle_view_updated(self, view: dict[str, Any]) -> None:
+        self._apply_view(view)
+        self.async_write_ha_state()
+
+    @abstractmethod
+    def _apply_view(self, view: dict[str, Any]) -> None:
+        """Copy a computed view into the entity attributes."""
+
+
+class PersonWeekTasksSensor(_BoardViewSensor):
+    """Sensor exposing one person's selected-week task summary."""
+
+    _attr_icon = "mdi:account-check"
+    _attr_has_entity_name = False
+
+    def __init__(self, entry: ConfigEntry, board_store: Any, view_model: BoardViewModel, person_id: str) -> None:
         self.person_id = str(person_id)
-        self._unsub_dispatcher = None
         self._stats: dict[str, Any] = {}
         self._person_name = self.person_id
         self._person_color = ""
         self._person_role = "adult"
-        self._refresh_from_board()
+        super().__init__(entry, board_store, view_model, (VIEW_PERSON_WEEK, self.person_id))
         self._attr_unique_id = f"{entry.entry_id}_person_week_{self.person_id}"
 
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to board update events."""
-        self._unsub_dispatcher = async_dispatcher_connect(
-            self.hass,
-            f"{SIGNAL_BOARD_UPDATED}_{self._entry.entry_id}",
-            self._handle_board_updated,
-        )
-        await self.async_update()
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from events."""
-        if self._unsub_dispatcher:
-            self._unsub_dispatcher()
-            self._unsub_dispatcher = None
-
     @property
     def name(self) -> str:
         """Return full entity name."""
@@ -325,29 +351,10 @@ class PersonWeekTasksSensor(SensorEntity):
         attrs["person_role"] = self._person_role
         return attrs
 
-    def _handle_board_updated(self) -> None:
-        """Handle board updates from store."""
-        self.hass.async_create_task(self._async_refresh_and_write())
-
-    async def _async_refresh_and_write(self) -> None:
-        await self.async_update()
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        """Refresh from the latest persisted board."""
-        try:
-            board = await self._board_store.async_load()
-        except Exception:  # noqa: BLE001
-            board = getattr(self._board_store, "_data", None) or {}
-        self._refresh_from_board(board)
-
-    def _refresh_from_board(self, board: dict[str, Any] | None = None) -> None:
-        board = board or getattr(self._board_store, "_data", None) or {}
-        stats = person_week_stats(board, self.person_id, week_offset=0)
-        self._stats = stats
-        people = board.get("people", []) if isinstance(board, dict) else []
-        person = next((item for item in people if str(item.get("id", "")) == self.person_id), None)
-        if isinstance(person, dict):
+    def _apply_view(self, view: dict[str, Any]) -> None:
+        self._stats = view["stats"]
+        person = view["person"]
+        if person:
             name = str(person.get("name") or "").strip()
             self._person_name = name or self.person_id
             self._person_color = str(person.get("color") or "")
@@ -355,40 +362,22 @@ class PersonWeekTasksSensor(SensorEntity):
             self._person_role = role_raw if role_raw in {"adult", "child"} else "adult"
 
 
-class NextThreeTasksSensor(SensorEntity):
+class NextThreeTasksSensor(_BoardViewSensor):
     """Sensor exposing the next three upcoming open tasks."""
 
     _attr_has_entity_name = True
     _attr_name = "Next 3 tasks"
     _attr_icon = "mdi:format-list-checks"
-    _attr_should_poll = False
 
-    def __init__(self, entry: ConfigEntry, board_store: Any) -> None:
-        self._entry = entry
-        self._board_store = board_store
-        self._unsub_dispatcher = None
+    def __init__(self, entry: ConfigEntry, board_store: Any, view_model: BoardViewModel) -> None:
         self._summary: dict[str, Any] = {"count": 0, "tasks": [], "titles": []}
+        super().__init__(entry, board_store, view_model, (VIEW_NEXT_TASKS, None))
         self._attr_unique_id = f"{entry.entry_id}_next_three_tasks"
 
     @property
     def suggested_object_id(self) -> str | None:
         return "household_chores_next_3_tasks"
 
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to board update events."""
-        self._unsub_dispatcher = async_dispatcher_connect(
-            self.hass,
-            f"{SIGNAL_BOARD_UPDATED}_{self._entry.entry_id}",
-            self._handle_board_updated,
-        )
-        await self.async_update()
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from events."""
-        if self._unsub_dispatcher:
-            self._unsub_dispatcher()
-            self._unsub_dispatcher = None
-
     @property
     def native_value(self) -> int:
         """Return number of available upcoming tasks (0..3)."""
@@ -403,54 +392,22 @@ class NextThreeTasksSensor(SensorEntity):
             "tasks": list(self._summary.get("tasks") or []),
         }
 
-    def _handle_board_updated(self) -> None:
-        """Handle board updates from store."""
-        self.hass.async_create_task(self._async_refresh_and_write())
-
-    async def _async_refresh_and_write(self) -> None:
-        await self.async_update()
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        """Refresh from latest persisted board."""
-        try:
-            board = await self._board_store.async_load()
-        except Exception:  # noqa: BLE001
-            board = getattr(self._board_store, "_data", None) or {}
-        self._summary = next_three_tasks_summary(board, limit=3)
+    def _apply_view(self, view: dict[str, Any]) -> None:
+        self._summary = view["summary"]
 
 
-class NextThreeTasksPersonSensor(SensorEntity):
+class NextThreeTasksPersonSensor(_BoardViewSensor):
     """Sensor exposing the next three upcoming open tasks for a single person."""
 
     _attr_has_entity_name = False
     _attr_icon = "mdi:format-list-checks"
-    _attr_should_poll = False
 
-    def __init__(self, entry: ConfigEntry, board_store: Any, person_id: str) -> None:
-        self._entry = entry
-        self._board_store = board_store
+    def __init__(self, entry: ConfigEntry, board_store: Any, view_model: BoardViewModel, person_id: str) -> None:
         self.person_id = str(person_id)
-        self._unsub_dispatcher = None
         self._summary: dict[str, Any] = {"count": 0, "tasks": [], "titles": []}
         self._person_name = self.person_id
+        super().__init__(entry, board_store, view_model, (VIEW_NEXT_TASKS, self.person_id))
         self._attr_unique_id = f"{entry.entry_id}_next_three_tasks_{self.person_id}"
-        self._refresh_person_fields(getattr(self._board_store, "_data", None) or {})
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to board update events."""
-        self._unsub_dispatcher = async_dispatcher_connect(
-            self.hass,
-            f"{SIGNAL_BOARD_UPDATED}_{self._entry.entry_id}",
-            self._handle_board_updated,
-        )
-        await self.async_update()
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from events."""
-        if self._unsub_dispatcher:
-            self._unsub_dispatcher()
-            self._unsub_dispatcher = None
 
     @property
     def name(self) -> str:
@@ -480,63 +437,30 @@ class NextThreeTasksPersonSensor(SensorEntity):
             "tasks": list(self._summary.get("tasks") or []),
         }
 
-    def _handle_board_updated(self) -> None:
-        self.hass.async_create_task(self._async_refresh_and_write())
-
-    async def _async_refresh_and_write(self) -> None:
-        await self.async_update()
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        try:
-            board = await self._board_store.async_load()
-        except Exception:  # noqa: BLE001
-            board = getattr(self._board_store, "_data", None) or {}
-        self._refresh_person_fields(board)
-        self._summary = next_three_tasks_summary(board, limit=3, person_id=self.person_id)
-
-    def _refresh_person_fields(self, board: dict[str, Any]) -> None:
-        people = board.get("people", []) if isinstance(board, dict) else []
-        person = next((item for item in people if str(item.get("id", "")) == self.person_id), None)
-        if isinstance(person, dict):
+    def _apply_view(self, view: dict[str, Any]) -> None:
+        self._summary = view["summary"]
+        person = view["person"]
+        if person:
             name = str(person.get("name") or "").strip()
             self._person_name = name or self.person_id
 
 
-class TodayTasksSensor(SensorEntity):
+class TodayTasksSensor(_BoardViewSensor):
     """Sensor exposing today's tasks for all people."""
 
     _attr_has_entity_name = True
     _attr_name = "Today's tasks"
     _attr_icon = "mdi:calendar-today"
-    _attr_should_poll = False
 
-    def __init__(self, entry: ConfigEntry, board_store: Any) -> None:
-        self._entry = entry
-        self._board_store = board_store
-        self._unsub_dispatcher = None
+    def __init__(self, entry: ConfigEntry, board_store: Any, view_model: BoardViewModel) -> None:
         self._today_stats: dict[str, Any] = {"count": 0, "tasks": []}
+        super().__init__(entry, board_store, view_model, (VIEW_TODAY, None))
         self._attr_unique_id = f"{entry.entry_id}_today_tasks"
 
     @property
     def suggested_object_id(self) -> str | None:
         return "household_chores_today_tasks"
 
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to board update events."""
-        self._unsub_dispatcher = async_dispatcher_connect(
-            self.hass,
-            f"{SIGNAL_BOARD_UPDATED}_{self._entry.entry_id}",
-            self._handle_board_updated,
-        )
-        await self.async_update()
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Unsubscribe from events."""
-        if self._unsub_dispatcher:
-            self._unsub_dispatcher()
-            self._unsub_dispatcher = None
-
     @property
     def native_value(self) -> int:
         """Return number of today's tasks."""
@@ -550,71 +474,5 @@ class TodayTasksSensor(SensorEntity):
             "tasks": list(self._today_stats.get("tasks", [])),
         }
 
-    def _handle_board_updated(self) -> None:
-        """Handle board updates from store."""
-        self.hass.async_create_task(self._async_refresh_and_write())
-
-    async def _async_refresh_and_write(self) -> None:
-        await self.async_update()
-        self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        """Refresh from latest persisted board."""
-        try:
-            board = await self._board_store.async_load()
-        except Exception:  # noqa: BLE001
-            board = getattr(self._board_store, "_data", None) or {}
-        self._today_stats = self._compute_today_tasks(board)
-
-    def _compute_today_tasks(self, board: dict[str, Any]) -> dict[str, Any]:
-        """Compute today's tasks from board."""
-        from homeassistant.util import dt as dt_util
-        from .stats import WEEKDAY_COLUMNS, WEEKDAY_INDEX, _start_of_week, _parse_iso_day
-
-        today = dt_util.as_local(dt_util.utcnow()).date()
-        today_key = WEEKDAY_COLUMNS[today.weekday()]
-        current_week_start = _start_of_week(today)
-        
-        people = board.get("people", []) if isinstance(board, dict) else []
-        tasks = board.get("tasks", []) if isinstance(board, dict) else []
-        
-        people_by_id = {
-            str(person.get("id", "")).strip(): str(person.get("name", "")).strip()
-            for person in people
-            if isinstance(person, dict) and str(person.get("id", "")).strip()
-        }
-
-        today_tasks = []
-        for raw in tasks:
-            if not isinstance(raw, dict):
-                continue
-            if str(raw.get("column") or "").lower() == "done":
-                continue
-                
-            column = str(raw.get("column") or "").lower()
-            if column != today_key:
-                continue
-                
-            raw_week_start = str(raw.get("week_start") or current_week_start.isoformat())
-            week_start_day = _parse_iso_day(raw_week_start)
-            normalized_start = _start_of_week(week_start_day if week_start_day is not None else current_week_start)
-            
-            if normalized_start != current_week_start:
-                continue
-            
-            assignees = raw.get("assignees", [])
-            assignee_names = [people_by_id.get(str(a), str(a)) for a in assignees]
-            
-            today_tasks.append({
-                "id": str(raw.get("id") or ""),
-                "title": str(raw.get("title") or "Untitled task"),
-                "assignees": assignee_names,
-                "column": column,
-            })
-
-        return {
-            "count": len(today_tasks),
-            "tasks": today_tasks,
-            "day": today_key,
-            "date": today.isoformat(),
-        }
+    def _apply_view(self, view: dict[str, Any]) -> None:
+        self._today_stats = view
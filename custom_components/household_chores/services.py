@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
 from uuid import uuid4
@@ -9,11 +10,16 @@ from uuid import uuid4
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
-from .board import BoardConflictError
+from .board import COLUMN_INDEX, BoardConflictError, BoardOperationError, BoardTransaction, Task, serialize_board
 from homeassistant.util import dt as dt_util
 
+from .archive import MAX_ARCHIVE_WEEKS
+from .assignment import ROLES, plan_week
 from .const import DOMAIN
-from .stats import WEEKDAY_COLUMNS, person_week_stats
+from .indexes import ALL_COLUMNS, BoardIndexes
+from .query import SORT_KEYS, STATES, InvalidCursorError, TaskQuery, run_query, task_day
+from .search import rank_titles
+from .stats import WEEKDAY_COLUMNS, week_stats
 
 SERVICE_SAVE_BOARD = "save_board"
 SERVICE_GET_PERSON_TASKS = "get_person_tasks"
@@ -22,11 +28,24 @@ SERVICE_CREATE_TASK = "create_task"
 SERVICE_UPDATE_TASK = "update_task"
 SERVICE_DELETE_TASK = "delete_task"
 SERVICE_LIST_TASKS = "list_tasks"
+SERVICE_CREATE_TASKS = "create_tasks"
+SERVICE_UPDATE_TASKS = "update_tasks"
+SERVICE_DELETE_TASKS = "delete_tasks"
+SERVICE_GET_COMPLETION_STATS = "get_completion_stats"
+SERVICE_SUGGEST_ASSIGNEES = "suggest_assignees"
+SERVICE_AUTO_ASSIGN_WEEK = "auto_assign_week"
+SERVICE_GET_UPCOMING = "get_upcoming"
+
+# Upper bound on items in one bulk call; all of them are committed as one board revision.
+MAX_BULK_TASKS = 500
+# Furthest get_upcoming looks ahead; weeks in range are loaded from storage first.
+MAX_UPCOMING_HORIZON_DAYS = 90
 
 _SAVE_SCHEMA = vol.Schema(
     {
         vol.Required("entry_id"): str,
         vol.Required("board"): dict,
+        vol.Optional("expected_revision"): vol.Coerce(int),
         vol.Optional("expected_updated_at"): str,
     }
 )
@@ -78,6 +97,12 @@ _DELETE_TASK_SCHEMA = vol.Schema(
         vol.Optional("assignee_names"): [str],
     }
 )
+_BULK_TASKS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entry_id"): str,
+        vol.Required("tasks"): vol.All([dict], vol.Length(min=1, max=MAX_BULK_TASKS)),
+    }
+)
 _LIST_TASKS_SCHEMA = vol.Schema(
     {
         vol.Optional("entry_id"): str,
@@ -87,8 +112,48 @@ _LIST_TASKS_SCHEMA = vol.Schema(
         vol.Optional("assignee_names"): [str],
         vol.Optional("include_done", default=False): bool,
         vol.Optional("limit", default=50): vol.Coerce(int),
+        vol.Optional("date_from"): str,
+        vol.Optional("date_to"): str,
+        vol.Optional("week_offset"): vol.Coerce(int),
+        vol.Optional("columns"): [vol.In(ALL_COLUMNS)],
+        vol.Optional("state"): vol.In(STATES),
+        vol.Optional("fixed"): bool,
+        vol.Optional("template_id"): str,
+        vol.Optional("dedupe_spans", default=False): bool,
+        vol.Optional("sort", default="date"): vol.In(SORT_KEYS),
+        vol.Optional("descending", default=False): bool,
+        vol.Optional("cursor"): str,
     }
 )
+_GET_COMPLETION_STATS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entry_id"): str,
+        vol.Optional("weeks", default=4): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_ARCHIVE_WEEKS)),
+        vol.Optional("person_id"): str,
+    }
+)
+_ASSIGN_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entry_id"): str,
+        vol.Optional("week_offset", default=0): vol.Coerce(int),
+        vol.Optional("roles", default=list(ROLES)): [vol.In(ROLES)],
+        vol.Optional("task_ids"): [str],
+    }
+)
+_GET_UPCOMING_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entry_id"): str,
+        vol.Optional("limit", default=3): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        vol.Optional("horizon_days"): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_UPCOMING_HORIZON_DAYS)),
+        vol.Optional("person_id"): str,
+    }
+)
+
+# Lowest title score update and delete act on without an exact title match; weaker matches are only listed.
+MUTATION_MATCH_SCORE = 0.9
+
+# Most weeks one list_tasks call loads; wider date ranges are rejected, open-ended ones answer partially.
+MAX_QUERY_WEEKS = 60
 
 
 async def async_register(hass: HomeAssistant) -> None:
@@ -103,11 +168,12 @@ async def async_register(hass: HomeAssistant) -> None:
         try:
             saved = await board_store.async_save(
                 board,
+                expected_revision=call.data.get("expected_revision"),
                 expected_updated_at=call.data.get("expected_updated_at"),
             )
         except BoardConflictError as err:
             return {"ok": False, "error": f"conflict: {err}"}
-        return {"ok": True, "entry_id": entry_id, "board": saved}
+        return {"ok": True, "entry_id": entry_id, "revision": board_store.revision, "board": serialize_board(saved)}
 
     async def _async_get_person_tasks(call: ServiceCall) -> ServiceResponse:
         entry_id = call.data["entry_id"]
@@ -116,8 +182,12 @@ async def async_register(hass: HomeAssistant) -> None:
         board_store = hass.data.get(DOMAIN, {}).get("boards", {}).get(entry_id)
         if board_store is None:
             return {"ok": False, "error": f"entry_not_found: {entry_id}"}
-        board = await board_store.async_load()
-        return {"ok": True, "entry_id": entry_id, **person_week_stats(board, person_id, week_offset)}
+        await board_store.async_load_week(week_offset)
+        return {
+            "ok": True,
+            "entry_id": entry_id,
+            **board_store.person_week_stats(person_id, week_offset),
+        }
 
     async def _async_get_week_summary(call: ServiceCall) -> ServiceResponse:
         entry_id = call.data["entry_id"]
@@ -125,85 +195,35 @@ async def async_register(hass: HomeAssistant) -> None:
         board_store = hass.data.get(DOMAIN, {}).get("boards", {}).get(entry_id)
         if board_store is None:
             return {"ok": False, "error": f"entry_not_found: {entry_id}"}
-        board = await board_store.async_load()
-        people = board.get("people", []) if isinstance(board, dict) else []
-        summaries = [
-            person_week_stats(board, str(person.get("id", "")), week_offset)
-            for person in people
-            if str(person.get("id", "")).strip()
-        ]
+        await board_store.async_load_week(week_offset)
+        summary = board_store.week_stats(week_offset)
         return {
             "ok": True,
             "entry_id": entry_id,
             "week_offset": week_offset,
-            "people": summaries,
-            "totals": {
-                "total": sum(int(item.get("total") or 0) for item in summaries),
-                "done": sum(int(item.get("done") or 0) for item in summaries),
-                "remaining": sum(int(item.get("remaining") or 0) for item in summaries),
-            },
+            "people": summary["people"],
+            "totals": summary["totals"],
         }
 
     async def _async_create_task(call: ServiceCall) -> ServiceResponse:
-        entry_id = _resolve_entry_id(hass, call.data.get("entry_id"))
-        if entry_id is None:
-            return {"ok": False, "error": "entry_id_required_or_ambiguous"}
-        board_store = hass.data.get(DOMAIN, {}).get("boards", {}).get(entry_id)
-        if board_store is None:
-            return {"ok": False, "error": f"entry_not_found: {entry_id}"}
+        return await _async_mutate_one(hass, call, _create_task_in, _create_task_weeks)
 
-        board = await board_store.async_load()
-        people_by_id, people_name_map = _people_maps(board)
-
-        title = str(call.data["title"]).strip()
-        task_date = _parse_date(call.data.get("date")) or dt_util.as_local(dt_util.utcnow()).date()
-        resolved_assignees, unknown_names = _resolve_assignees(
-            people_by_id,
-            people_name_map,
-            call.data.get("assignees", []),
-            call.data.get("assignee_names", []),
-        )
+    async def _async_update_task(call: ServiceCall) -> ServiceResponse:
+        return await _async_mutate_one(hass, call, _update_task_in, _update_task_weeks)
 
-        column = WEEKDAY_COLUMNS[task_date.weekday()]
-        week_start = _week_start_for_day(task_date)
-        week_number = week_start.isocalendar().week
+    async def _async_delete_task(call: ServiceCall) -> ServiceResponse:
+        return await _async_mutate_one(hass, call, _delete_task_in, lambda _data: [])
 
-        tasks = list(board.get("tasks", [])) if isinstance(board.get("tasks"), list) else []
-        order = sum(1 for task in tasks if str(task.get("column") or "").lower() == column)
-        created_at = datetime.now(UTC).isoformat()
-        new_task = {
-            "id": f"task_{uuid4().hex[:12]}",
-            "title": title,
-            "assignees": resolved_assignees,
-            "column": column,
-            "order": order,
-            "created_at": created_at,
-            "slot": call.data.get("slot"),
-            "end_date": task_date.isoformat(),
-            "template_id": None,
-            "fixed": False,
-            "span_id": None,
-            "span_index": 0,
-            "span_total": 0,
-            "week_start": week_start.isoformat(),
-            "week_number": week_number,
-        }
+    async def _async_create_tasks(call: ServiceCall) -> ServiceResponse:
+        return await _async_mutate_many(hass, call, _CREATE_TASK_SCHEMA, _create_task_in, _create_task_weeks)
 
-        next_board = dict(board)
-        next_board["tasks"] = [*tasks, new_task]
-        saved = await board_store.async_save(next_board)
+    async def _async_update_tasks(call: ServiceCall) -> ServiceResponse:
+        return await _async_mutate_many(hass, call, _UPDATE_TASK_SCHEMA, _update_task_in, _update_task_weeks)
 
-        return {
-            "ok": True,
-            "entry_id": entry_id,
-            "task": new_task,
-            "resolved_assignees": resolved_assignees,
-            "resolved_assignee_names": _assignee_names_from_ids(people_by_id, resolved_assignees),
-            "unknown_assignee_names": unknown_names,
-            "board_updated_at": saved.get("updated_at", created_at),
-        }
+    async def _async_delete_tasks(call: ServiceCall) -> ServiceResponse:
+        return await _async_mutate_many(hass, call, _DELETE_TASK_SCHEMA, _delete_task_in, lambda _data: [])
 
-    async def _async_update_task(call: ServiceCall) -> ServiceResponse:
+    async def _async_list_tasks(call: ServiceCall) -> ServiceResponse:
         entry_id = _resolve_entry_id(hass, call.data.get("entry_id"))
         if entry_id is None:
             return {"ok": False, "error": "entry_id_required_or_ambiguous"}
@@ -213,153 +233,146 @@ async def async_register(hass: HomeAssistant) -> None:
 
         board = await board_store.async_load()
         people_by_id, people_name_map = _people_maps(board)
-        tasks = list(board.get("tasks", [])) if isinstance(board.get("tasks"), list) else []
-
-        matched = _find_matching_tasks(
-            tasks,
+        resolved_assignees, unknown_names = _resolve_assignees(
             people_by_id,
             people_name_map,
-            task_id=call.data.get("task_id"),
-            title=call.data.get("title"),
-            task_date=call.data.get("date"),
-            assignees=call.data.get("assignees", []),
-            assignee_names=call.data.get("assignee_names", []),
+            call.data.get("assignees", []),
+            call.data.get("assignee_names", []),
         )
-        if not matched:
-            return {"ok": False, "error": "task_not_found"}
-        if len(matched) > 1:
-            return {"ok": False, "error": "task_ambiguous", "matches": matched}
-
-        target = matched[0]
-        task_index = next((idx for idx, task in enumerate(tasks) if str(task.get("id")) == str(target.get("id"))), None)
-        if task_index is None:
-            return {"ok": False, "error": "task_not_found"}
-
-        new_title = str(call.data.get("new_title") or target.get("title") or "").strip() or str(target.get("title") or "")
-        new_date = _parse_date(call.data.get("new_date")) or _parse_date(target.get("end_date")) or dt_util.as_local(dt_util.utcnow()).date()
-        if "new_assignees" in call.data or "new_assignee_names" in call.data:
-            resolved_assignees, unknown_names = _resolve_assignees(
-                people_by_id,
-                people_name_map,
-                call.data.get("new_assignees", []),
-                call.data.get("new_assignee_names", []),
-            )
+        query = _list_query(call.data, resolved_assignees)
+        limit = max(1, min(500, int(call.data.get("limit", 50))))
+
+        first_week, last_week = query.weeks()
+        partial = False
+        if first_week is not None and last_week is not None:
+            first, last = date.fromisoformat(first_week), date.fromisoformat(last_week)
+            week_count = (last - first).days // 7 + 1
+            if week_count > MAX_QUERY_WEEKS:
+                return {
+                    "ok": False,
+                    "error": "range_too_large",
+                    "message": f"Date range covers {week_count} weeks; at most {MAX_QUERY_WEEKS} can be listed at once",
+                }
+            await board_store.async_ensure_weeks((first + timedelta(weeks=offset)).isoformat() for offset in range(week_count))
         else:
-            resolved_assignees = [str(item) for item in target.get("assignees", [])]
-            unknown_names = []
-
-        column = WEEKDAY_COLUMNS[new_date.weekday()]
-        week_start = _week_start_for_day(new_date)
-        week_number = week_start.isocalendar().week
-
-        updated_task = dict(target)
-        updated_task.update(
-            {
-                "title": new_title,
-                "assignees": resolved_assignees,
-                "column": column,
-                "slot": call.data.get("new_slot", target.get("slot")),
-                "end_date": new_date.isoformat(),
-                "week_start": week_start.isoformat(),
-                "week_number": week_number,
-            }
-        )
-        tasks[task_index] = updated_task
-        _reindex_tasks(tasks)
+            # Open-ended: only weeks stored on disk can add tasks beyond the ones in memory.
+            stored = [
+                week
+                for week in board_store.stored_weeks
+                if (first_week is None or week >= first_week) and (last_week is None or week <= last_week)
+            ]
+            if len(stored) <= MAX_QUERY_WEEKS:
+                await board_store.async_ensure_weeks(stored)
+            else:
+                partial = True
+
+        if (call.data.get("assignees") or call.data.get("assignee_names")) and not resolved_assignees:
+            # Nobody on the board matches the requested people, so no task can.
+            page, next_cursor = [], None
+        else:
+            try:
+                page, next_cursor = run_query(board_store.indexes, query, limit=limit, cursor=call.data.get("cursor"))
+            except InvalidCursorError as err:
+                return {"ok": False, "error": "invalid_cursor", "message": str(err)}
 
-        next_board = dict(board)
-        next_board["tasks"] = tasks
-        saved = await board_store.async_save(next_board)
         return {
             "ok": True,
             "entry_id": entry_id,
-            "task": updated_task,
-            "resolved_assignees": resolved_assignees,
-            "resolved_assignee_names": _assignee_names_from_ids(people_by_id, resolved_assignees),
+            "count": len(page),
+            "tasks": [_task_to_response(task, people_by_id) for task in page],
+            "next_cursor": next_cursor,
             "unknown_assignee_names": unknown_names,
-            "board_updated_at": saved.get("updated_at", datetime.now(UTC).isoformat()),
+            "board_revision": board_store.revision,
+            **_searched_window(board_store.loaded_weeks, partial),
         }
 
-    async def _async_delete_task(call: ServiceCall) -> ServiceResponse:
-        entry_id = _resolve_entry_id(hass, call.data.get("entry_id"))
-        if entry_id is None:
-            return {"ok": False, "error": "entry_id_required_or_ambiguous"}
-        board_store = hass.data.get(DOMAIN, {}).get("boards", {}).get(entry_id)
-        if board_store is None:
-            return {"ok": False, "error": f"entry_not_found: {entry_id}"}
-
-        board = await board_store.async_load()
-        people_by_id, people_name_map = _people_maps(board)
-        tasks = list(board.get("tasks", [])) if isinstance(board.get("tasks"), list) else []
-
-        matched = _find_matching_tasks(
-            tasks,
-            people_by_id,
-            people_name_map,
-            task_id=call.data.get("task_id"),
-            title=call.data.get("title"),
-            task_date=call.data.get("date"),
-            assignees=call.data.get("assignees", []),
-            assignee_names=call.data.get("assignee_names", []),
+    async def _async_get_completion_stats(call: ServiceCall) -> ServiceResponse:
+        entry_id, board_store, error = _board_for_call(hass, call)
+        if error is not None:
+            return error
+        stats = await board_store.async_completion_stats(call.data["weeks"], call.data.get("person_id"))
+        return {"ok": True, "entry_id": entry_id, **stats}
+
+    async def _async_suggest_assignees(call: ServiceCall) -> ServiceResponse:
+        entry_id, board_store, error = _board_for_call(hass, call)
+        if error is not None:
+            return error
+        week_offset = call.data["week_offset"]
+        board = await board_store.async_load_week(week_offset)
+        plan = plan_week(
+            board,
+            board_store.week_stats(week_offset),
+            indexes=board_store.indexes,
+            roles=call.data["roles"],
+            task_ids=call.data.get("task_ids"),
         )
-        if not matched:
-            return {"ok": False, "error": "task_not_found"}
-        if len(matched) > 1:
-            return {"ok": False, "error": "task_ambiguous", "matches": matched}
-
-        target = matched[0]
-        next_tasks = [task for task in tasks if str(task.get("id")) != str(target.get("id"))]
-        _reindex_tasks(next_tasks)
-
-        next_board = dict(board)
-        next_board["tasks"] = next_tasks
-        saved = await board_store.async_save(next_board)
         return {
             "ok": True,
             "entry_id": entry_id,
-            "deleted_task": target,
-            "board_updated_at": saved.get("updated_at", datetime.now(UTC).isoformat()),
+            "week_offset": week_offset,
+            **plan.as_dict(board.get("people", [])),
+            "board_revision": board_store.revision,
         }
 
-    async def _async_list_tasks(call: ServiceCall) -> ServiceResponse:
-        entry_id = _resolve_entry_id(hass, call.data.get("entry_id"))
-        if entry_id is None:
-            return {"ok": False, "error": "entry_id_required_or_ambiguous"}
-        board_store = hass.data.get(DOMAIN, {}).get("boards", {}).get(entry_id)
-        if board_store is None:
-            return {"ok": False, "error": f"entry_not_found: {entry_id}"}
-
+    async def _async_auto_assign_week(call: ServiceCall) -> ServiceResponse:
+        entry_id, board_store, error = _board_for_call(hass, call)
+        if error is not None:
+            return error
+        week_offset = call.data["week_offset"]
+        week = (_week_start_for_day(dt_util.as_local(dt_util.utcnow()).date()) + timedelta(weeks=week_offset)).isoformat()
+
+        def _assign(txn: BoardTransaction) -> dict[str, Any]:
+            # Planned inside the transaction so calls queued before this one are already applied.
+            plan = plan_week(
+                txn.board,
+                week_stats(txn.board, week_offset, indexes=txn.indexes),
+                indexes=txn.indexes,
+                roles=call.data["roles"],
+                task_ids=call.data.get("task_ids"),
+            )
+            for assignment in plan.assignments:
+                for task_id in assignment.task_ids:
+                    txn.patch_task(task_id, {"assignees": [assignment.person_id]})
+            return plan.as_dict(txn.board.get("people", []))
+
+        response, result = await board_store.async_mutate(_assign, weeks=[week])
+        return _with_revision({"ok": True, "entry_id": entry_id, "week_offset": week_offset, **response}, result)
+
+    async def _async_get_upcoming(call: ServiceCall) -> ServiceResponse:
+        entry_id, board_store, error = _board_for_call(hass, call)
+        if error is not None:
+            return error
+        limit = call.data["limit"]
+        horizon_days = call.data.get("horizon_days")
         board = await board_store.async_load()
-        people_by_id, people_name_map = _people_maps(board)
-        tasks = list(board.get("tasks", [])) if isinstance(board.get("tasks"), list) else []
-        include_done = bool(call.data.get("include_done", False))
-        limit = max(1, min(500, int(call.data.get("limit", 50))))
-
-        matched = _find_matching_tasks(
-            tasks,
-            people_by_id,
-            people_name_map,
-            task_id=None,
-            title=call.data.get("title"),
-            task_date=call.data.get("date"),
-            assignees=call.data.get("assignees", []),
-            assignee_names=call.data.get("assignee_names", []),
-        )
-        if call.data.get("title") or call.data.get("date") or call.data.get("assignees") or call.data.get("assignee_names"):
-            filtered = matched
-        else:
-            filtered = tasks
-
-        if not include_done:
-            filtered = [task for task in filtered if str(task.get("column") or "").lower() != "done"]
-
-        filtered = filtered[:limit]
-        payload = [_task_to_response(task, people_by_id) for task in filtered]
+        if horizon_days is not None:
+            today = dt_util.as_local(dt_util.utcnow()).date()
+            first = _week_start_for_day(today)
+            await board_store.async_ensure_weeks(
+                (first + timedelta(weeks=offset)).isoformat()
+                for offset in range((_week_start_for_day(today + timedelta(days=horizon_days)) - first).days // 7 + 1)
+            )
+        upcoming = board_store.upcoming_tasks(limit, horizon_days)
+        people_by_id, _people_name_map = _people_maps(board)
+        person_id = call.data.get("person_id")
+        if person_id is not None and person_id not in upcoming["people"]:
+            return {"ok": False, "error": f"person_not_found: {person_id}"}
+        people = [person_id] if person_id is not None else list(upcoming["people"])
         return {
             "ok": True,
             "entry_id": entry_id,
-            "count": len(payload),
-            "tasks": payload,
+            "limit": limit,
+            "horizon_days": horizon_days,
+            "household": upcoming["household"],
+            "people": [
+                {
+                    "person_id": pid,
+                    "person_name": str(people_by_id.get(pid, {}).get("name", "")),
+                    **upcoming["people"][pid],
+                }
+                for pid in people
+            ],
+            "board_revision": board_store.revision,
         }
 
     if not hass.services.has_service(DOMAIN, SERVICE_SAVE_BOARD):
@@ -410,6 +423,19 @@ async def async_register(hass: HomeAssistant) -> None:
             schema=_DELETE_TASK_SCHEMA,
             supports_response=SupportsResponse.ONLY,
         )
+    for service, handler, schema in (
+        (SERVICE_CREATE_TASKS, _async_create_tasks, _BULK_TASKS_SCHEMA),
+        (SERVICE_UPDATE_TASKS, _async_update_tasks, _BULK_TASKS_SCHEMA),
+        (SERVICE_DELETE_TASKS, _async_delete_tasks, _BULK_TASKS_SCHEMA),
+    ):
+        if not hass.services.has_service(DOMAIN, service):
+            hass.services.async_register(
+                DOMAIN,
+                service,
+                handler,
+                schema=schema,
+                supports_response=SupportsResponse.ONLY,
+            )
     if not hass.services.has_service(DOMAIN, SERVICE_LIST_TASKS):
         hass.services.async_register(
             DOMAIN,
@@ -418,6 +444,251 @@ async def async_register(hass: HomeAssistant) -> None:
             schema=_LIST_TASKS_SCHEMA,
             supports_response=SupportsResponse.ONLY,
         )
+    for service, handler in (
+        (SERVICE_SUGGEST_ASSIGNEES, _async_suggest_assignees),
+        (SERVICE_AUTO_ASSIGN_WEEK, _async_auto_assign_week),
+    ):
+        if not hass.services.has_service(DOMAIN, service):
+            hass.services.async_register(
+                DOMAIN,
+                service,
+                handler,
+                schema=_ASSIGN_SCHEMA,
+                supports_response=SupportsResponse.ONLY,
+            )
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_UPCOMING):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_UPCOMING,
+            _async_get_upcoming,
+            schema=_GET_UPCOMING_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_COMPLETION_STATS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_COMPLETION_STATS,
+            _async_get_completion_stats,
+            schema=_GET_COMPLETION_STATS_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+
+def _board_for_call(hass: HomeAssistant, call: ServiceCall) -> tuple[str | None, Any, dict[str, Any] | None]:
+    """Resolve the target entry of a task service call, or an error response."""
+    entry_id = _resolve_entry_id(hass, call.data.get("entry_id"))
+    if entry_id is None:
+        return None, None, {"ok": False, "error": "entry_id_required_or_ambiguous"}
+    board_store = hass.data.get(DOMAIN, {}).get("boards", {}).get(entry_id)
+    if board_store is None:
+        return entry_id, None, {"ok": False, "error": f"entry_not_found: {entry_id}"}
+    return entry_id, board_store, None
+
+
+async def _async_mutate_one(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    apply: Callable[[BoardTransaction, dict[str, Any]], dict[str, Any]],
+    weeks: Callable[[dict[str, Any]], list[str]],
+) -> ServiceResponse:
+    entry_id, board_store, error = _board_for_call(hass, call)
+    if error is not None:
+        return error
+    data = dict(call.data)
+    try:
+        response, result = await board_store.async_mutate(lambda txn: apply(txn, data), weeks=weeks(data))
+    except BoardOperationError as err:
+        return {"ok": False, "error": err.code, "message": str(err)}
+    return _with_revision({"entry_id": entry_id, **response}, result)
+
+
+async def _async_mutate_many(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    item_schema: vol.Schema,
+    apply: Callable[[BoardTransaction, dict[str, Any]], dict[str, Any]],
+    weeks: Callable[[dict[str, Any]], list[str]],
+) -> ServiceResponse:
+    """Apply every item of a bulk call in one queued transaction and report per item."""
+    entry_id, board_store, error = _board_for_call(hass, call)
+    if error is not None:
+        return error
+
+    items: list[tuple[dict[str, Any] | None, str | None]] = []
+    for raw in call.data["tasks"]:
+        try:
+            items.append((item_schema(raw), None))
+        except vol.Invalid as err:
+            items.append((None, f"invalid_item: {err}"))
+
+    def _apply_all(txn: BoardTransaction) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+        for index, (data, item_error) in enumerate(items):
+            if data is None:
+                results.append({"index": index, "ok": False, "error": item_error})
+                continue
+            try:
+                results.append({"index": index, **apply(txn, data)})
+            except BoardOperationError as err:
+                results.append({"index": index, "ok": False, "error": err.code, "message": str(err)})
+        return results
+
+    item_weeks = [week for data, _error in items if data is not None for week in weeks(data)]
+    results, result = await board_store.async_mutate(_apply_all, weeks=item_weeks)
+    succeeded = sum(1 for item in results if item.get("ok"))
+    return {
+        "ok": True,
+        "entry_id": entry_id,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+        "board_revision": result["revision"],
+        "board_updated_at": result["updated_at"],
+    }
+
+
+def _create_task_date(data: dict[str, Any]) -> date:
+    return _parse_date(data.get("date")) or dt_util.as_local(dt_util.utcnow()).date()
+
+
+def _create_task_weeks(data: dict[str, Any]) -> list[str]:
+    return [_week_start_for_day(_create_task_date(data)).isoformat()]
+
+
+def _update_task_weeks(data: dict[str, Any]) -> list[str]:
+    requested_date = _parse_date(data.get("new_date"))
+    return [_week_start_for_day(requested_date).isoformat()] if requested_date else []
+
+
+def _create_task_in(txn: BoardTransaction, data: dict[str, Any]) -> dict[str, Any]:
+    people_by_id, people_name_map = _people_maps(txn.board)
+    resolved_assignees, unknown_names = _resolve_assignees(
+        people_by_id,
+        people_name_map,
+        data.get("assignees", []),
+        data.get("assignee_names", []),
+    )
+    task_date = _create_task_date(data)
+    week_start = _week_start_for_day(task_date)
+    created = txn.add_task(
+        {
+            "id": f"task_{uuid4().hex[:12]}",
+            "title": str(data["title"]).strip(),
+            "assignees": resolved_assignees,
+            "column": WEEKDAY_COLUMNS[task_date.weekday()],
+            "created_at": datetime.now(UTC).isoformat(),
+            "slot": data.get("slot"),
+            "end_date": task_date.isoformat(),
+            "template_id": None,
+            "fixed": False,
+            "span_id": None,
+            "span_index": 0,
+            "span_total": 0,
+            "week_start": week_start.isoformat(),
+            "week_number": week_start.isocalendar().week,
+        }
+    )
+    return {
+        "ok": True,
+        "task": created.as_dict(),
+        "resolved_assignees": resolved_assignees,
+        "resolved_assignee_names": _assignee_names_from_ids(people_by_id, resolved_assignees),
+        "unknown_assignee_names": unknown_names,
+    }
+
+
+def _match_single_task(
+    txn: BoardTransaction,
+    data: dict[str, Any],
+    people_by_id: dict[str, dict[str, Any]],
+    people_name_map: dict[str, str],
+) -> tuple[Task | None, dict[str, Any] | None]:
+    """Return the one task a call refers to, or the not-found/ambiguous response.
+
+    Calls that change a task only act on an exact (casefolded) title or a
+    near-exact fuzzy match; anything weaker comes back as ``task_ambiguous``
+    with the candidates ranked, so a loose voice command never edits the
+    wrong task.
+    """
+    matched = _find_matching_tasks(
+        list(txn.board["tasks"]),
+        people_by_id,
+        people_name_map,
+        task_id=data.get("task_id"),
+        title=data.get("title"),
+        task_date=data.get("date"),
+        assignees=data.get("assignees", []),
+        assignee_names=data.get("assignee_names", []),
+        indexes=txn.indexes,
+    )
+    if not matched:
+        return None, {"ok": False, "error": "task_not_found"}
+    confident = matched
+    wanted_title = str(data.get("title") or "").strip().casefold()
+    if wanted_title and not str(data.get("task_id") or "").strip():
+        confident = [item for item in matched if item[0].title.strip().casefold() == wanted_title] or [
+            item for item in matched if item[1] >= MUTATION_MATCH_SCORE
+        ]
+    if len(confident) != 1:
+        return None, {
+            "ok": False,
+            "error": "task_ambiguous",
+            "matches": [{**task.as_dict(), "score": round(score, 3)} for task, score in matched],
+        }
+    return confident[0][0], None
+
+
+def _update_task_in(txn: BoardTransaction, data: dict[str, Any]) -> dict[str, Any]:
+    people_by_id, people_name_map = _people_maps(txn.board)
+    target, error = _match_single_task(txn, data, people_by_id, people_name_map)
+    if target is None:
+        return error or {"ok": False, "error": "task_not_found"}
+
+    new_title = str(data.get("new_title") or "").strip() or target.title
+    new_date = (
+        _parse_date(data.get("new_date")) or _parse_date(target.end_date) or dt_util.as_local(dt_util.utcnow()).date()
+    )
+    if "new_assignees" in data or "new_assignee_names" in data:
+        resolved_assignees, unknown_names = _resolve_assignees(
+            people_by_id,
+            people_name_map,
+            data.get("new_assignees", []),
+            data.get("new_assignee_names", []),
+        )
+    else:
+        resolved_assignees = list(target.assignees)
+        unknown_names = []
+
+    week_start = _week_start_for_day(new_date)
+    updated = txn.patch_task(
+        target.id,
+        {
+            "title": new_title,
+            "assignees": resolved_assignees,
+            "column": WEEKDAY_COLUMNS[new_date.weekday()],
+            "slot": data.get("new_slot", target.slot),
+            "end_date": new_date.isoformat(),
+            "week_start": week_start.isoformat(),
+            "week_number": week_start.isocalendar().week,
+        },
+    )
+    return {
+        "ok": True,
+        "task": updated.as_dict(),
+        "resolved_assignees": resolved_assignees,
+        "resolved_assignee_names": _assignee_names_from_ids(people_by_id, resolved_assignees),
+        "unknown_assignee_names": unknown_names,
+    }
+
+
+def _delete_task_in(txn: BoardTransaction, data: dict[str, Any]) -> dict[str, Any]:
+    people_by_id, people_name_map = _people_maps(txn.board)
+    target, error = _match_single_task(txn, data, people_by_id, people_name_map)
+    if target is None:
+        return error or {"ok": False, "error": "task_not_found"}
+    deleted = target.as_dict()
+    txn.delete_task(target.id, exclude_occurrence=True)
+    return {"ok": True, "deleted_task": deleted}
 
 
 def _people_maps(board: dict[str, Any]) -> tuple[dict[str, dict[str, Any]], dict[str, str]]:
@@ -470,7 +741,7 @@ def _assignee_names_from_ids(people_by_id: dict[str, dict[str, Any]], assignee_i
 
 
 def _find_matching_tasks(
-    tasks: list[dict[str, Any]],
+    tasks: list[Task],
     people_by_id: dict[str, dict[str, Any]],
     people_name_map: dict[str, str],
     *,
@@ -479,54 +750,112 @@ def _find_matching_tasks(
     task_date: Any = None,
     assignees: list[str] | None = None,
     assignee_names: list[str] | None = None,
-) -> list[dict[str, Any]]:
+    indexes: BoardIndexes | None = None,
+) -> list[tuple[Task, float]]:
+    """Return ``(task, score)`` candidates for a task reference, best match first.
+
+    Titles are matched fuzzily; when some titles equal the wanted one exactly,
+    only those are returned.
+    """
     if task_id is not None and str(task_id).strip():
         wanted_id = str(task_id).strip()
-        return [task for task in tasks if str(task.get("id") or "") == wanted_id]
+        if indexes is not None:
+            return [(task, 1.0) for task in indexes.tasks_for([wanted_id])]
+        return [(task, 1.0) for task in tasks if task.id == wanted_id]
 
-    wanted_title = str(title or "").strip().lower()
+    wanted_title = str(title or "").strip()
     wanted_date = _parse_date(task_date)
     resolved_assignees, _ = _resolve_assignees(people_by_id, people_name_map, assignees, assignee_names)
     wanted_assignees = set(resolved_assignees)
-
-    matches: list[dict[str, Any]] = []
-    for task in tasks:
-        if wanted_title and str(task.get("title") or "").strip().lower() != wanted_title:
-            continue
-        if wanted_date is not None and _parse_date(task.get("end_date")) != wanted_date:
-            continue
-        if wanted_assignees and set(str(item) for item in task.get("assignees", [])) != wanted_assignees:
+    if not wanted_title and wanted_date is None and not wanted_assignees:
+        return []
+
+    by_id = indexes.by_id if indexes is not None else {task.id: task for task in tasks}
+    if wanted_title:
+        scores = (
+            indexes.titles.search(wanted_title)
+            if indexes is not None
+            else rank_titles(wanted_title, ((task.id, task.title) for task in tasks))
+        )
+        candidates = [by_id[candidate_id] for candidate_id in scores]
+    elif indexes is not None and wanted_assignees:
+        # Exact assignee-set matching: only tasks holding every wanted person qualify.
+        candidate_ids = set.intersection(*(indexes.by_assignee.get(person_id, set()) for person_id in wanted_assignees))
+        scores = {}
+        candidates = indexes.tasks_for(candidate_ids)
+    else:
+        scores = {}
+        candidates = tasks
+
+    matches: list[tuple[Task, float]] = []
+    for task in candidates:
+        if wanted_date is not None and _parse_date(task.end_date) != wanted_date:
             continue
-        if not wanted_title and wanted_date is None and not wanted_assignees:
+        if wanted_assignees and set(task.assignees) != wanted_assignees:
             continue
-        matches.append(task)
+        matches.append((task, scores.get(task.id, 1.0)))
+    matches.sort(key=lambda item: (-item[1], item[0].week_start or "", COLUMN_INDEX[item[0].column], item[0].order))
+    if matches and matches[0][1] >= 1.0:
+        matches = [item for item in matches if item[1] >= 1.0]
     return matches
 
 
-def _task_to_response(task: dict[str, Any], people_by_id: dict[str, dict[str, Any]]) -> dict[str, Any]:
-    assignee_ids = [str(item) for item in task.get("assignees", [])]
+def _searched_window(loaded_weeks: list[str], partial: bool) -> dict[str, Any]:
+    """Describe which weeks an open-ended list_tasks call could not load."""
+    if not partial:
+        return {"partial": False}
     return {
-        "id": str(task.get("id") or ""),
-        "title": str(task.get("title") or ""),
-        "date": str(task.get("end_date") or ""),
-        "column": str(task.get("column") or ""),
-        "slot": task.get("slot"),
-        "assignees": assignee_ids,
-        "assignee_names": _assignee_names_from_ids(people_by_id, assignee_ids),
-        "week_start": str(task.get("week_start") or ""),
-        "week_number": task.get("week_number"),
-        "fixed": bool(task.get("fixed", False)),
-        "template_id": task.get("template_id"),
+        "partial": True,
+        "searched_from": loaded_weeks[0] if loaded_weeks else None,
+        "searched_to": (date.fromisoformat(loaded_weeks[-1]) + timedelta(days=6)).isoformat() if loaded_weeks else None,
     }
 
 
-def _reindex_tasks(tasks: list[dict[str, Any]]) -> None:
-    columns = [*WEEKDAY_COLUMNS, "done"]
-    for column in columns:
-        column_items = [task for task in tasks if str(task.get("column") or "").lower() == column]
-        column_items.sort(key=lambda item: int(item.get("order", 0)))
-        for idx, task in enumerate(column_items):
-            task["order"] = idx
+def _list_query(data: dict[str, Any], assignees: list[str]) -> TaskQuery:
+    """Build the list_tasks query; ``date`` and ``week_offset`` narrow the date range further."""
+    date_from = _parse_date(data.get("date_from"))
+    date_to = _parse_date(data.get("date_to"))
+    bounds: list[tuple[date, date]] = []
+    if (exact := _parse_date(data.get("date"))) is not None:
+        bounds.append((exact, exact))
+    if data.get("week_offset") is not None:
+        monday = _week_start_for_day(dt_util.as_local(dt_util.utcnow()).date()) + timedelta(weeks=int(data["week_offset"]))
+        bounds.append((monday, monday + timedelta(days=6)))
+    for lower, upper in bounds:
+        date_from = lower if date_from is None else max(date_from, lower)
+        date_to = upper if date_to is None else min(date_to, upper)
+
+    state = data.get("state") or ("all" if data.get("include_done") else "open")
+    columns = data.get("columns")
+    return TaskQuery(
+        title=data.get("title") or None,
+        date_from=date_from,
+        date_to=date_to,
+        columns=frozenset(columns) if columns else None,
+        state=state,
+        fixed=data.get("fixed"),
+        template_id=data.get("template_id") or None,
+        assignees=frozenset(assignees),
+        dedupe_spans=bool(data.get("dedupe_spans", False)),
+        sort=data.get("sort", "date"),
+        descending=bool(data.get("descending", False)),
+    )
+
+
+def _task_to_response(task: Task, people_by_id: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "id": task.id,
+        "title": task.title,
+        "date": day.isoformat() if (day := task_day(task)) is not None else "",
+        "column": task.column,
+        "slot": task.slot,
+        "assignees": list(task.assignees),
+        "assignee_names": _assignee_names_from_ids(people_by_id, task.assignees),
+        "week_start": task.week_start or "",
+        "week_number": task.week_number,
+        "fixed": task.fixed,
+        "template_id": task.template_id,
+    }
 
 
 def _parse_date(value: Any) -> date | None:
@@ -547,6 +876,13 @@ def _week_start_for_day(day_value: date) -> date:
     return day_value - timedelta(days=day_value.weekday())
 
 
+def _with_revision(response: dict[str, Any], result: dict[str, Any]) -> dict[str, Any]:
+    """Add the board revision a queued mutation was committed in to a successful response."""
+    if not response.get("ok"):
+        return response
+    return {**response, "board_revision": result["revision"], "board_updated_at": result["updated_at"]}
+
+
 def _resolve_entry_id(hass: HomeAssistant, entry_id: Any) -> str | None:
     """Resolve explicit entry_id or auto-select the only board entry."""
     if entry_id is not None:
@@ -0,0 +1,92 @@
+"""Per-week task shards stored next to the core board file."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import date
+from typing import Any
+
+from homeassistant.helpers.storage import Store
+
+SHARD_VERSION = 1
+
+
+class BoardShards:
+    """One Store per ISO week of tasks, loaded and rewritten independently.
+
+    Weeks are keyed by their Monday iso date. ``known`` lists weeks that have
+    a file on disk, ``loaded`` the weeks merged into the in-memory board.
+    """
+
+    def __init__(self, hass, key: str) -> None:
+        self._hass = hass
+        self._key = key
+        self._stores: dict[str, Store[dict[str, Any]]] = {}
+        self._digests: dict[str, str] = {}
+        self.known: set[str] = set()
+        self.loaded: set[str] = set()
+        self.writes = 0
+
+    async def async_load_week(self, week: str) -> list[dict[str, Any]]:
+        """Return the raw tasks of one week and mark it loaded."""
+        self.loaded.add(week)
+        return await self.async_read_week(week)
+
+    async def async_read_week(self, week: str) -> list[dict[str, Any]]:
+        """Return the raw tasks of one week without marking it loaded."""
+        if week not in self.known:
+            return []
+        raw = await self._store(week).async_load()
+        tasks = raw.get("tasks") if isinstance(raw, dict) else None
+        return [task for task in tasks if isinstance(task, dict)] if isinstance(tasks, list) else []
+
+    def mark_clean(self, week: str, tasks: list[dict[str, Any]]) -> None:
+        """Record that the file for ``week`` holds exactly ``tasks``."""
+        self._digests[week] = _digest(tasks)
+
+    def forget_digests(self) -> None:
+        """Force every loaded week to be rewritten on the next snapshot."""
+        self._digests.clear()
+
+    async def async_write(self, tasks_by_week: dict[str, list[dict[str, Any]]]) -> None:
+        """Rewrite the loaded weeks whose tasks changed since they were last written."""
+        for week in sorted(self.loaded | set(tasks_by_week)):
+            tasks = tasks_by_week.get(week, [])
+            digest = _digest(tasks)
+            if self._digests.get(week) == digest:
+                continue
+            self._digests[week] = digest
+            self.loaded.add(week)
+            if tasks:
+                await self._store(week).async_save({"week_start": week, "tasks": tasks})
+                self.known.add(week)
+            elif week in self.known:
+                await self._store(week).async_remove()
+                self.known.discard(week)
+            else:
+                continue
+            self.writes += 1
+
+    def stale_weeks(self, week: str) -> list[str]:
+        """Return the unloaded weeks on disk older than ``week``."""
+        return sorted(item for item in self.known - self.loaded if item < week)
+
+    async def async_remove_before(self, week: str) -> None:
+        """Delete files of unloaded weeks older than ``week``."""
+        for stale in self.stale_weeks(week):
+            await self._store(stale).async_remove()
+            self.known.discard(stale)
+            self._stores.pop(stale, None)
+
+    def _store(self, week: str) -> Store[dict[str, Any]]:
+        store = self._stores.get(week)
+        if store is None:
+            iso_year, iso_week, _weekday = date.fromisoformat(week).isocalendar()
+            store = Store(self._hass, SHARD_VERSION, f"{self._key}_week_{iso_year}-W{iso_week:02d}")
+            self._stores[week] = store
+        return store
+
+
+def _digest(tasks: list[dict[str, Any]]) -> str:
+    return hashlib.sha1(json.dumps(tasks, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
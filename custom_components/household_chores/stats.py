@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator
 from datetime import date, timedelta
-from typing import Any
+import heapq
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.util import dt as dt_util
 
+if TYPE_CHECKING:
+    from .board import Task
+    from .indexes import BoardIndexes
+
 WEEKDAY_COLUMNS = [
     "monday",
     "tuesday",
@@ -17,6 +24,8 @@ WEEKDAY_COLUMNS = [
     "sunday",
 ]
 WEEKDAY_INDEX = {day: idx for idx, day in enumerate(WEEKDAY_COLUMNS)}
+# Derived views kept per board store; a household needs a handful per revision.
+STATS_CACHE_SIZE = 128
 
 
 def _start_of_week(day_value: date, offset: int = 0) -> date:
@@ -45,76 +54,118 @@ def week_bounds(offset: int = 0) -> tuple[str, str, int]:
     return start.isoformat(), end.isoformat(), _week_number(start)
 
 
-def person_week_stats(board: dict[str, Any], person_id: str, week_offset: int = 0) -> dict[str, Any]:
-    """Build per-person task stats for one week."""
+def week_stats(
+    board: dict[str, Any],
+    week_offset: int = 0,
+    *,
+    person_ids: Iterable[str] | None = None,
+    indexes: BoardIndexes | None = None,
+) -> dict[str, Any]:
+    """Build per-person task stats for one week, plus their totals, in one pass.
+
+    ``person_ids`` defaults to every board person. Each task of the week is
+    visited once and counted for each requested assignee; with store indexes
+    only that week's tasks are visited (only the person's for a single person).
+    """
     today = dt_util.as_local(dt_util.utcnow()).date()
     selected_start = _start_of_week(today, week_offset)
     selected_start_iso = selected_start.isoformat()
     selected_end_iso = (selected_start + timedelta(days=6)).isoformat()
-    selected_week_number = _week_number(selected_start)
     today_key = WEEKDAY_COLUMNS[today.weekday()]
     people = board.get("people", []) if isinstance(board, dict) else []
-    tasks = board.get("tasks", []) if isinstance(board, dict) else []
+    tasks: Iterable[Task] = board.get("tasks", []) if isinstance(board, dict) else []
 
-    person_name = ""
+    person_names: dict[str, str] = {}
     for person in people:
-        if str(person.get("id", "")) == str(person_id):
-            person_name = str(person.get("name", "")).strip()
-            break
-    person_name_key = person_name.strip().lower()
+        person_names.setdefault(str(person.get("id", "")), str(person.get("name", "")).strip())
+    if person_ids is None:
+        wanted = [person_id for person_id in person_names if person_id.strip()]
+    else:
+        wanted = list(dict.fromkeys(str(person_id) for person_id in person_ids))
+    by_person: dict[str, dict[str, dict[str, Any]]] = {person_id: {} for person_id in wanted}
 
-    def _normalize_assignee(value: Any) -> str:
-        if isinstance(value, dict):
-            candidate = value.get("id", "") or value.get("person_id", "") or value.get("name", "")
-            return str(candidate).strip()
-        return str(value or "").strip()
+    if indexes is not None:
+        tasks = indexes.week_tasks(selected_start_iso, person_id=wanted[0] if len(wanted) == 1 else None)
 
-    by_key: dict[str, dict[str, Any]] = {}
-    for raw in tasks:
-        if not isinstance(raw, dict):
-            continue
-        assignees = [_normalize_assignee(item) for item in raw.get("assignees", [])]
-        assignees_lower = [item.lower() for item in assignees]
-        if (
-            str(person_id) not in assignees
-            and person_name_key not in assignees_lower
-        ):
+    # Store tasks are normalized: assignees are person ids and columns are canonical.
+    in_week: dict[str, bool] = {}
+    for task in tasks:
+        targets = [by_person[person_id] for person_id in task.assignees if person_id in by_person]
+        if not targets:
             continue
 
-        column = str(raw.get("column") or "monday").lower()
-        task_week_start = str(raw.get("week_start") or selected_start_iso)
-        task_week_day = _parse_iso_day(task_week_start)
-        if task_week_day is None:
-            normalized_task_start = selected_start
-        else:
-            normalized_task_start = _start_of_week(task_week_day, 0)
-        if normalized_task_start != selected_start:
-            continue
-        if column not in WEEKDAY_INDEX and column != "done":
+        column = task.column
+        task_week_start = task.week_start or selected_start_iso
+        matches = in_week.get(task_week_start)
+        if matches is None:
+            task_week_day = _parse_iso_day(task_week_start)
+            matches = task_week_day is None or _start_of_week(task_week_day, 0) == selected_start
+            in_week[task_week_start] = matches
+        if not matches:
             continue
 
-        task_id = str(raw.get("id") or "")
-        span_id = str(raw.get("span_id") or "")
-        key = f"span:{span_id}:{task_week_start}" if span_id else (task_id or f"row:{len(by_key)}")
-        item = by_key.get(key)
-        if item is None:
-            item = {
-                "id": task_id,
-                "title": str(raw.get("title") or "Untitled task"),
-                "done": False,
-                "fixed": bool(raw.get("fixed", False)),
-                "template_id": str(raw.get("template_id") or ""),
-                "end_date": str(raw.get("end_date") or ""),
-                "slot": str(raw.get("slot") or "").lower(),
-                "days": [],
-            }
-            by_key[key] = item
-        if column == "done":
-            item["done"] = True
-        elif column in WEEKDAY_INDEX and column not in item["days"]:
-            item["days"].append(column)
-
-    rows = list(by_key.values())
+        key = f"span:{task.span_id}:{task_week_start}" if task.span_id else task.id
+        for by_key in targets:
+            item = by_key.get(key)
+            if item is None:
+                item = {
+                    "id": task.id,
+                    "title": task.title,
+                    "done": False,
+                    "fixed": task.fixed,
+                    "template_id": task.template_id or "",
+                    "end_date": task.end_date or "",
+                    "slot": task.slot or "",
+                    "days": [],
+                }
+                by_key[key] = item
+            if column == "done":
+                item["done"] = True
+            elif column in WEEKDAY_INDEX and column not in item["days"]:
+                item["days"].append(column)
+
+    summaries = [
+        {
+            "person_id": person_id,
+            "person_name": person_names.get(person_id, ""),
+            "week_offset": int(week_offset),
+            "week_start": selected_start_iso,
+            "week_end": selected_end_iso,
+            "week_number": _week_number(selected_start),
+            **_person_totals(list(by_person[person_id].values()), today_key if week_offset == 0 else None),
+        }
+        for person_id in wanted
+    ]
+    return {
+        "week_offset": int(week_offset),
+        "week_start": selected_start_iso,
+        "week_end": selected_end_iso,
+        "week_number": _week_number(selected_start),
+        "people": summaries,
+        "totals": {
+            "total": sum(item["total"] for item in summaries),
+            "done": sum(item["done"] for item in summaries),
+            "remaining": sum(item["remaining"] for item in summaries),
+        },
+    }
+
+
+def person_week_stats(
+    board: dict[str, Any],
+    person_id: str,
+    week_offset: int = 0,
+    *,
+    indexes: BoardIndexes | None = None,
+) -> dict[str, Any]:
+    """Build per-person task stats for one week.
+
+    With store indexes only the person's tasks in that week are visited.
+    """
+    return week_stats(board, week_offset, person_ids=[str(person_id)], indexes=indexes)["people"][0]
+
+
+def _person_totals(rows: list[dict[str, Any]], today_key: str | None) -> dict[str, Any]:
+    """Finish one person's rows and count them; today/upcoming only apply to the current week."""
     for row in rows:
         row["days"] = sorted(row["days"], key=lambda day: WEEKDAY_INDEX.get(day, 99))
         if row["days"]:
@@ -125,10 +176,9 @@ def person_week_stats(board: dict[str, Any], person_id: str, week_offset: int =
 
     total = len(rows)
     done = sum(1 for row in rows if row["done"])
-    remaining = total - done
     today_count = 0
     upcoming_count = 0
-    if week_offset == 0:
+    if today_key is not None:
         for row in rows:
             if row["done"]:
                 continue
@@ -139,112 +189,230 @@ def person_week_stats(board: dict[str, Any], person_id: str, week_offset: int =
                 upcoming_count += 1
 
     return {
-        "person_id": str(person_id),
-        "person_name": person_name,
-        "week_offset": int(week_offset),
-        "week_start": selected_start_iso,
-        "week_end": selected_end_iso,
-        "week_number": selected_week_number,
         "total": total,
         "done": done,
-        "remaining": remaining,
+        "remaining": total - done,
         "today": today_count,
         "upcoming": upcoming_count,
         "tasks": rows,
     }
 
 
+def upcoming_tasks(
+    board: dict[str, Any],
+    limit: int = 3,
+    *,
+    horizon_days: int | None = None,
+    person_ids: Iterable[str] | None = None,
+    indexes: BoardIndexes | None = None,
+) -> dict[str, Any]:
+    """Return the next ``limit`` open tasks for the household and for each person in one pass.
+
+    ``person_ids`` defaults to every board person. Tasks are visited in
+    (date, order, title) order and each one lands in the household list and
+    in the list of every assignee that still has room, so the walk stops as
+    soon as all lists are full or ``horizon_days`` after today is passed.
+    Span (all-day multi-day) tasks are de-duplicated so they count once.
+    """
+    today = dt_util.as_local(dt_util.utcnow()).date()
+    limit = max(0, int(limit))
+    last_day = today + timedelta(days=horizon_days) if horizon_days is not None else None
+    people = board.get("people", []) if isinstance(board, dict) else []
+    people_by_id = {
+        str(person.get("id", "")).strip(): str(person.get("name", "")).strip()
+        for person in people
+        if isinstance(person, dict) and str(person.get("id", "")).strip()
+    }
+    wanted = list(people_by_id) if person_ids is None else [str(person_id).strip() for person_id in person_ids]
+
+    household: list[dict[str, Any]] = []
+    per_person: dict[str, list[dict[str, Any]]] = {person_id: [] for person_id in wanted}
+    open_lists = 1 + len(per_person)
+    grouped: dict[str, dict[str, Any]] = {}
+    for due_day, task in _upcoming_stream(board, indexes, today):
+        if (last_day is not None and due_day > last_day) or open_lists == 0 or limit == 0:
+            break
+        due_iso = due_day.isoformat()
+        week_start_iso = (due_day - timedelta(days=due_day.weekday())).isoformat()
+        group_key = f"span:{task.span_id}:{task.week_start or week_start_iso}" if task.span_id else f"task:{task.id}"
+        item = grouped.get(group_key)
+        if item is not None:
+            # Later fragment of a span already listed: the stream is in date order, so only the end moves.
+            item["end_date"] = max(item["end_date"], due_iso)
+            continue
+        targets = [per_person[person_id] for person_id in task.assignees if person_id in per_person]
+        if len(household) >= limit and all(len(rows) >= limit for rows in targets):
+            continue
+        item = {
+            "id": task.id,
+            "title": task.title,
+            "date": due_iso,
+            "start_date": due_iso,
+            "end_date": due_iso,
+            "column": task.column,
+            "week_start": week_start_iso,
+            "week_number": _week_number(due_day),
+            "assignees": list(task.assignees),
+            "assignee_names": [people_by_id.get(item, item) for item in task.assignees],
+            "slot": task.slot or "",
+            "span_id": task.span_id or "",
+            "order": task.order,
+        }
+        grouped[group_key] = item
+        for rows in (household, *targets):
+            if len(rows) < limit:
+                rows.append(item)
+                if len(rows) == limit:
+                    open_lists -= 1
+    if indexes is not None:
+        _extend_spans(grouped, indexes, last_day)
+
+    return {
+        "household": _summary(household),
+        "people": {person_id: _summary(rows) for person_id, rows in per_person.items()},
+    }
+
+
 def next_three_tasks_summary(
     board: dict[str, Any],
     limit: int = 3,
     *,
     person_id: str | None = None,
+    indexes: BoardIndexes | None = None,
 ) -> dict[str, Any]:
     """Return the next N open tasks from today and forward.
 
     If person_id is provided, only include tasks assigned to that person.
     Span (all-day multi-day) tasks are de-duplicated so they count once.
     """
+    wanted_person = str(person_id).strip() if person_id else ""
+    upcoming = upcoming_tasks(board, limit, person_ids=[wanted_person] if wanted_person else [], indexes=indexes)
+    return upcoming["people"][wanted_person] if wanted_person else upcoming["household"]
+
+
+def today_tasks(board: dict[str, Any], *, indexes: BoardIndexes) -> dict[str, Any]:
+    """Return the tasks in today's column of the current week, with assignee names."""
     today = dt_util.as_local(dt_util.utcnow()).date()
-    current_week_start = _start_of_week(today)
+    today_key = WEEKDAY_COLUMNS[today.weekday()]
     people = board.get("people", []) if isinstance(board, dict) else []
-    tasks = board.get("tasks", []) if isinstance(board, dict) else []
     people_by_id = {
         str(person.get("id", "")).strip(): str(person.get("name", "")).strip()
         for person in people
         if isinstance(person, dict) and str(person.get("id", "")).strip()
     }
-    person_name_key = ""
-    if person_id:
-        person_name_key = str(people_by_id.get(str(person_id).strip(), "")).strip().lower()
-
-    def _task_date(raw: dict[str, Any]) -> date | None:
-        column = str(raw.get("column") or "").lower()
-        if column not in WEEKDAY_INDEX:
-            return None
-        raw_week_start = str(raw.get("week_start") or current_week_start.isoformat())
-        week_start_day = _parse_iso_day(raw_week_start)
-        normalized_start = _start_of_week(week_start_day if week_start_day is not None else current_week_start)
-        return normalized_start + timedelta(days=WEEKDAY_INDEX[column])
-
-    # De-dupe span tasks so they count once. Keep min/max date.
-    grouped: dict[str, dict[str, Any]] = {}
-    for raw in tasks:
-        if not isinstance(raw, dict):
-            continue
-        if str(raw.get("column") or "").lower() == "done":
-            continue
-        due_day = _task_date(raw)
-        if due_day is None or due_day < today:
-            continue
-        assignee_ids = [str(item).strip() for item in raw.get("assignees", []) if str(item).strip()]
-        if person_id:
-            pid = str(person_id).strip()
-            assignees_lower = [item.lower() for item in assignee_ids]
-            if pid not in assignee_ids and person_name_key and person_name_key not in assignees_lower:
-                continue
-        assignee_names = [people_by_id.get(item, item) for item in assignee_ids]
-        span_id = str(raw.get("span_id") or "").strip()
-        raw_week_start = str(raw.get("week_start") or (due_day - timedelta(days=due_day.weekday())).isoformat())
-        group_key = f"span:{span_id}:{raw_week_start}" if span_id else f"task:{str(raw.get('id') or '').strip()}"
-        item = grouped.get(group_key)
-        if item is None:
-            item = {
-                "id": str(raw.get("id") or ""),
-                "title": str(raw.get("title") or "Untitled task"),
-                "date": due_day.isoformat(),
-                "start_date": due_day.isoformat(),
-                "end_date": due_day.isoformat(),
-                "column": str(raw.get("column") or "").lower(),
-                "week_start": (due_day - timedelta(days=due_day.weekday())).isoformat(),
-                "week_number": _week_number(due_day),
-                "assignees": assignee_ids,
-                "assignee_names": assignee_names,
-                "slot": str(raw.get("slot") or "").lower(),
-                "span_id": span_id,
-                "order": int(raw.get("order") or 0),
-            }
-            grouped[group_key] = item
-        else:
-            # Expand range for span tasks.
-            if due_day.isoformat() < str(item.get("start_date") or item["date"]):
-                item["start_date"] = due_day.isoformat()
-                item["date"] = due_day.isoformat()
-                item["column"] = str(raw.get("column") or "").lower()
-            if due_day.isoformat() > str(item.get("end_date") or item["date"]):
-                item["end_date"] = due_day.isoformat()
-
-    rows = list(grouped.values())
-    rows.sort(
-        key=lambda item: (
-            item["date"],
-            int(item.get("order") or 0),
-            item.get("title", ""),
-        )
-    )
-    selected = rows[: max(0, int(limit))]
+    # Only today's bucket of the current week (plus unscheduled tasks) can match.
+    tasks = indexes.week_tasks(_start_of_week(today).isoformat(), [today_key])
+    rows = [
+        {
+            "id": task.id,
+            "title": task.title,
+            "assignees": [people_by_id.get(person_id, person_id) for person_id in task.assignees],
+            "column": task.column,
+        }
+        for task in tasks
+    ]
     return {
-        "count": len(selected),
-        "tasks": selected,
-        "titles": [str(item.get("title") or "") for item in selected],
+        "count": len(rows),
+        "tasks": rows,
+        "day": today_key,
+        "date": today.isoformat(),
     }
+
+
+def _summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    return {"count": len(rows), "tasks": rows, "titles": [item["title"] for item in rows]}
+
+
+def _upcoming_stream(
+    board: dict[str, Any],
+    indexes: BoardIndexes | None,
+    today: date,
+) -> Iterator[tuple[date, Task]]:
+    """Yield open weekday tasks due today or later in (date, order, title) order."""
+    current_week_start = _start_of_week(today)
+
+    def _order(task: Task) -> tuple[int, str]:
+        return (task.order, task.title)
+
+    if indexes is None:
+        tasks: Iterable[Task] = board.get("tasks", []) if isinstance(board, dict) else []
+        dated = []
+        for task in tasks:
+            weekday = WEEKDAY_INDEX.get(task.column)
+            if weekday is None:
+                continue
+            week_start_day = _parse_iso_day(task.week_start) if task.week_start else None
+            due_day = _start_of_week(week_start_day or current_week_start) + timedelta(days=weekday)
+            if due_day >= today:
+                dated.append((due_day, task))
+        dated.sort(key=lambda item: (item[0], *_order(item[1])))
+        yield from dated
+        return
+
+    # Buckets are already kept in order, so each day is a merge of at most two sorted runs:
+    # the day's week bucket and, in the current week, unscheduled tasks on that weekday.
+    current_week_iso = current_week_start.isoformat()
+    # The current week is walked even without a bucket of its own, for unscheduled tasks.
+    weeks = sorted({current_week_iso, *(week for week in indexes.weeks() if week >= current_week_iso)})
+    for week in weeks:
+        monday = date.fromisoformat(week)
+        for weekday, column in enumerate(WEEKDAY_COLUMNS):
+            due_day = monday + timedelta(days=weekday)
+            if due_day < today:
+                continue
+            runs = [indexes.bucket((week, column))]
+            if week == current_week_iso:
+                runs.append(indexes.bucket((None, column)))
+            for task in heapq.merge(*runs, key=_order):
+                yield due_day, task
+
+
+def _extend_spans(grouped: dict[str, dict[str, Any]], indexes: BoardIndexes, last_day: date | None) -> None:
+    """Stretch listed spans to their last fragment in the same week, which the walk may have stopped before."""
+    for item in grouped.values():
+        if not item["span_id"]:
+            continue
+        for sibling in indexes.tasks_for(indexes.by_span.get(item["span_id"], ())):
+            if sibling.week_start != item["week_start"] or sibling.column not in WEEKDAY_INDEX:
+                continue
+            day = date.fromisoformat(item["week_start"]) + timedelta(days=WEEKDAY_INDEX[sibling.column])
+            if last_day is not None and day > last_day:
+                continue
+            item["end_date"] = max(item["end_date"], day.isoformat())
+
+
+class StatsCache:
+    """Bounded LRU of derived board views.
+
+    Keys start with the board revision and the local date, so a save or
+    midnight makes older entries unreachable; ``clear`` frees them early.
+    Cached views are shared between callers and must be treated as read-only.
+    """
+
+    __slots__ = ("_entries", "_maxsize", "hits", "misses")
+
+    def __init__(self, maxsize: int = STATS_CACHE_SIZE) -> None:
+        self._entries: OrderedDict[Hashable, dict[str, Any]] = OrderedDict()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, compute: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+        """Return the view under ``key``, computing and storing it on a miss."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,116 @@
+"""Per-entry view model feeding the board sensors."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import SIGNAL_BOARD_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+VIEW_PERSON_WEEK = "person_week"
+VIEW_NEXT_TASKS = "next_tasks"
+VIEW_TODAY = "today"
+NEXT_TASKS_LIMIT = 3
+
+# (view kind, person_id or None for household-wide views)
+ViewKey = tuple[str, str | None]
+ViewListener = Callable[[dict[str, Any]], None]
+
+
+class BoardViewModel:
+    """Derived sensor views of one board, computed once per change and pushed to subscribers.
+
+    Board updates schedule a single refresh however many sensors listen. The
+    refresh reads every subscribed view through the store's per-revision stats
+    cache (the week aggregate and the upcoming pass cover all people at once)
+    and only calls listeners whose view differs from the one they last got.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, board_store: Any) -> None:
+        self._hass = hass
+        self._entry_id = entry_id
+        self._board_store = board_store
+        self._listeners: dict[ViewKey, list[ViewListener]] = {}
+        self._pushed: dict[ViewKey, dict[str, Any]] = {}
+        self._refresh_task: asyncio.Task | None = None
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow board updates; returns the unsubscribe callback."""
+        return async_dispatcher_connect(
+            self._hass,
+            f"{SIGNAL_BOARD_UPDATED}_{self._entry_id}",
+            self._handle_board_updated,
+        )
+
+    @callback
+    def async_subscribe(self, key: ViewKey, listener: ViewListener) -> CALLBACK_TYPE:
+        """Call ``listener`` with the view under ``key`` whenever it changes."""
+        self._listeners.setdefault(key, []).append(listener)
+        if key not in self._pushed:
+            self._pushed[key] = self.view(key)
+
+        @callback
+        def _unsubscribe() -> None:
+            listeners = self._listeners.get(key, [])
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners:
+                self._listeners.pop(key, None)
+                self._pushed.pop(key, None)
+
+        return _unsubscribe
+
+    def current(self, key: ViewKey) -> dict[str, Any]:
+        """Return the view last pushed for ``key``, computing it if nobody follows it yet."""
+        view = self._pushed.get(key)
+        return view if view is not None else self.view(key)
+
+    def view(self, key: ViewKey) -> dict[str, Any]:
+        """Compute one view from the loaded board."""
+        kind, person_id = key
+        store = self._board_store
+        if kind == VIEW_TODAY:
+            return store.today_tasks()
+        if kind == VIEW_NEXT_TASKS:
+            summary = store.next_tasks_summary(NEXT_TASKS_LIMIT, person_id)
+            return {"summary": summary, "person": self._person(person_id)} if person_id else {"summary": summary}
+        if kind == VIEW_PERSON_WEEK and person_id is not None:
+            week = store.week_stats(0)
+            stats = next((row for row in week["people"] if row["person_id"] == person_id), None)
+            if stats is None:
+                stats = store.person_week_stats(person_id)
+            return {"stats": stats, "person": self._person(person_id)}
+        raise ValueError(f"Unknown view {key}")
+
+    def _person(self, person_id: str | None) -> dict[str, Any]:
+        board = getattr(self._board_store, "_data", None) or {}
+        people = board.get("people", []) if isinstance(board, dict) else []
+        return next((dict(item) for item in people if str(item.get("id", "")) == person_id), {})
+
+    @callback
+    def _handle_board_updated(self) -> None:
+        # Signals that land while a refresh waits for the board are covered by that refresh.
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = self._hass.async_create_task(self._async_refresh())
+
+    async def _async_refresh(self) -> None:
+        try:
+            await self._board_store.async_load()
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Board load failed for entry %s; using the board in memory", self._entry_id)
+        for key, listeners in list(self._listeners.items()):
+            view = self.view(key)
+            if self._pushed.get(key) == view:
+                continue
+            self._pushed[key] = view
+            for listener in list(listeners):
+                listener(view)
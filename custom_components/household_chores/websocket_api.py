@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import voluptuous as vol
@@ -9,7 +10,7 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant
 
-from .board import BoardConflictError
+from .board import BoardConflictError, BoardOperationError, serialize_board
 from .const import DOMAIN
 
 
@@ -17,6 +18,7 @@ from .const import DOMAIN
     {
         vol.Required("type"): "household_chores/get_board",
         vol.Required("entry_id"): str,
+        vol.Optional("week_offset"): vol.Coerce(int),
     }
 )
 @websocket_api.async_response
@@ -32,8 +34,19 @@ async def ws_get_board(
         connection.send_error(msg["id"], "entry_not_found", f"No board found for entry_id={entry_id}")
         return
 
-    board = await board_store.async_load()
-    connection.send_result(msg["id"], {"entry_id": entry_id, "board": board})
+    if "week_offset" in msg:
+        board = await board_store.async_load_week(msg["week_offset"])
+    else:
+        board = await board_store.async_load()
+    connection.send_result(
+        msg["id"],
+        {
+            "entry_id": entry_id,
+            "revision": board_store.revision,
+            "loaded_weeks": board_store.loaded_weeks,
+            "board": serialize_board(board),
+        },
+    )
 
 
 @websocket_api.websocket_command(
@@ -41,6 +54,8 @@ async def ws_get_board(
         vol.Required("type"): "household_chores/save_board",
         vol.Required("entry_id"): str,
         vol.Required("board"): dict,
+        vol.Optional("weeks"): [str],
+        vol.Optional("expected_revision"): vol.Coerce(int),
         vol.Optional("expected_updated_at"): str,
     }
 )
@@ -60,12 +75,198 @@ async def ws_save_board(
     try:
         board = await board_store.async_save(
             msg["board"],
+            weeks=msg.get("weeks"),
+            expected_revision=msg.get("expected_revision"),
             expected_updated_at=msg.get("expected_updated_at"),
         )
     except BoardConflictError as err:
         connection.send_error(msg["id"], "conflict", str(err))
         return
-    connection.send_result(msg["id"], {"entry_id": entry_id, "board": board})
+    connection.send_result(
+        msg["id"],
+        {
+            "entry_id": entry_id,
+            "revision": board_store.revision,
+            "loaded_weeks": board_store.loaded_weeks,
+            "board": serialize_board(board),
+        },
+    )
+
+
+async def _async_run_operation(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+    operation: Callable[[Any], Awaitable[dict[str, Any]]],
+) -> None:
+    """Run one granular board operation and send only the changed records back."""
+    entry_id = msg["entry_id"]
+    board_store = hass.data.get(DOMAIN, {}).get("boards", {}).get(entry_id)
+    if board_store is None:
+        connection.send_error(msg["id"], "entry_not_found", f"No board found for entry_id={entry_id}")
+        return
+
+    try:
+        result = await operation(board_store)
+    except BoardConflictError as err:
+        connection.send_error(msg["id"], "conflict", str(err))
+        return
+    except BoardOperationError as err:
+        connection.send_error(msg["id"], err.code, str(err))
+        return
+    connection.send_result(msg["id"], {"entry_id": entry_id, **result})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "household_chores/add_task",
+        vol.Required("entry_id"): str,
+        vol.Required("task"): dict,
+        vol.Optional("expected_revision"): vol.Coerce(int),
+    }
+)
+@websocket_api.async_response
+async def ws_add_task(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Add one task without resending the board."""
+    await _async_run_operation(
+        hass,
+        connection,
+        msg,
+        lambda store: store.async_add_task(msg["task"], expected_revision=msg.get("expected_revision")),
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "household_chores/patch_task",
+        vol.Required("entry_id"): str,
+        vol.Required("task_id"): str,
+        vol.Required("changes"): dict,
+        vol.Optional("expected_revision"): vol.Coerce(int),
+    }
+)
+@websocket_api.async_response
+async def ws_patch_task(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Apply a partial update to one task."""
+    await _async_run_operation(
+        hass,
+        connection,
+        msg,
+        lambda store: store.async_patch_task(
+            msg["task_id"],
+            msg["changes"],
+            expected_revision=msg.get("expected_revision"),
+        ),
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "household_chores/move_task",
+        vol.Required("entry_id"): str,
+        vol.Required("task_id"): str,
+        vol.Required("column"): str,
+        vol.Optional("week_start"): str,
+        vol.Optional("order"): int,
+        vol.Optional("expected_revision"): vol.Coerce(int),
+    }
+)
+@websocket_api.async_response
+async def ws_move_task(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Move one task to another column, week or position."""
+    await _async_run_operation(
+        hass,
+        connection,
+        msg,
+        lambda store: store.async_move_task(
+            msg["task_id"],
+            msg["column"],
+            week_start=msg.get("week_start"),
+            order=msg.get("order"),
+            expected_revision=msg.get("expected_revision"),
+        ),
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "household_chores/delete_task",
+        vol.Required("entry_id"): str,
+        vol.Required("task_id"): str,
+        vol.Optional("expected_revision"): vol.Coerce(int),
+    }
+)
+@websocket_api.async_response
+async def ws_delete_task(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Delete one task."""
+    await _async_run_operation(
+        hass,
+        connection,
+        msg,
+        lambda store: store.async_delete_task(msg["task_id"], expected_revision=msg.get("expected_revision")),
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "household_chores/upsert_person",
+        vol.Required("entry_id"): str,
+        vol.Required("person"): dict,
+        vol.Optional("expected_revision"): vol.Coerce(int),
+    }
+)
+@websocket_api.async_response
+async def ws_upsert_person(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Create or update one person."""
+    await _async_run_operation(
+        hass,
+        connection,
+        msg,
+        lambda store: store.async_upsert_person(msg["person"], expected_revision=msg.get("expected_revision")),
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "household_chores/upsert_template",
+        vol.Required("entry_id"): str,
+        vol.Required("template"): dict,
+        vol.Optional("expected_revision"): vol.Coerce(int),
+    }
+)
+@websocket_api.async_response
+async def ws_upsert_template(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Create or update one fixed-task template."""
+    await _async_run_operation(
+        hass,
+        connection,
+        msg,
+        lambda store: store.async_upsert_template(msg["template"], expected_revision=msg.get("expected_revision")),
+    )
 
 
 def async_register(hass: HomeAssistant) -> None:
@@ -73,6 +274,12 @@ def async_register(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_board)
     websocket_api.async_register_command(hass, ws_save_board)
     websocket_api.async_register_command(hass, ws_list_entries)
+    websocket_api.async_register_command(hass, ws_add_task)
+    websocket_api.async_register_command(hass, ws_patch_task)
+    websocket_api.async_register_command(hass, ws_move_task)
+    websocket_api.async_register_command(hass, ws_delete_task)
+    websocket_api.async_register_command(hass, ws_upsert_person)
+    websocket_api.async_register_command(hass, ws_upsert_template)
 
 
 @websocket_api.websocket_command(
@@ -0,0 +1 @@
+"""Tests for the Household Chores integration."""
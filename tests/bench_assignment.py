@@ -0,0 +1,56 @@
+"""Benchmark for load-balanced assignment.
+
+Not collected by default; run with ``pytest tests/bench_assignment.py -s``.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.household_chores.assignment import plan_week
+from custom_components.household_chores.board import WEEKDAY_COLUMNS, HouseholdBoardStore
+from custom_components.household_chores.stats import week_stats
+
+SIZES = [(100, 5), (300, 20), (600, 40), (1200, 80)]
+ROUNDS = 20
+
+
+async def test_bench_plan_week(hass: HomeAssistant) -> None:
+    """Planning time grows with tasks times log(people), not with their product."""
+    today = dt_util.as_local(dt_util.utcnow()).date()
+    week_start = (today - timedelta(days=today.weekday())).isoformat()
+    print(f"\n{'tasks':>6} {'people':>6} {'plan_week ms':>13} {'with stats ms':>14}")
+    for task_count, people_count in SIZES:
+        store = HouseholdBoardStore(hass, f"bench_{task_count}", [f"P{index}" for index in range(people_count)], [])
+        board = await store.async_load()
+        # A third already assigned round-robin, the rest open for the planner.
+        tasks = [
+            {
+                "id": f"task_{index}",
+                "title": f"Task {index}",
+                "assignees": [board["people"][index % people_count]["id"]] if index % 3 == 0 else [],
+                "column": WEEKDAY_COLUMNS[index % 7],
+                "week_start": week_start,
+            }
+            for index in range(task_count)
+        ]
+        await store.async_save({**board, "tasks": tasks})
+        week = week_stats(board, 0, indexes=store.indexes)
+
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            plan = plan_week(board, week, indexes=store.indexes)
+        plan_ms = (time.perf_counter() - started) * 1000 / ROUNDS
+
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            plan_week(board, week_stats(board, 0, indexes=store.indexes), indexes=store.indexes)
+        total_ms = (time.perf_counter() - started) * 1000 / ROUNDS
+
+        assert len(plan.assignments) == task_count - len(range(0, task_count, 3))
+        assert plan.imbalance(plan.load_after) <= 1
+        print(f"{task_count:>6} {people_count:>6} {plan_ms:>13.3f} {total_ms:>14.3f}")
@@ -0,0 +1,67 @@
+"""Benchmark for the memory held by board tasks.
+
+Not collected by default; run with ``pytest tests/bench_memory.py -s``.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import json
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.household_chores.board import WEEKDAY_COLUMNS, HouseholdBoardStore
+
+TASK_COUNT = 10_000
+
+
+def _allocated(build):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        records = build()
+        return records, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+async def test_bench_task_memory(hass: HomeAssistant) -> None:
+    """Compare 10k tasks held as plain dicts with the store's slotted records."""
+    store = HouseholdBoardStore(hass, "bench_memory", ["Ann", "Bo", "Cy"], [])
+    board = await store.async_load()
+    person_ids = {person["id"] for person in board["people"]}
+    people = sorted(person_ids)
+    today = dt_util.as_local(dt_util.utcnow()).date()
+    monday = today - timedelta(days=today.weekday())
+    # Decoded from JSON so every record starts from fresh strings, as a load from disk does.
+    raw = json.dumps(
+        [
+            {
+                "id": f"task_{index:012x}",
+                "title": f"Task {index % 250}",
+                "assignees": [people[index % 3]],
+                "column": WEEKDAY_COLUMNS[index % 7],
+                "order": index // 7 % 40,
+                "created_at": "2026-01-05T08:00:00+00:00",
+                "end_date": None,
+                "week_start": (monday + timedelta(weeks=index // 280)).isoformat(),
+                "week_number": None,
+            }
+            for index in range(TASK_COUNT)
+        ]
+    )
+
+    records, record_bytes = _allocated(
+        lambda: [store._normalize_task(task, index, person_ids) for index, task in enumerate(json.loads(raw))]
+    )
+    # The normalized dicts the store used to hold, with every field and their own strings.
+    normalized = json.dumps([record.as_dict() for record in records])
+    dicts, dict_bytes = _allocated(lambda: json.loads(normalized))
+
+    assert len(dicts) == len(records) == TASK_COUNT
+    print(
+        f"\n{TASK_COUNT} tasks: dicts {dict_bytes / 1e6:.2f} MB, slotted records {record_bytes / 1e6:.2f} MB "
+        f"({record_bytes / dict_bytes:.0%})"
+    )
@@ -0,0 +1,64 @@
+"""Benchmark for board saves as the task count grows.
+
+Not collected by default; run with ``pytest tests/bench_save.py -s``.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.household_chores.board import WEEKDAY_COLUMNS, HouseholdBoardStore, serialize_board
+
+SIZES = [500, 2000, 8000]
+ROUNDS = 10
+
+
+async def test_bench_save_one_change(hass: HomeAssistant) -> None:
+    """Time a client echo save with one edited task against a full normalization."""
+    today = dt_util.as_local(dt_util.utcnow()).date()
+    week_start = (today - timedelta(days=today.weekday())).isoformat()
+    print(f"\n{'tasks':>6} {'full normalize ms':>18} {'incremental ms':>15} {'echo save ms':>13} {'identical ms':>13}")
+    for task_count in SIZES:
+        store = HouseholdBoardStore(hass, f"bench_{task_count}", ["Ann", "Bo"], [])
+        board = await store.async_load()
+        tasks = [
+            {
+                "id": f"task_{index}",
+                "title": f"Task {index}",
+                "assignees": [board["people"][index % 2]["id"]],
+                "column": WEEKDAY_COLUMNS[index % 7],
+                "order": index // 7,
+                "week_start": week_start,
+            }
+            for index in range(task_count)
+        ]
+        await store.async_save({**board, "tasks": tasks})
+        payload = serialize_board(await store.async_load())
+
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            store._normalize_board(payload)
+        full_ms = (time.perf_counter() - started) * 1000 / ROUNDS
+
+        started = time.perf_counter()
+        for round_index in range(ROUNDS):
+            payload["tasks"][0]["title"] = f"Edited {round_index}"
+            store._normalize_board(payload, store._data)
+        incremental_ms = (time.perf_counter() - started) * 1000 / ROUNDS
+
+        started = time.perf_counter()
+        for round_index in range(ROUNDS):
+            payload["tasks"][0]["title"] = f"Saved {round_index}"
+            await store.async_save(payload)
+        save_ms = (time.perf_counter() - started) * 1000 / ROUNDS
+
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            await store.async_save(payload)
+        identical_ms = (time.perf_counter() - started) * 1000 / ROUNDS
+
+        print(f"{task_count:>6} {full_ms:>18.2f} {incremental_ms:>15.2f} {save_ms:>13.2f} {identical_ms:>13.2f}")
@@ -0,0 +1,36 @@
+"""Benchmark for fuzzy title lookups.
+
+Not collected by default; run with ``pytest tests/bench_search.py -s``.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from custom_components.household_chores.search import TitleIndex
+
+SIZES = [1000, 5000, 20000]
+QUERIES = ["dishes", "take out the bins", "hoover stairs", "water plants kitchen", "laundri"]
+ROUNDS = 50
+_WORDS = [
+    "do", "the", "dishes", "laundry", "bins", "take", "out", "hoover", "stairs", "water",
+    "plants", "kitchen", "bathroom", "clean", "fold", "sheets", "windows", "car", "wash", "fridge",
+]  # fmt: skip
+
+
+def test_bench_title_search() -> None:
+    """Lookups stay well under a millisecond even when every title shares words with the query."""
+    rng = random.Random(7)
+    print(f"\n{'titles':>6} {'search ms':>10}")
+    for size in SIZES:
+        index = TitleIndex()
+        for task_number in range(size):
+            index.add(f"task_{task_number}", " ".join(rng.sample(_WORDS, rng.randint(2, 4))))
+
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            for query in QUERIES:
+                index.search(query)
+        search_ms = (time.perf_counter() - started) * 1000 / (ROUNDS * len(QUERIES))
+        print(f"{size:>6} {search_ms:>10.3f}")
@@ -0,0 +1,19 @@
+"""Shared fixtures for Household Chores tests."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Let Home Assistant load the integration from custom_components."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_dir(request, tmp_path):
+    """Give each test its own config dir, so journal files never leak between tests."""
+    if "hass" in request.fixturenames:
+        request.getfixturevalue("hass").config.config_dir = str(tmp_path)
+    yield
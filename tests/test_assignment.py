@@ -0,0 +1,68 @@
+"""Tests for load-balanced assignment."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.household_chores.board import HouseholdBoardStore
+
+
+def _monday():
+    today = dt_util.as_local(dt_util.utcnow()).date()
+    return today - timedelta(days=today.weekday())
+
+
+def _task(task_id: str, column: str, week_start: str) -> dict:
+    return {"id": task_id, "title": task_id, "assignees": [], "column": column, "week_start": week_start}
+
+
+async def test_auto_assign_new_tasks(hass: HomeAssistant) -> None:
+    """New tasks without assignees are spread over the people when the option is on."""
+    store = HouseholdBoardStore(hass, "test", ["Ann", "Bo"], ["Dishes"], auto_assign=True)
+    board = await store.async_load()
+    week_start = _monday().isoformat()
+    ann, bo = (person["id"] for person in board["people"])
+    # The default chore is Ann's, so the first new task goes to Bo and the tie after it to Ann.
+    result = await store.async_add_task(_task("task_a", "tuesday", week_start))
+    assert [task["assignees"] for task in result["tasks"] if task["id"] == "task_a"] == [[bo]]
+
+    await store.async_add_task(_task("task_b", "wednesday", week_start))
+    await store.async_add_task({**_task("task_c", "thursday", week_start), "assignees": [ann]})
+
+    assignees = {task.id: task.assignees for task in board["tasks"]}
+    assert assignees["task_b"] == [ann]
+    assert assignees["task_c"] == [ann]
+
+
+async def test_auto_assign_off_by_default(hass: HomeAssistant) -> None:
+    """Without the option new tasks stay unassigned."""
+    store = HouseholdBoardStore(hass, "test", ["Ann", "Bo"], ["Dishes"])
+    await store.async_load()
+    result = await store.async_add_task(_task("task_a", "tuesday", _monday().isoformat()))
+    assert result["tasks"][0]["assignees"] == []
+
+
+async def test_auto_assign_new_template(hass: HomeAssistant) -> None:
+    """A new template without assignees goes to one person, and so do its occurrences."""
+    store = HouseholdBoardStore(hass, "test", ["Ann", "Bo"], ["Dishes", "Laundry", "Vacuum"], auto_assign=True)
+    board = await store.async_load()
+    monday = _monday()
+    ann, bo = (person["id"] for person in board["people"])
+    # Ann holds Dishes and Vacuum, Bo holds Laundry.
+    result = await store.async_upsert_template(
+        {
+            "id": "tpl_bins",
+            "title": "Bins",
+            "weekdays": ["monday"],
+            "start_date": monday.isoformat(),
+            "end_date": (monday + timedelta(weeks=4)).isoformat(),
+        }
+    )
+
+    assert result["templates"][0]["assignees"] == [bo]
+    occurrences = [task for task in board["tasks"] if task.template_id == "tpl_bins"]
+    assert occurrences
+    assert all(task.assignees == [bo] for task in occurrences)
@@ -0,0 +1,334 @@
+"""Tests for the board store."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+import os
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.household_chores.board import HouseholdBoardStore, serialize_board
+from custom_components.household_chores.indexes import BoardIndexes
+from custom_components.household_chores.recurrence import Recurrence
+from custom_components.household_chores.scheduler import TimerWheel, next_local_time
+
+
+def _monday():
+    today = dt_util.as_local(dt_util.utcnow()).date()
+    return today - timedelta(days=today.weekday())
+
+
+async def test_reorder_occurrence_within_column(hass: HomeAssistant) -> None:
+    """Moving an occurrence up its own column keeps the new position."""
+    store = HouseholdBoardStore(hass, "test", ["Ann"], ["Dishes"])
+    await store.async_load()
+    monday = _monday()
+    await store.async_upsert_template(
+        {
+            "id": "tpl_bins",
+            "title": "Bins",
+            "weekdays": ["monday"],
+            "start_date": monday.isoformat(),
+            "end_date": (monday + timedelta(weeks=8)).isoformat(),
+        }
+    )
+    occurrence_id = f"tpl_bins_{monday.isoformat()}"
+    board = await store.async_load()
+
+    await store.async_move_task(occurrence_id, "monday", week_start=monday.isoformat(), order=0)
+
+    board = await store.async_load()
+    orders = {task.title: task.order for task in board["tasks"] if task.column == "monday" and task.week_start == monday.isoformat()}
+    assert orders == {"Bins": 0, "Dishes": 1}
+
+    await store.async_flush()
+    reloaded = HouseholdBoardStore(hass, "test", ["Ann"], ["Dishes"])
+    board = await reloaded.async_load()
+    orders = {task.title: task.order for task in board["tasks"] if task.column == "monday" and task.week_start == monday.isoformat()}
+    assert orders == {"Bins": 0, "Dishes": 1}
+
+
+async def test_upgrade_keeps_completed_legacy_template_task(hass: HomeAssistant, hass_storage) -> None:
+    """A done template task with a random id still stands in for its occurrence after upgrading."""
+    monday = _monday()
+    week_start = monday.isoformat()
+    created = (monday - timedelta(weeks=1)).isoformat()
+    hass_storage["household_chores_board_test"] = {
+        "version": 2,
+        "key": "household_chores_board_test",
+        "data": {
+            "people": [{"id": "person_0", "name": "Ann", "color": "#E11D48"}],
+            "templates": [
+                {
+                    "id": "tpl_bins",
+                    "title": "Bins",
+                    "assignees": ["person_0"],
+                    "weekdays": ["monday", "wednesday"],
+                    "end_date": (monday + timedelta(weeks=8)).isoformat(),
+                    "excluded_dates": [],
+                    "created_at": f"{created}T08:00:00+00:00",
+                }
+            ],
+            "tasks": [
+                {
+                    "id": "task_0a1b2c3d4e5f",
+                    "title": "Bins",
+                    "assignees": ["person_0"],
+                    "column": "done",
+                    "order": 0,
+                    "created_at": f"{created}T08:00:00.000001+00:00",
+                    "end_date": (monday + timedelta(weeks=8)).isoformat(),
+                    "template_id": "tpl_bins",
+                    "fixed": True,
+                    "week_start": week_start,
+                    "week_number": monday.isocalendar().week,
+                },
+                {
+                    "id": "task_6a7b8c9d0e1f",
+                    "title": "Bins",
+                    "assignees": ["person_0"],
+                    "column": "wednesday",
+                    "order": 0,
+                    "created_at": f"{created}T08:00:00.000002+00:00",
+                    "end_date": (monday + timedelta(weeks=8)).isoformat(),
+                    "template_id": "tpl_bins",
+                    "fixed": True,
+                    "week_start": week_start,
+                    "week_number": monday.isocalendar().week,
+                },
+            ],
+            "settings": {},
+            "updated_at": f"{created}T08:00:00+00:00",
+        },
+    }
+
+    store = HouseholdBoardStore(hass, "test", ["Ann"], [])
+    board = await store.async_load()
+
+    this_week = [(task.id, task.column) for task in board["tasks"] if task.week_start == week_start]
+    assert sorted(this_week) == [
+        (f"tpl_bins_{week_start}", "done"),
+        (f"tpl_bins_{(monday + timedelta(days=2)).isoformat()}", "wednesday"),
+    ]
+
+
+def test_weekly_rule_without_start_covers_its_creation_week() -> None:
+    """A weekly template created mid-week still occurs on the earlier days of that week."""
+    rule = Recurrence.from_template(
+        {
+            "id": "tpl_bins",
+            "weekdays": ["monday", "thursday"],
+            "created_at": "2026-10-14T09:00:00+00:00",
+            "end_date": "2026-10-31",
+        }
+    )
+    assert rule is not None
+    assert rule.start_date == date(2026, 10, 12)
+    assert rule.occurrences(date(2026, 10, 12), date(2026, 10, 19)) == (date(2026, 10, 12), date(2026, 10, 15))
+
+    rule = Recurrence.from_template({"id": "tpl_bins", "created_at": "2026-10-14T09:00:00+00:00", "end_date": "2026-10-31"})
+    assert rule is not None
+    assert rule.weekdays == (2,)
+
+
+async def test_save_reindexes_and_journals_only_changed_tasks(hass: HomeAssistant, monkeypatch) -> None:
+    """A full-board save touches the indexes and the journal only for tasks it changed."""
+    store = HouseholdBoardStore(hass, "test", ["Ann"], ["Dishes", "Laundry", "Bins"])
+    board = serialize_board(await store.async_load())
+    entries = []
+    persist = store._async_persist
+
+    async def _capture(entry):
+        entries.append(entry)
+        await persist(entry)
+
+    monkeypatch.setattr(store, "_async_persist", _capture)
+    dishes, laundry, bins = board["tasks"]
+    dishes["title"] = "Dishes and pans"
+    mop = {"id": "task_mop", "title": "Mop", "column": dishes["column"], "week_start": dishes["week_start"]}
+    board["tasks"] = [dishes, laundry, mop]
+    await store.async_save(board)
+
+    assert len(entries) == 1
+    assert sorted(task.id for task in entries[0]["tasks"]) == sorted([dishes["id"], "task_mop"])
+    assert entries[0]["deleted_task_ids"] == [bins["id"]]
+    rebuilt = BoardIndexes(store._data["tasks"])
+    assert store.indexes.by_id == rebuilt.by_id
+    assert store.indexes.by_week_column == rebuilt.by_week_column
+    assert store.indexes.by_assignee == rebuilt.by_assignee
+    assert list(store.indexes.titles.search("pans")) == [dishes["id"]]
+
+    await store.async_save(serialize_board(store._data))
+    assert len(entries) == 1
+
+    await store.async_flush()
+    reloaded = HouseholdBoardStore(hass, "test", ["Ann"], ["Dishes", "Laundry", "Bins"])
+    expected = {task.id: (task.title, task.column) for task in store._data["tasks"]}
+    assert {task.id: (task.title, task.column) for task in (await reloaded.async_load())["tasks"]} == expected
+
+
+async def test_weekly_refresh_archives_unloaded_stale_weeks(hass: HomeAssistant, hass_storage) -> None:
+    """Restoring a board two weeks stale archives the done tasks of the week nobody loaded."""
+    stale = _monday() - timedelta(weeks=2)
+    iso_year, iso_week, _weekday = stale.isocalendar()
+    shard_key = f"household_chores_board_test_week_{iso_year}-W{iso_week:02d}"
+    hass_storage["household_chores_board_test"] = {
+        "version": 2,
+        "key": "household_chores_board_test",
+        "data": {
+            "schema_version": 3,
+            "people": [{"id": "person_0", "name": "Ann", "color": "#E11D48"}],
+            "tasks": [],
+            "templates": [],
+            "settings": {},
+            "revision": 4,
+            "updated_at": f"{stale.isoformat()}T20:00:00+00:00",
+            "weeks": [stale.isoformat()],
+        },
+    }
+    hass_storage[shard_key] = {
+        "version": 1,
+        "key": shard_key,
+        "data": {
+            "week_start": stale.isoformat(),
+            "tasks": [
+                {"id": "task_done", "title": "Mop", "assignees": ["person_0"], "column": "done", "week_start": stale.isoformat()},
+                {"id": "task_open", "title": "Dust", "assignees": [], "column": "friday", "week_start": stale.isoformat()},
+            ],
+        },
+    }
+
+    store = HouseholdBoardStore(hass, "test", ["Ann"], [])
+    board = await store.async_load()
+    assert all(task.week_start != stale.isoformat() for task in board["tasks"])
+
+    await store.async_weekly_refresh()
+
+    assert shard_key not in hass_storage
+    stats = await store.async_completion_stats(weeks=4)
+    assert [row["completed"] for row in stats["weeks"] if row["week_start"] == stale.isoformat()] == [1]
+
+
+async def test_journal_replays_after_crash_and_compacts(hass: HomeAssistant, hass_storage) -> None:
+    """Journaled changes survive a restart without a flush; a torn tail is dropped and the rest compacted."""
+    store = HouseholdBoardStore(hass, "test", ["Ann"], ["Dishes", "Laundry"])
+    board = await store.async_load()
+    dishes = board["tasks"][0]
+    await store.async_patch_task(dishes.id, {"title": "Dishes and pans"})
+    await store.async_add_task({"id": "task_mop", "title": "Mop", "column": "monday", "week_start": _monday().isoformat()})
+    assert hass_storage["household_chores_board_test"]["data"]["revision"] == 0
+    journal_path = hass.config.path(".storage", "household_chores_board_test.journal")
+    with open(journal_path, "a", encoding="utf-8") as handle:
+        handle.write('{"rev":3,"tasks":[{"id":"task_torn"')
+
+    restored = HouseholdBoardStore(hass, "test", ["Ann"], ["Dishes", "Laundry"])
+    board = await restored.async_load()
+
+    assert sorted(task.title for task in board["tasks"]) == ["Dishes and pans", "Laundry", "Mop"]
+    assert restored.revision == 2
+    assert hass_storage["household_chores_board_test"]["data"]["revision"] == 2
+    assert not os.path.exists(journal_path)
+
+
+async def test_journal_skips_entries_a_snapshot_already_holds(hass: HomeAssistant, hass_storage) -> None:
+    """A crash between writing a snapshot and truncating the journal does not replay changes twice."""
+    store = HouseholdBoardStore(hass, "test", ["Ann"], ["Dishes"])
+    await store.async_load()
+    await store.async_add_task({"id": "task_mop", "title": "Mop", "column": "monday", "week_start": _monday().isoformat()})
+    await store._async_write_snapshot()
+    await store.async_add_task({"id": "task_dust", "title": "Dust", "column": "monday", "week_start": _monday().isoformat()})
+
+    restored = HouseholdBoardStore(hass, "test", ["Ann"], ["Dishes"])
+    board = await restored.async_load()
+
+    assert sorted(task.id for task in board["tasks"]) == sorted(task.id for task in store._data["tasks"])
+    assert sorted(task.title for task in board["tasks"]) == ["Dishes", "Dust", "Mop"]
+    assert restored.revision == 2
+
+
+async def test_timer_wheel_reschedules_on_one_timer(hass: HomeAssistant) -> None:
+    """A rescheduled job fires only at its new deadline; every entry shares the nearest timer."""
+    wheel = TimerWheel(hass)
+    fired: list[tuple[str, datetime]] = []
+    start = dt_util.utcnow().replace(microsecond=0)
+    period = {"e1": timedelta(minutes=10), "e2": timedelta(minutes=30)}
+
+    def _job(entry_id):
+        async def _action(when: datetime) -> None:
+            fired.append((entry_id, when))
+
+        return _action
+
+    for entry_id in period:
+        wheel.async_schedule((entry_id, "refresh"), _job(entry_id), lambda after, entry_id=entry_id: after + period[entry_id])
+    assert wheel._armed_at == wheel.jobs[("e1", "refresh")]
+
+    period["e1"] = timedelta(minutes=20)
+    wheel.async_reschedule(("e1", "refresh"))
+    first = wheel.jobs[("e1", "refresh")]
+    assert first - start >= timedelta(minutes=20)
+    assert wheel._armed_at == first
+
+    async_fire_time_changed(hass, start + timedelta(minutes=11))
+    await hass.async_block_till_done()
+    assert fired == []
+
+    async_fire_time_changed(hass, first)
+    await hass.async_block_till_done()
+    assert fired == [("e1", first)]
+    assert wheel.jobs[("e1", "refresh")] == first + timedelta(minutes=20)
+    assert wheel._armed_at == wheel.jobs[("e2", "refresh")]
+
+    wheel.async_cancel_entry("e2")
+    async_fire_time_changed(hass, start + timedelta(minutes=31))
+    await hass.async_block_till_done()
+    assert fired == [("e1", first)]
+    assert list(wheel.jobs) == [("e1", "refresh")]
+    wheel.async_cancel_entry("e1")
+    assert wheel._armed_at is None
+
+
+async def test_next_local_time_keeps_wall_clock_across_dst(hass: HomeAssistant) -> None:
+    """Deadlines are rebuilt in local time, so they stay on the configured hour when the offset changes."""
+    await hass.config.async_set_time_zone("Europe/Berlin")
+    zone = dt_util.get_default_time_zone()
+
+    before_spring = datetime(2026, 3, 28, 12, 0, tzinfo=zone)
+    first = next_local_time(before_spring, 0, 30)
+    second = next_local_time(first, 0, 30)
+    assert (first.hour, first.minute, second.hour, second.minute) == (0, 30, 0, 30)
+    assert first.utcoffset() == timedelta(hours=1)
+    assert second.utcoffset() == timedelta(hours=2)
+    assert dt_util.as_utc(second) - dt_util.as_utc(first) == timedelta(hours=23)
+
+    autumn_sunday = datetime(2026, 10, 18, 12, 0, tzinfo=zone)
+    weekly = next_local_time(autumn_sunday, 12, 0, weekday=6)
+    assert weekly.date() == date(2026, 10, 25)
+    assert (weekly.hour, weekly.utcoffset()) == (12, timedelta(hours=1))
+    assert dt_util.as_utc(weekly) - dt_util.as_utc(autumn_sunday) == timedelta(days=7, hours=1)
+
+
+async def test_stats_cache_follows_revision_and_local_date(hass: HomeAssistant, freezer) -> None:
+    """Cached views are reused until the board revision or the local date moves on."""
+    freezer.move_to("2026-10-14 18:00:00+00:00")
+    store = HouseholdBoardStore(hass, "test", ["Ann"], ["Dishes", "Laundry"])
+    board = await store.async_load()
+
+    week = store.week_stats()
+    assert store.week_stats() is week
+    assert store.stats_cache_info["hits"] == 1
+
+    await store.async_patch_task(board["tasks"][0].id, {"column": "done"})
+    updated = store.week_stats()
+    assert updated is not week
+    assert updated != week
+
+    today = store.today_tasks()
+    assert store.today_tasks() is today
+    freezer.move_to("2026-10-15 18:00:00+00:00")
+    assert store.today_tasks() is not today
+    recomputed = store.week_stats()
+    assert recomputed is not updated
+    assert recomputed == updated
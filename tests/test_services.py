@@ -0,0 +1,238 @@
+"""Tests for the integration services."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import json
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+import pytest
+import voluptuous as vol
+
+from custom_components.household_chores.board import BoardOperationError, HouseholdBoardStore, serialize_board
+from custom_components.household_chores import services
+from custom_components.household_chores.const import DOMAIN
+from custom_components.household_chores.services import async_register
+
+
+async def _async_setup_store(hass: HomeAssistant) -> HouseholdBoardStore:
+    store = HouseholdBoardStore(hass, "test", ["Ann", "Bo"], ["Dishes", "Laundry"])
+    await store.async_load()
+    hass.data.setdefault(DOMAIN, {}).setdefault("boards", {})["test"] = store
+    await async_register(hass)
+    return store
+
+
+async def test_save_board_returns_plain_board(hass: HomeAssistant) -> None:
+    """save_board answers with a serialized copy, not the store's live records."""
+    store = await _async_setup_store(hass)
+    board = serialize_board(await store.async_load())
+    board["tasks"][0]["title"] = "Dishes and pans"
+
+    response = await hass.services.async_call(
+        DOMAIN, "save_board", {"entry_id": "test", "board": board}, blocking=True, return_response=True
+    )
+
+    assert response["ok"] is True
+    assert all(isinstance(task, dict) for task in response["board"]["tasks"])
+    assert "Dishes and pans" in json.dumps(response["board"])
+    response["board"]["tasks"][0]["title"] = "Changed by caller"
+    assert all(task.title != "Changed by caller" for task in (await store.async_load())["tasks"])
+
+
+async def test_create_task_reports_board_errors(hass: HomeAssistant, monkeypatch) -> None:
+    """A rejected single-task mutation answers with its error code instead of raising."""
+    store = await _async_setup_store(hass)
+    revision = store.revision
+
+    def _reject(task):
+        raise BoardOperationError("task_exists", f"Task {task['id']} already exists")
+
+    monkeypatch.setattr(store, "_apply_add_task", _reject)
+    response = await hass.services.async_call(
+        DOMAIN, "create_task", {"entry_id": "test", "title": "Bins"}, blocking=True, return_response=True
+    )
+
+    assert response["ok"] is False
+    assert response["error"] == "task_exists"
+    assert "already exists" in response["message"]
+    assert store.revision == revision
+
+
+async def test_update_task_only_acts_on_near_exact_titles(hass: HomeAssistant) -> None:
+    """A loose title comes back ranked as task_ambiguous; an exact title updates its task."""
+    store = await _async_setup_store(hass)
+    await hass.services.async_call(
+        DOMAIN, "create_task", {"entry_id": "test", "title": "Do the dishes"}, blocking=True, return_response=True
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "update_task",
+        {"entry_id": "test", "title": "do dishes", "new_title": "Dry the dishes"},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["ok"] is False
+    assert response["error"] == "task_ambiguous"
+    assert {match["title"] for match in response["matches"]} == {"Dishes", "Do the dishes"}
+    scores = [match["score"] for match in response["matches"]]
+    assert scores == sorted(scores, reverse=True) and scores[0] < 0.9
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "update_task",
+        {"entry_id": "test", "title": "do the DISHES", "new_title": "Dry the dishes"},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["ok"] is True
+    assert response["task"]["title"] == "Dry the dishes"
+    assert {task.title for task in (await store.async_load())["tasks"]} >= {"Dishes", "Dry the dishes"}
+
+    response = await hass.services.async_call(
+        DOMAIN, "list_tasks", {"entry_id": "test", "title": "dishes"}, blocking=True, return_response=True
+    )
+    assert {task["title"] for task in response["tasks"]} == {"Dishes", "Dry the dishes"}
+
+
+async def test_list_tasks_filters_by_known_assignee_names(hass: HomeAssistant) -> None:
+    """Unknown names are reported while the known ones still filter the results."""
+    store = await _async_setup_store(hass)
+    ann = {task.id for task in (await store.async_load())["tasks"] if "person_0" in task.assignees}
+
+    response = await hass.services.async_call(
+        DOMAIN, "list_tasks", {"entry_id": "test", "assignee_names": ["ann", "Zed"]}, blocking=True, return_response=True
+    )
+    assert {task["id"] for task in response["tasks"]} == ann
+    assert response["unknown_assignee_names"] == ["Zed"]
+
+    response = await hass.services.async_call(
+        DOMAIN, "list_tasks", {"entry_id": "test", "assignee_names": ["Zed"]}, blocking=True, return_response=True
+    )
+    assert response["tasks"] == []
+
+
+async def test_list_tasks_loads_stored_weeks_or_reports_partial(hass: HomeAssistant, monkeypatch) -> None:
+    """Open-ended queries load stored weeks; oversize ranges are rejected instead of half searched."""
+    store = await _async_setup_store(hass)
+    later = dt_util.as_local(dt_util.utcnow()).date() + timedelta(weeks=6)
+    await hass.services.async_call(
+        DOMAIN, "create_task", {"entry_id": "test", "title": "Gutters", "date": later.isoformat()}, blocking=True, return_response=True
+    )
+    await store.async_flush()
+    store = await _async_setup_store(hass)
+    assert len(store.loaded_weeks) == 3
+
+    response = await hass.services.async_call(
+        DOMAIN, "list_tasks", {"entry_id": "test", "title": "gutters"}, blocking=True, return_response=True
+    )
+    assert [task["date"] for task in response["tasks"]] == [later.isoformat()]
+    assert response["partial"] is False
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "list_tasks",
+        {"entry_id": "test", "date_from": later.isoformat(), "date_to": (later + timedelta(weeks=80)).isoformat()},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["ok"] is False
+    assert response["error"] == "range_too_large"
+
+    store = await _async_setup_store(hass)
+    monkeypatch.setattr(services, "MAX_QUERY_WEEKS", 1)
+    response = await hass.services.async_call(
+        DOMAIN, "list_tasks", {"entry_id": "test", "title": "gutters"}, blocking=True, return_response=True
+    )
+    assert response["tasks"] == []
+    assert response["partial"] is True
+    assert response["searched_from"] == store.loaded_weeks[0]
+
+
+async def test_bulk_services_report_each_item(hass: HomeAssistant) -> None:
+    """Valid items of a bulk call land in one revision; invalid ones are reported by index."""
+    store = await _async_setup_store(hass)
+    revision = store.revision
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "create_tasks",
+        {"entry_id": "test", "tasks": [{"title": "Mop"}, {"title": ""}, {"title": "Dust", "slot": "noon"}, {"title": "Hoover"}]},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert (response["succeeded"], response["failed"]) == (2, 2)
+    assert [(item["index"], item["ok"]) for item in response["results"]] == [(0, True), (1, False), (2, False), (3, True)]
+    assert response["results"][1]["error"].startswith("invalid_item")
+    assert store.revision == revision + 1
+    titles = {task.title for task in (await store.async_load())["tasks"]}
+    assert {"Mop", "Hoover"} <= titles and "Dust" not in titles
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "delete_tasks",
+        {"entry_id": "test", "tasks": [{"title": "Mop"}, {"task_id": "task_missing"}]},
+        blocking=True,
+        return_response=True,
+    )
+    assert [item.get("error") for item in response["results"]] == [None, "task_not_found"]
+    assert store.revision == revision + 2
+
+
+async def test_bulk_services_reject_more_than_max_items(hass: HomeAssistant) -> None:
+    """A bulk call over MAX_BULK_TASKS is refused before anything is queued."""
+    store = await _async_setup_store(hass)
+    revision = store.revision
+
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            "create_tasks",
+            {"entry_id": "test", "tasks": [{"title": f"Task {index}"} for index in range(services.MAX_BULK_TASKS + 1)]},
+            blocking=True,
+            return_response=True,
+        )
+    assert store.revision == revision
+
+
+async def test_list_tasks_cursor_pages_across_an_insert(hass: HomeAssistant) -> None:
+    """Keyset cursors neither repeat nor skip tasks when one is inserted between pages."""
+    await _async_setup_store(hass)
+    today = dt_util.as_local(dt_util.utcnow()).date()
+    monday = today - timedelta(days=today.weekday())
+
+    async def _create(title: str, offset: int) -> None:
+        await hass.services.async_call(
+            DOMAIN,
+            "create_task",
+            {"entry_id": "test", "title": title, "date": (monday + timedelta(days=offset)).isoformat()},
+            blocking=True,
+            return_response=True,
+        )
+
+    async def _page(**data):
+        return await hass.services.async_call(
+            DOMAIN, "list_tasks", {"entry_id": "test", "week_offset": 0, "limit": 2, **data}, blocking=True, return_response=True
+        )
+
+    for title, offset in (("Bins", 2), ("Windows", 3), ("Fridge", 4)):
+        await _create(title, offset)
+    first = await _page()
+    assert [task["title"] for task in first["tasks"]] == ["Dishes", "Laundry"]
+
+    await _create("Sheets", 5)
+    await _create("Plants", 0)
+    titles = []
+    cursor = first["next_cursor"]
+    while cursor is not None:
+        page = await _page(cursor=cursor)
+        titles.extend(task["title"] for task in page["tasks"])
+        cursor = page["next_cursor"]
+    assert titles == ["Bins", "Windows", "Fridge", "Sheets"]
+
+    changed = await _page(cursor=first["next_cursor"], title="bins")
+    assert changed["ok"] is False
+    assert changed["error"] == "invalid_cursor"